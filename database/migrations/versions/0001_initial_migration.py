@@ -59,8 +59,9 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
     )
 
-    # Create indexes for worker_apps
-    op.create_index("ix_worker_apps_id", "worker_apps", ["id"], unique=False)
+    # Create indexes for worker_apps; the tables are new and empty, so plain
+    # CREATE INDEX is cheaper than CONCURRENTLY, and the primary key already
+    # indexes id
     op.create_index("ix_worker_apps_owner_id", "worker_apps", ["owner_id"], unique=True)
 
     # Create webhook_logs table
@@ -125,22 +126,17 @@ def upgrade() -> None:
     )
 
     # Create indexes for webhook_logs
-    op.create_index("ix_webhook_logs_id", "webhook_logs", ["id"], unique=False)
     op.create_index(
         "ix_webhook_logs_webhook_id", "webhook_logs", ["webhook_id"], unique=True
     )
-    op.create_index(
-        "ix_webhook_logs_owner_id", "webhook_logs", ["owner_id"], unique=False
-    )
-    op.create_index(
-        "ix_webhook_logs_worker_app_id", "webhook_logs", ["worker_app_id"], unique=False
-    )
     op.create_index(
         "ix_webhook_logs_status", "webhook_logs", ["status"], unique=False
     )
     op.create_index(
         "ix_webhook_logs_created_at", "webhook_logs", ["created_at"], unique=False
     )
+    # owner_id and worker_app_id lookups use the leading column of these
+    # composites, so they get no single-column indexes of their own
     op.create_index(
         "idx_webhook_logs_owner_status",
         "webhook_logs",
@@ -157,18 +153,6 @@ def upgrade() -> None:
 
 def downgrade() -> None:
     """Downgrade database schema."""
-    # Drop webhook_logs table
-    op.drop_index("idx_webhook_logs_worker_app_status", table_name="webhook_logs")
-    op.drop_index("idx_webhook_logs_owner_status", table_name="webhook_logs")
-    op.drop_index("ix_webhook_logs_created_at", table_name="webhook_logs")
-    op.drop_index("ix_webhook_logs_status", table_name="webhook_logs")
-    op.drop_index("ix_webhook_logs_worker_app_id", table_name="webhook_logs")
-    op.drop_index("ix_webhook_logs_owner_id", table_name="webhook_logs")
-    op.drop_index("ix_webhook_logs_webhook_id", table_name="webhook_logs")
-    op.drop_index("ix_webhook_logs_id", table_name="webhook_logs")
+    # Dropping a table drops its indexes with it
     op.drop_table("webhook_logs")
-
-    # Drop worker_apps table
-    op.drop_index("ix_worker_apps_owner_id", table_name="worker_apps")
-    op.drop_index("ix_worker_apps_id", table_name="worker_apps")
     op.drop_table("worker_apps")
@@ -7,6 +7,7 @@ Create Date: 2025-10-29 11:56:40.202938
 """
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 # revision identifiers, used by Alembic.
 revision = '3ac0466ac234'
@@ -28,12 +29,13 @@ def upgrade() -> None:
         sa.Column("text", sa.Text(), nullable=False, comment="Comment text content"),
         sa.Column("parent_id", sa.String(length=100), nullable=True, comment="Parent comment ID for replies"),
         sa.Column("timestamp", sa.Integer(), nullable=False, comment="Unix timestamp from webhook entry"),
-        sa.Column("raw_webhook_data", sa.JSON(), nullable=False, comment="Raw webhook payload for audit"),
+        sa.Column("raw_webhook_data", postgresql.JSONB(), nullable=False, comment="Raw webhook payload for audit"),
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
         sa.PrimaryKeyConstraint("comment_id"),
     )
 
-    # Create indexes for instagram_comments
+    # Create indexes for instagram_comments; the table was just created and is
+    # empty, so plain CREATE INDEX is cheaper than CONCURRENTLY here
     op.create_index("ix_instagram_comments_comment_id", "instagram_comments", ["comment_id"], unique=False)
     op.create_index("ix_instagram_comments_media_id", "instagram_comments", ["media_id"], unique=False)
     op.create_index("ix_instagram_comments_owner_id", "instagram_comments", ["owner_id"], unique=False)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy import inspect
 from sqlalchemy.engine.reflection import Inspector
 
 # revision identifiers, used by Alembic.
@@ -23,8 +24,7 @@ def _drop_comment_fk_to_media(inspector: Inspector) -> None:
 
 
 def upgrade() -> None:
-    bind = op.get_bind()
-    inspector = Inspector.from_engine(bind)
+    inspector = inspect(op.get_bind())
 
     existing_tables = inspector.get_table_names()
     if "instagram_comments" in existing_tables:
@@ -70,8 +70,7 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
-    bind = op.get_bind()
-    inspector = Inspector.from_engine(bind)
+    inspector = inspect(op.get_bind())
 
     existing_tables = inspector.get_table_names()
 
@@ -123,7 +122,7 @@ def downgrade() -> None:
             unique=False,
         )
 
-    if "instagram_comments" in inspector.get_table_names():
+    if "instagram_comments" in existing_tables:
         indexes = {idx["name"] for idx in inspector.get_indexes("instagram_comments")}
         if "ix_instagram_comments_owner_id" in indexes:
             op.drop_index("ix_instagram_comments_owner_id", table_name="instagram_comments")
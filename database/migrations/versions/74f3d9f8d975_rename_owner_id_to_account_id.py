@@ -13,47 +13,49 @@ branch_labels = None
 depends_on = None
 
 
-def _rename_index(old_name: str, new_name: str, table: str) -> None:
-    bind = op.get_bind()
-    inspector = inspect(bind)
-    existing_indexes = {idx["name"] for idx in inspector.get_indexes(table)}
+def _rename_index(old_name: str, new_name: str, existing_indexes: set[str]) -> None:
     if old_name in existing_indexes:
         op.execute(sa.text(f'ALTER INDEX "{old_name}" RENAME TO "{new_name}"'))
 
 
 def upgrade() -> None:
-    bind = op.get_bind()
-    inspector = inspect(bind)
+    # One inspector for the whole migration; each table is reflected once
+    inspector = inspect(op.get_bind())
     tables = inspector.get_table_names()
 
     if "worker_apps" in tables:
         columns = {col["name"] for col in inspector.get_columns("worker_apps")}
+        indexes = {idx["name"] for idx in inspector.get_indexes("worker_apps")}
         if "owner_id" in columns:
             op.alter_column("worker_apps", "owner_id", new_column_name="account_id")
-        _rename_index("ix_worker_apps_owner_id", "ix_worker_apps_account_id", "worker_apps")
+        _rename_index("ix_worker_apps_owner_id", "ix_worker_apps_account_id", indexes)
 
     if "webhook_logs" in tables:
         columns = {col["name"] for col in inspector.get_columns("webhook_logs")}
+        indexes = {idx["name"] for idx in inspector.get_indexes("webhook_logs")}
         if "owner_id" in columns:
             op.alter_column("webhook_logs", "owner_id", new_column_name="account_id")
-        _rename_index("ix_webhook_logs_owner_id", "ix_webhook_logs_account_id", "webhook_logs")
-        _rename_index("idx_webhook_logs_owner_status", "idx_webhook_logs_account_status", "webhook_logs")
+        # Databases created before the initial migration stopped building it
+        # still carry this index; the composite's leading column covers it
+        op.drop_index("ix_webhook_logs_owner_id", table_name="webhook_logs", if_exists=True)
+        _rename_index("idx_webhook_logs_owner_status", "idx_webhook_logs_account_status", indexes)
 
 
 def downgrade() -> None:
-    bind = op.get_bind()
-    inspector = inspect(bind)
+    inspector = inspect(op.get_bind())
     tables = inspector.get_table_names()
 
     if "worker_apps" in tables:
         columns = {col["name"] for col in inspector.get_columns("worker_apps")}
+        indexes = {idx["name"] for idx in inspector.get_indexes("worker_apps")}
         if "account_id" in columns:
             op.alter_column("worker_apps", "account_id", new_column_name="owner_id")
-        _rename_index("ix_worker_apps_account_id", "ix_worker_apps_owner_id", "worker_apps")
+        _rename_index("ix_worker_apps_account_id", "ix_worker_apps_owner_id", indexes)
 
     if "webhook_logs" in tables:
         columns = {col["name"] for col in inspector.get_columns("webhook_logs")}
+        indexes = {idx["name"] for idx in inspector.get_indexes("webhook_logs")}
         if "account_id" in columns:
             op.alter_column("webhook_logs", "account_id", new_column_name="owner_id")
-        _rename_index("ix_webhook_logs_account_id", "ix_webhook_logs_owner_id", "webhook_logs")
-        _rename_index("idx_webhook_logs_account_status", "idx_webhook_logs_owner_status", "webhook_logs")
+        _rename_index("ix_webhook_logs_account_id", "ix_webhook_logs_owner_id", indexes)
+        _rename_index("idx_webhook_logs_account_status", "idx_webhook_logs_owner_status", indexes)
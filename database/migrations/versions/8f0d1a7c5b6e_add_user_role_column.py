@@ -17,17 +17,18 @@ depends_on = None
 
 
 def upgrade() -> None:
+    # A constant default fills existing rows as the column is added (without
+    # rewriting the table on PostgreSQL 11+), so no backfill UPDATE or
+    # separate NOT NULL pass is needed
     op.add_column(
         "users",
         sa.Column(
             "role",
             sa.String(length=50),
-            nullable=True,
+            nullable=False,
             server_default="basic",
         ),
     )
-    op.execute("UPDATE users SET role = 'basic' WHERE role IS NULL")
-    op.alter_column("users", "role", nullable=False, server_default="basic")
 
 
 def downgrade() -> None:
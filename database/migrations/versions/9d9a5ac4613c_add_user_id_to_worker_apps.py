@@ -23,15 +23,6 @@ def upgrade() -> None:
             comment="Associated application user",
         ),
     )
-    op.create_index("ix_worker_apps_user_id", "worker_apps", ["user_id"], unique=False)
-    op.create_foreign_key(
-        "fk_worker_apps_user_id",
-        "worker_apps",
-        "users",
-        ["user_id"],
-        ["id"],
-        ondelete="SET NULL",
-    )
 
     worker_apps = sa.table(
         "worker_apps",
@@ -44,17 +35,35 @@ def upgrade() -> None:
         sa.column("email", sa.String(length=255)),
     )
 
-    update_stmt = (
+    # UPDATE ... FROM users joins once (through the unique ix_users_email)
+    # instead of a correlated subquery plus EXISTS per worker_apps row. The
+    # backfill runs before the index and foreign key exist, so they are built
+    # and validated once over the final rows rather than per updated row.
+    op.execute(
         worker_apps.update()
-        .values(
-            user_id=sa.select(users.c.id)
-            .where(users.c.email == worker_apps.c.account_id)
-            .scalar_subquery()
-        )
-        .where(sa.exists(sa.select(1).where(users.c.email == worker_apps.c.account_id)))
+        .values(user_id=users.c.id)
+        .where(users.c.email == worker_apps.c.account_id)
     )
 
-    op.execute(update_stmt)
+    # worker_apps already holds rows and serves routing; build without
+    # blocking writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_worker_apps_user_id",
+            "worker_apps",
+            ["user_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+    op.create_foreign_key(
+        "fk_worker_apps_user_id",
+        "worker_apps",
+        "users",
+        ["user_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
 
 
 def downgrade() -> None:
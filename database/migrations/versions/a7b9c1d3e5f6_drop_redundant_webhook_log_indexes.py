@@ -0,0 +1,52 @@
+"""Drop webhook_logs indexes made redundant by the composite and partial ones.
+
+Revision ID: a7b9c1d3e5f6
+Revises: e5f7a9b1c3d4
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a7b9c1d3e5f6"
+down_revision = "e5f7a9b1c3d4"
+branch_labels = None
+depends_on = None
+
+# name -> columns, as created by the initial migration
+REDUNDANT_INDEXES = {
+    # Leading column of idx_webhook_logs_worker_app_status
+    "ix_webhook_logs_worker_app_id": ["worker_app_id"],
+    # Failed rows are served by idx_webhook_logs_failed_created_at; the other
+    # statuses cover most of the table and are never worth an index scan
+    "ix_webhook_logs_status": ["status"],
+    # Per-account reads go through idx_webhook_logs_account_created
+    "idx_webhook_logs_account_status": ["account_id", "status"],
+}
+
+
+def upgrade() -> None:
+    # Drop without blocking writes to the log table
+    with op.get_context().autocommit_block():
+        for name in REDUNDANT_INDEXES:
+            op.drop_index(
+                name,
+                table_name="webhook_logs",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in REDUNDANT_INDEXES.items():
+            op.create_index(
+                name,
+                "webhook_logs",
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
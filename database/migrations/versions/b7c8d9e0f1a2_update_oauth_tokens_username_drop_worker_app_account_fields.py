@@ -18,12 +18,6 @@ branch_labels = None
 depends_on = None
 
 
-def _index_exists(table: str, name: str) -> bool:
-    inspector = inspect(op.get_bind())
-    indexes = inspector.get_indexes(table)
-    return any(idx.get("name") == name for idx in indexes)
-
-
 def upgrade() -> None:
     inspector = inspect(op.get_bind())
     tables = inspector.get_table_names()
@@ -44,7 +38,8 @@ def upgrade() -> None:
     if "worker_apps" in tables:
         columns = {col["name"] for col in inspector.get_columns("worker_apps")}
         if "account_id" in columns:
-            if _index_exists("worker_apps", "ix_worker_apps_account_id"):
+            indexes = {idx["name"] for idx in inspector.get_indexes("worker_apps")}
+            if "ix_worker_apps_account_id" in indexes:
                 op.drop_index("ix_worker_apps_account_id", table_name="worker_apps")
             op.drop_column("worker_apps", "account_id")
         if "owner_instagram_username" in columns:
@@ -0,0 +1,54 @@
+"""Replace the webhook_logs (worker_app_id, status) index with a newest-first one.
+
+Revision ID: b8d0f2a4c6e8
+Revises: a7b9c1d3e5f6
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "b8d0f2a4c6e8"
+down_revision = "a7b9c1d3e5f6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Build without blocking writes to the log table
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_webhook_logs_worker_app_created",
+            "webhook_logs",
+            ["worker_app_id", sa.text("created_at DESC"), sa.text("id DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "idx_webhook_logs_worker_app_status",
+            table_name="webhook_logs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_webhook_logs_worker_app_status",
+            "webhook_logs",
+            ["worker_app_id", "status"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "idx_webhook_logs_worker_app_created",
+            table_name="webhook_logs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
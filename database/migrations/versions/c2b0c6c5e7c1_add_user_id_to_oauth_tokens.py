@@ -19,22 +19,20 @@ branch_labels = None
 depends_on = None
 
 
-def _unique_exists(table: str, name: str) -> bool:
-    inspector = inspect(op.get_bind())
-    uniques = inspector.get_unique_constraints(table)
-    return any(u.get("name") == name for u in uniques)
-
+def _names(items: list[dict]) -> set[str]:
+    return {item["name"] for item in items if item.get("name")}
 
-def _index_exists(table: str, name: str) -> bool:
-    inspector = inspect(op.get_bind())
-    indexes = inspector.get_indexes(table)
-    return any(idx.get("name") == name for idx in indexes)
 
-
-def _fk_exists(table: str, name: str) -> bool:
-    inspector = inspect(op.get_bind())
-    fks = inspector.get_foreign_keys(table)
-    return any(fk.get("name") == name for fk in fks)
+def _create_index_concurrently(name: str, columns: list[str]) -> None:
+    # The table already exists and may be in use; build without blocking writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            name,
+            "oauth_tokens",
+            columns,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
 
 
 def upgrade() -> None:
@@ -43,7 +41,7 @@ def upgrade() -> None:
     if "oauth_tokens" not in tables:
         op.create_table(
             "oauth_tokens",
-            sa.Column("id", sa.String(length=36), primary_key=True),
+            sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
             sa.Column("provider", sa.String(length=50), nullable=False),
             sa.Column("account_id", sa.String(length=255), nullable=False),
             sa.Column("encrypted_access_token", sa.String(length=2048), nullable=False),
@@ -81,15 +79,20 @@ def upgrade() -> None:
         op.create_index("ix_oauth_tokens_user_id", "oauth_tokens", ["user_id"])
         return
 
+    # Reflect the table once; every check below reads these sets instead of
+    # re-running the catalog queries through a new inspector
     columns = {col["name"] for col in inspector.get_columns("oauth_tokens")}
+    indexes = _names(inspector.get_indexes("oauth_tokens"))
+    foreign_keys = _names(inspector.get_foreign_keys("oauth_tokens"))
+    uniques = _names(inspector.get_unique_constraints("oauth_tokens"))
     if "user_id" not in columns:
         op.add_column(
             "oauth_tokens",
             sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=True),
         )
-    if not _index_exists("oauth_tokens", "ix_oauth_tokens_user_id"):
-        op.create_index("ix_oauth_tokens_user_id", "oauth_tokens", ["user_id"])
-    if not _fk_exists("oauth_tokens", "fk_oauth_tokens_user_id_users"):
+    if "ix_oauth_tokens_user_id" not in indexes:
+        _create_index_concurrently("ix_oauth_tokens_user_id", ["user_id"])
+    if "fk_oauth_tokens_user_id_users" not in foreign_keys:
         op.create_foreign_key(
             "fk_oauth_tokens_user_id_users",
             "oauth_tokens",
@@ -99,14 +102,14 @@ def upgrade() -> None:
             ondelete="CASCADE",
         )
 
-    if not _index_exists("oauth_tokens", "ix_oauth_tokens_provider"):
-        op.create_index("ix_oauth_tokens_provider", "oauth_tokens", ["provider"])
-    if not _index_exists("oauth_tokens", "ix_oauth_tokens_account_id"):
-        op.create_index("ix_oauth_tokens_account_id", "oauth_tokens", ["account_id"])
+    if "ix_oauth_tokens_provider" not in indexes:
+        _create_index_concurrently("ix_oauth_tokens_provider", ["provider"])
+    if "ix_oauth_tokens_account_id" not in indexes:
+        _create_index_concurrently("ix_oauth_tokens_account_id", ["account_id"])
 
-    if _unique_exists("oauth_tokens", "uq_oauth_provider_account"):
+    if "uq_oauth_provider_account" in uniques:
         op.drop_constraint("uq_oauth_provider_account", "oauth_tokens", type_="unique")
-    if not _unique_exists("oauth_tokens", "uq_oauth_provider_account_user"):
+    if "uq_oauth_provider_account_user" not in uniques:
         op.create_unique_constraint(
             "uq_oauth_provider_account_user",
             "oauth_tokens",
@@ -115,7 +118,8 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
-    if _unique_exists("oauth_tokens", "uq_oauth_provider_account_user"):
+    uniques = _names(inspect(op.get_bind()).get_unique_constraints("oauth_tokens"))
+    if "uq_oauth_provider_account_user" in uniques:
         op.drop_constraint(
             "uq_oauth_provider_account_user", "oauth_tokens", type_="unique"
         )
@@ -0,0 +1,51 @@
+"""Drop indexes duplicated by the instagram_comments and oauth_tokens keys.
+
+Revision ID: c9e1a3b5d7f9
+Revises: b8d0f2a4c6e8
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c9e1a3b5d7f9"
+down_revision = "b8d0f2a4c6e8"
+branch_labels = None
+depends_on = None
+
+# (table, name) -> columns, as created by earlier migrations
+REDUNDANT_INDEXES = {
+    # comment_id is the primary key, which already maintains a unique index;
+    # this copy was written on every stored comment
+    ("instagram_comments", "ix_instagram_comments_comment_id"): ["comment_id"],
+    # Leading column of uq_oauth_provider_account_user, and only a handful of
+    # distinct values
+    ("oauth_tokens", "ix_oauth_tokens_provider"): ["provider"],
+}
+
+
+def upgrade() -> None:
+    # Drop without blocking writes to the tables
+    with op.get_context().autocommit_block():
+        for table, name in REDUNDANT_INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for (table, name), columns in REDUNDANT_INDEXES.items():
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
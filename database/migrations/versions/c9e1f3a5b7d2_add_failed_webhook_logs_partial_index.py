@@ -0,0 +1,41 @@
+"""Add partial index for failed webhook logs ordered by creation time.
+
+Revision ID: c9e1f3a5b7d2
+Revises: b7c8d9e0f1a2
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "c9e1f3a5b7d2"
+down_revision = "b7c8d9e0f1a2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Build without blocking writes to the log table
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_webhook_logs_failed_created_at",
+            "webhook_logs",
+            [sa.text("created_at DESC")],
+            unique=False,
+            postgresql_where=sa.text("status = 'failed'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_webhook_logs_failed_created_at",
+            table_name="webhook_logs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,52 @@
+"""Store oauth_tokens.id as a native uuid instead of 36-character text.
+
+Revision ID: d0f2b4c6e8a1
+Revises: c9e1a3b5d7f9
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "d0f2b4c6e8a1"
+down_revision = "c9e1a3b5d7f9"
+branch_labels = None
+depends_on = None
+
+
+def _id_is_uuid() -> bool:
+    columns = inspect(op.get_bind()).get_columns("oauth_tokens")
+    id_column = next(col for col in columns if col["name"] == "id")
+    return isinstance(id_column["type"], sa.Uuid)
+
+
+def upgrade() -> None:
+    # 16 bytes per key instead of 37, in the heap and in the primary key
+    # index; nothing references oauth_tokens.id, so only the column changes.
+    # Installs created after c2b0c6c5e7c1 was updated already use uuid.
+    if _id_is_uuid():
+        return
+    op.alter_column(
+        "oauth_tokens",
+        "id",
+        existing_type=sa.String(length=36),
+        type_=postgresql.UUID(as_uuid=True),
+        postgresql_using="id::uuid",
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "oauth_tokens",
+        "id",
+        existing_type=postgresql.UUID(as_uuid=True),
+        type_=sa.String(length=36),
+        postgresql_using="id::text",
+        existing_nullable=False,
+    )
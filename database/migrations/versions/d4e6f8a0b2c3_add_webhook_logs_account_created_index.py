@@ -0,0 +1,54 @@
+"""Replace the webhook_logs account_id index with (account_id, created_at DESC).
+
+Revision ID: d4e6f8a0b2c3
+Revises: c9e1f3a5b7d2
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "d4e6f8a0b2c3"
+down_revision = "c9e1f3a5b7d2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Build without blocking writes to the log table
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_webhook_logs_account_created",
+            "webhook_logs",
+            ["account_id", sa.text("created_at DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_webhook_logs_account_id",
+            table_name="webhook_logs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_webhook_logs_account_id",
+            "webhook_logs",
+            ["account_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "idx_webhook_logs_account_created",
+            table_name="webhook_logs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
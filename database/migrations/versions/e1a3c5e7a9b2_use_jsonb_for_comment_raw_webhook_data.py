@@ -0,0 +1,50 @@
+"""Store instagram_comments.raw_webhook_data as jsonb instead of json.
+
+Revision ID: e1a3c5e7a9b2
+Revises: d0f2b4c6e8a1
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "e1a3c5e7a9b2"
+down_revision = "d0f2b4c6e8a1"
+branch_labels = None
+depends_on = None
+
+
+def _column_type(name: str):
+    columns = inspect(op.get_bind()).get_columns("instagram_comments")
+    return next(col["type"] for col in columns if col["name"] == name)
+
+
+def upgrade() -> None:
+    # jsonb is stored parsed, so reads skip the text -> tree step; installs
+    # created after 3ac0466ac234 was updated already have it
+    if isinstance(_column_type("raw_webhook_data"), postgresql.JSONB):
+        return
+    op.alter_column(
+        "instagram_comments",
+        "raw_webhook_data",
+        existing_type=sa.JSON(),
+        type_=postgresql.JSONB(),
+        postgresql_using="raw_webhook_data::jsonb",
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "instagram_comments",
+        "raw_webhook_data",
+        existing_type=postgresql.JSONB(),
+        type_=sa.JSON(),
+        postgresql_using="raw_webhook_data::json",
+        existing_nullable=False,
+    )
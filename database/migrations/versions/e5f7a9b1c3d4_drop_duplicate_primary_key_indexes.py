@@ -0,0 +1,49 @@
+"""Drop indexes duplicating the worker_apps and webhook_logs primary keys.
+
+Revision ID: e5f7a9b1c3d4
+Revises: d4e6f8a0b2c3
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e5f7a9b1c3d4"
+down_revision = "d4e6f8a0b2c3"
+branch_labels = None
+depends_on = None
+
+
+# name -> table, as created by the initial migration
+DUPLICATE_INDEXES = {
+    "ix_webhook_logs_id": "webhook_logs",
+    "ix_worker_apps_id": "worker_apps",
+}
+
+
+def upgrade() -> None:
+    # The primary key constraint already maintains a unique index on id; drop
+    # without blocking writes to the tables
+    with op.get_context().autocommit_block():
+        for name, table in DUPLICATE_INDEXES.items():
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table in DUPLICATE_INDEXES.items():
+            op.create_index(
+                name,
+                table,
+                ["id"],
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
@@ -247,8 +247,8 @@ async def callback(
     # Fetch channel id
     async with httpx.AsyncClient(timeout=20.0) as client:
         channels_resp = await client.get(
-            "https://www.googleapis.com/youtube/v3/channels",
-            params={"part": "id", "mine": "true"},
+            YouTubeService.CHANNELS_URL,
+            params=YouTubeService.CHANNEL_ID_PARAMS,
             headers={"Authorization": f"Bearer {access_token}"},
         )
         if channels_resp.status_code != 200:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import json
 import hashlib
@@ -23,6 +24,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.core.config import Settings, get_settings
 from src.core.dependencies import (
     get_current_active_user,
+    get_http_client,
     get_oauth_token_service,
     get_session,
     get_user_repository,
@@ -149,7 +151,8 @@ def _parse_scopes(raw: str | None) -> list[str]:
         "business_manage_messages": "instagram_business_manage_messages",
         "business_manage_comments": "instagram_business_manage_comments",
     }
-    parts = [part.strip() for part in raw.replace(",", " ").split() if part.strip()]
+    # split() already drops surrounding whitespace and empty parts
+    parts = raw.replace(",", " ").split()
     if not parts:
         return [
             "instagram_business_basic",
@@ -157,7 +160,8 @@ def _parse_scopes(raw: str | None) -> list[str]:
             "instagram_business_manage_messages",
             "instagram_business_manage_comments",
         ]
-    normalized: list[str] = []
+    # Map legacy names and drop repeats in the same pass, keeping first-seen order
+    deduped: dict[str, None] = {}
     for part in parts:
         mapped = legacy_map.get(part, part)
         if mapped != part:
@@ -166,29 +170,18 @@ def _parse_scopes(raw: str | None) -> list[str]:
                 part,
                 mapped,
             )
-        normalized.append(mapped)
-    seen: set[str] = set()
-    deduped: list[str] = []
-    for scope in normalized:
-        if scope not in seen:
-            seen.add(scope)
-            deduped.append(scope)
-    return deduped
+        deduped[mapped] = None
+    return list(deduped)
 
 
 def _parse_subscribed_fields(raw: str | None) -> str:
     if not raw:
         return "comments"
-    parts = [part.strip() for part in raw.replace(",", " ").split() if part.strip()]
+    parts = raw.replace(",", " ").split()
     if not parts:
         return "comments"
-    seen: set[str] = set()
-    deduped: list[str] = []
-    for field in parts:
-        if field not in seen:
-            seen.add(field)
-            deduped.append(field)
-    return ",".join(deduped)
+    # dict keys drop repeats while keeping first-seen order
+    return ",".join(dict.fromkeys(parts))
 
 
 def _base64_url_decode(value: str) -> bytes:
@@ -240,6 +233,7 @@ async def _notify_worker(
     *,
     method: str = "post",
     timeout: float = 10.0,
+    http_client: Optional[httpx.AsyncClient] = None,
 ) -> bool:
     parsed = urlparse(base_target)
     if not parsed.scheme or not parsed.netloc:
@@ -254,13 +248,24 @@ async def _notify_worker(
             "Content-Type": "application/json",
             "Authorization": f"Bearer {internal_jwt}",
         }
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            resp = await client.request(
+        if http_client is not None:
+            # Shared pool from app startup: the connection to the worker app
+            # is usually already open from forwarding webhooks to it
+            resp = await http_client.request(
                 method.upper(),
                 worker_endpoint,
                 json=payload,
                 headers=headers,
+                timeout=timeout,
             )
+        else:
+            async with httpx.AsyncClient(timeout=timeout) as client:
+                resp = await client.request(
+                    method.upper(),
+                    worker_endpoint,
+                    json=payload,
+                    headers=headers,
+                )
         if resp.status_code < 400:
             return True
         logger.error(
@@ -315,7 +320,7 @@ def _extract_short_token_payload(payload: dict) -> tuple[Optional[str], Optional
     user_id = data.get("user_id")
     permissions = data.get("permissions") or data.get("scope")
     if isinstance(permissions, list):
-        permissions = ",".join([str(item) for item in permissions if item])
+        permissions = ",".join(str(item) for item in permissions if item)
     return access_token, user_id, permissions
 
 
@@ -417,6 +422,8 @@ async def callback(
         "code": code,
     }
 
+    # One client for the whole exchange so the Graph API connection (and its
+    # TLS session) is reused across the sequential calls below
     async with httpx.AsyncClient(timeout=20.0) as client:
         token_resp = await client.post(SHORT_TOKEN_URL, data=token_payload)
         if token_resp.status_code != 200:
@@ -431,24 +438,23 @@ async def callback(
             )
         token_data = token_resp.json()
 
-    short_token, ig_user_id, permissions = _extract_short_token_payload(token_data)
+        short_token, ig_user_id, permissions = _extract_short_token_payload(token_data)
 
-    if not short_token:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="No access token returned"
-        )
-    if not ig_user_id:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="No Instagram user id returned"
-        )
+        if not short_token:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="No access token returned"
+            )
+        if not ig_user_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="No Instagram user id returned"
+            )
 
-    exchange_params = {
-        "grant_type": "ig_exchange_token",
-        "client_secret": settings.instagram.app_secret,
-        "access_token": short_token,
-    }
+        exchange_params = {
+            "grant_type": "ig_exchange_token",
+            "client_secret": settings.instagram.app_secret,
+            "access_token": short_token,
+        }
 
-    async with httpx.AsyncClient(timeout=20.0) as client:
         exchange_resp = await client.get(LONG_TOKEN_URL, params=exchange_params)
         if exchange_resp.status_code != 200:
             logger.error(
@@ -462,25 +468,24 @@ async def callback(
             )
         exchange_data = exchange_resp.json()
 
-    long_token = exchange_data.get("access_token")
-    expires_in = exchange_data.get("expires_in")
-    token_type = exchange_data.get("token_type") or "bearer"
+        long_token = exchange_data.get("access_token")
+        expires_in = exchange_data.get("expires_in")
+        token_type = exchange_data.get("token_type") or "bearer"
 
-    if not long_token:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="No long-lived access token returned",
-        )
+        if not long_token:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No long-lived access token returned",
+            )
 
-    access_expires_at = (
-        datetime.now(timezone.utc) + timedelta(seconds=int(expires_in))
-        if expires_in
-        else None
-    )
+        access_expires_at = (
+            datetime.now(timezone.utc) + timedelta(seconds=int(expires_in))
+            if expires_in
+            else None
+        )
 
-    api_base_url = settings.instagram.api_base_url.rstrip("/")
-    me_url = f"{api_base_url}/me"
-    async with httpx.AsyncClient(timeout=20.0) as client:
+        api_base_url = settings.instagram.api_base_url.rstrip("/")
+        me_url = f"{api_base_url}/me"
         me_resp = await client.get(
             me_url,
             params={"fields": "user_id,username", "access_token": long_token},
@@ -497,25 +502,24 @@ async def callback(
             )
         me_data = me_resp.json()
 
-    account_id = me_data.get("user_id") or me_data.get("id")
-    instagram_user_id = me_data.get("id") or ig_user_id
-    username = me_data.get("username")
-    if not account_id:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Instagram account id not returned",
-        )
+        account_id = me_data.get("user_id") or me_data.get("id")
+        instagram_user_id = me_data.get("id") or ig_user_id
+        username = me_data.get("username")
+        if not account_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Instagram account id not returned",
+            )
 
-    if not permissions:
-        permissions = ",".join(_parse_scopes(scope_source))
+        if not permissions:
+            permissions = ",".join(_parse_scopes(scope_source))
 
-    subscription_success = False
-    subscribed_fields = _parse_subscribed_fields(
-        settings.instagram.webhook_subscribed_fields
-    )
-    subscribe_url = f"{api_base_url}/{account_id}/subscribed_apps"
-    try:
-        async with httpx.AsyncClient(timeout=20.0) as client:
+        subscription_success = False
+        subscribed_fields = _parse_subscribed_fields(
+            settings.instagram.webhook_subscribed_fields
+        )
+        subscribe_url = f"{api_base_url}/{account_id}/subscribed_apps"
+        try:
             subscribe_resp = await client.post(
                 subscribe_url,
                 params={
@@ -541,8 +545,8 @@ async def callback(
                     subscribe_resp.status_code,
                     subscribe_resp.text,
                 )
-    except Exception as exc:
-        logger.error("Instagram subscription request failed: %s", exc)
+        except Exception as exc:
+            logger.error("Instagram subscription request failed: %s", exc)
 
     # Encrypt tokens for worker backend
     fernet = Fernet(settings.oauth_encryption_key)
@@ -811,6 +815,7 @@ async def disconnect_account(
         WorkerAppRepository, Depends(get_worker_app_repository)
     ],
     session: Annotated[AsyncSession, Depends(get_session)],
+    http_client: Annotated[Optional[httpx.AsyncClient], Depends(get_http_client)],
     account_id: Optional[str] = None,
 ) -> dict:
     """
@@ -848,6 +853,7 @@ async def disconnect_account(
             payload,
             method="delete",
             timeout=10.0,
+            http_client=http_client,
         )
     else:
         logger.info("Worker app not configured; skipping worker token revoke.")
@@ -902,6 +908,7 @@ async def deauthorize_callback(
     worker_app_repo: Annotated[
         WorkerAppRepository, Depends(get_worker_app_repository)
     ],
+    http_client: Annotated[Optional[httpx.AsyncClient], Depends(get_http_client)],
 ) -> Response:
     """
     Meta Deauthorize Callback URL handler.
@@ -944,12 +951,9 @@ async def deauthorize_callback(
             }
         )
 
-    for user_id in tokens_by_user:
-        worker_app = await worker_app_repo.get_by_user_id(user_id)
-        if worker_app:
-            worker_targets_by_user[user_id] = (
-                worker_app.webhook_url or worker_app.base_url
-            )
+    worker_apps = await worker_app_repo.get_by_user_ids(tokens_by_user)
+    for user_id, worker_app in worker_apps.items():
+        worker_targets_by_user[user_id] = worker_app.webhook_url or worker_app.base_url
 
     if tokens:
         await session.execute(
@@ -960,18 +964,24 @@ async def deauthorize_callback(
         )
         await session.commit()
 
+        # Worker apps are notified concurrently; _notify_worker never raises
+        notifications = []
         for user_id, payloads in tokens_by_user.items():
             base_target = worker_targets_by_user.get(user_id)
             if not base_target:
                 continue
             for payload in payloads:
-                await _notify_worker(
-                    base_target,
-                    "/api/v1/oauth/tokens",
-                    payload,
-                    method="delete",
-                    timeout=10.0,
+                notifications.append(
+                    _notify_worker(
+                        base_target,
+                        "/api/v1/oauth/tokens",
+                        payload,
+                        method="delete",
+                        timeout=10.0,
+                        http_client=http_client,
+                    )
                 )
+        await asyncio.gather(*notifications)
 
     return JSONResponse({"success": True})
 
@@ -984,6 +994,7 @@ async def data_deletion_callback(
     worker_app_repo: Annotated[
         WorkerAppRepository, Depends(get_worker_app_repository)
     ],
+    http_client: Annotated[Optional[httpx.AsyncClient], Depends(get_http_client)],
 ) -> dict:
     """
     Meta Data Deletion Request handler.
@@ -1012,12 +1023,14 @@ async def data_deletion_callback(
     tokens = await token_repo.list_by_provider_instagram_user_id(
         PROVIDER, str(instagram_user_id)
     )
-    account_ids = {token.account_id for token in tokens}
-    user_ids = {token.user_id for token in tokens if token.user_id}
+    # One pass over the tokens collects every grouping used below
+    account_ids: set[str] = set()
     account_ids_by_user: dict[UUID, set[str]] = {}
     for token in tokens:
+        account_ids.add(token.account_id)
         if token.user_id:
             account_ids_by_user.setdefault(token.user_id, set()).add(token.account_id)
+    user_ids = account_ids_by_user.keys()
 
     if account_ids:
         await session.execute(
@@ -1036,16 +1049,15 @@ async def data_deletion_callback(
         )
     )
 
-    worker_targets_by_user: dict[UUID, str] = {}
-    for user_id in user_ids:
-        worker_app = await worker_app_repo.get_by_user_id(user_id)
-        if worker_app:
-            worker_targets_by_user[user_id] = (
-                worker_app.webhook_url or worker_app.base_url
-            )
+    worker_apps = await worker_app_repo.get_by_user_ids(user_ids)
+    worker_targets_by_user: dict[UUID, str] = {
+        user_id: worker_app.webhook_url or worker_app.base_url
+        for user_id, worker_app in worker_apps.items()
+    }
 
     await session.commit()
 
+    notifications = []
     for user_id, base_target in worker_targets_by_user.items():
         user_account_ids = account_ids_by_user.get(user_id, set())
         if not user_account_ids:
@@ -1055,13 +1067,17 @@ async def data_deletion_callback(
             "instagram_user_id": str(instagram_user_id),
             "account_ids": list(user_account_ids),
         }
-        await _notify_worker(
-            base_target,
-            "/api/v1/oauth/data-deletion",
-            payload,
-            method="post",
-            timeout=10.0,
+        notifications.append(
+            _notify_worker(
+                base_target,
+                "/api/v1/oauth/data-deletion",
+                payload,
+                method="post",
+                timeout=10.0,
+                http_client=http_client,
+            )
         )
+    await asyncio.gather(*notifications)
 
     confirmation_code = uuid4().hex
     status_url = str(request.url_for("instagram_data_deletion_status"))
@@ -0,0 +1,76 @@
+"""Monitoring endpoints."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from src.api_v1.schemas import MetricsResponse, WorkerAppStats
+from src.core.dependencies import (
+    get_current_admin_user,
+    get_webhook_log_repository,
+    get_worker_app_cache,
+)
+from src.core.models.db_helper import db_helper
+from src.core.models.user import User
+from src.core.repositories.webhook_log_repository import WebhookLogRepository
+from src.core.utils.time import now_utc
+from src.core.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["monitoring"])
+
+
+def _window_start(hours: Optional[int]) -> Optional[datetime]:
+    """Start of the trailing ``hours`` window, or None for all time."""
+    return now_utc() - timedelta(hours=hours) if hours else None
+
+
+@router.get("/metrics", response_model=MetricsResponse)
+async def get_metrics(
+    log_repo: Annotated[WebhookLogRepository, Depends(get_webhook_log_repository)],
+    worker_app_cache: Annotated[Optional[TTLCache], Depends(get_worker_app_cache)],
+    _admin_user: Annotated[User, Depends(get_current_admin_user)],
+    hours: Annotated[Optional[int], Query(ge=1)] = None,
+) -> MetricsResponse:
+    """
+    Report webhook forwarding counters and registered worker apps.
+
+    Webhook counters and the worker app count come from one aggregate query
+    instead of a query per counter; the request session cannot run
+    statements concurrently, so fewer statements is the only way to cut
+    round-trips here. ``hours`` limits the webhook counters to a recent
+    window, which the database answers from the created_at index.
+    """
+    stats = await log_repo.get_overview(since=_window_start(hours))
+
+    return MetricsResponse(
+        webhook_total=stats["total"],
+        webhook_success=stats["success"],
+        webhook_failed=stats["failed"],
+        avg_processing_time_ms=stats["avg_processing_time_ms"],
+        worker_apps_total=stats["worker_apps_total"],
+        worker_app_cache_hits=worker_app_cache.hits if worker_app_cache is not None else 0,
+        worker_app_cache_misses=worker_app_cache.misses if worker_app_cache is not None else 0,
+        db_pool_checked_out=db_helper.pool_checked_out(),
+    )
+
+
+@router.get("/metrics/worker-apps", response_model=list[WorkerAppStats])
+async def get_worker_app_metrics(
+    log_repo: Annotated[WebhookLogRepository, Depends(get_webhook_log_repository)],
+    _admin_user: Annotated[User, Depends(get_current_admin_user)],
+    hours: Annotated[Optional[int], Query(ge=1)] = None,
+) -> list[dict]:
+    """
+    Report webhook counters per worker app from one grouped aggregate query.
+
+    The rows are returned as plain dicts: FastAPI validates the whole list
+    once against ``response_model``, instead of each row being built into a
+    model here and then dumped and validated again.
+    """
+    return await log_repo.get_stats_by_worker_app(since=_window_start(hours))
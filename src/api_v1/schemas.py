@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Literal, Optional
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Literal, Optional
 from uuid import UUID
 
-from pydantic import AnyHttpUrl, BaseModel, ConfigDict, Field, field_validator
+from pydantic import (
+    AfterValidator,
+    AnyHttpUrl,
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    ValidationError,
+    field_validator,
+)
 
 from src.core.models.user import UserRole
 from src.core.utils.time import now_utc
@@ -15,6 +26,11 @@ from src.core.utils.time import now_utc
 # Webhook payload schemas (copied from instachatico-app)
 # =============================================================================
 
+# Inbound webhook models validate in strict mode: Instagram sends JSON-native
+# types, so the lax coercion branches (e.g. "123" -> 123) are never needed.
+# Unknown fields are still ignored so new Instagram attributes do not break us.
+WEBHOOK_MODEL_CONFIG = ConfigDict(strict=True)
+
 
 class WebhookVerification(BaseModel):
     """Webhook verification challenge from Instagram."""
@@ -27,6 +43,8 @@ class WebhookVerification(BaseModel):
 class CommentAuthor(BaseModel):
     """Instagram user who created the comment."""
 
+    model_config = WEBHOOK_MODEL_CONFIG
+
     id: str = Field(..., min_length=1, description="Instagram user ID")
     username: str = Field(..., min_length=1, max_length=30, description="Instagram username")
 
@@ -42,6 +60,8 @@ class CommentAuthor(BaseModel):
 class CommentMedia(BaseModel):
     """Instagram media (post) associated with the comment."""
 
+    model_config = WEBHOOK_MODEL_CONFIG
+
     id: str = Field(..., min_length=1, description="Instagram media ID")
     media_product_type: Optional[str] = Field(None, description="Media product type (e.g., 'FEED', 'REELS')")
 
@@ -49,7 +69,7 @@ class CommentMedia(BaseModel):
 class CommentValue(BaseModel):
     """Comment data from Instagram webhook."""
 
-    model_config = ConfigDict(populate_by_name=True, str_strip_whitespace=True)
+    model_config = ConfigDict(**WEBHOOK_MODEL_CONFIG, populate_by_name=True, str_strip_whitespace=True)
 
     from_: CommentAuthor = Field(..., alias="from", description="Comment author")
     media: CommentMedia = Field(..., description="Associated media")
@@ -77,6 +97,8 @@ class CommentValue(BaseModel):
 class CommentChange(BaseModel):
     """Change notification from Instagram webhook."""
 
+    model_config = WEBHOOK_MODEL_CONFIG
+
     field: Literal["comments"] = Field(..., description="Field that changed (must be 'comments')")
     value: CommentValue = Field(..., description="Comment data")
 
@@ -84,6 +106,8 @@ class CommentChange(BaseModel):
 class WebhookEntry(BaseModel):
     """Entry in Instagram webhook payload."""
 
+    model_config = WEBHOOK_MODEL_CONFIG
+
     id: str = Field(..., min_length=1, description="Instagram business account ID")
     time: int = Field(..., gt=0, description="Unix timestamp of the event")
     changes: List[CommentChange] = Field(..., min_length=1, description="List of changes")
@@ -92,7 +116,9 @@ class WebhookEntry(BaseModel):
     @classmethod
     def validate_timestamp(cls, v: int) -> int:
         """Ensure timestamp is reasonable (not too old, not in future)."""
-        now = int(datetime.now(timezone.utc).timestamp())
+        # Runs per entry on every webhook; time.time() is the same epoch
+        # without building an aware datetime first
+        now = int(time.time())
         if v > now + 3600:
             raise ValueError("Timestamp is too far in the future")
         if v < now - 86400 * 7:
@@ -107,7 +133,7 @@ class WebhookEntry(BaseModel):
 class WebhookPayload(BaseModel):
     """Instagram webhook payload."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(**WEBHOOK_MODEL_CONFIG, str_strip_whitespace=True)
 
     entry: List[WebhookEntry] = Field(..., min_length=1, description="List of entries")
     object: Literal["instagram"] = Field(..., description="Object type (must be 'instagram')")
@@ -145,24 +171,46 @@ class RoutingResponse(BaseModel):
 # =============================================================================
 
 
+# One adapter built at import time; validation itself is pydantic's URL parser
+_HTTP_URL_ADAPTER = TypeAdapter(AnyHttpUrl)
+
+
+@lru_cache(maxsize=1024)
+def _validate_http_url(value: str) -> str:
+    """
+    Check that ``value`` is an absolute http(s) URL and return it as a str.
+
+    Worker app URLs are a small, repeating set, so results are cached; only
+    valid URLs are cached since a rejected one raises. The URL is returned
+    as pydantic formats it, with its path left as given.
+    """
+    try:
+        return str(_HTTP_URL_ADAPTER.validate_python(value))
+    except ValidationError:
+        raise ValueError("URL must be an absolute http(s) URL") from None
+
+
+HttpUrlStr = Annotated[str, AfterValidator(_validate_http_url)]
+
+
 class WorkerAppCreate(BaseModel):
     """Worker app creation schema."""
-    base_url: AnyHttpUrl = Field(..., description="Base URL for HTTP requests")
+    base_url: HttpUrlStr = Field(..., description="Base URL for HTTP requests")
     user_id: UUID = Field(
         ..., description="Associated application user ID"
     )
-    webhook_url: AnyHttpUrl | None = Field(
+    webhook_url: HttpUrlStr | None = Field(
         None, description="Direct webhook endpoint URL for forwarding"
     )
 
 
 class WorkerAppUpdate(BaseModel):
     """Worker app update schema."""
-    base_url: Optional[AnyHttpUrl] = Field(None, description="Base URL for HTTP requests")
+    base_url: Optional[HttpUrlStr] = Field(None, description="Base URL for HTTP requests")
     user_id: UUID | None = Field(
         None, description="Associated application user ID"
     )
-    webhook_url: Optional[AnyHttpUrl] = Field(
+    webhook_url: Optional[HttpUrlStr] = Field(
         None, description="Direct webhook endpoint URL for forwarding"
     )
 
@@ -202,6 +250,19 @@ class MetricsResponse(BaseModel):
     webhook_failed: int = Field(..., description="Failed webhooks")
     avg_processing_time_ms: float = Field(..., description="Average processing time")
     worker_apps_total: int = Field(..., description="Registered worker apps")
+    worker_app_cache_hits: int = Field(0, description="In-process routing cache hits")
+    worker_app_cache_misses: int = Field(0, description="In-process routing cache misses")
+    db_pool_checked_out: int = Field(0, description="Database connections currently in use")
+
+
+class WorkerAppStats(BaseModel):
+    """Webhook counters for a single worker app."""
+
+    worker_app_id: UUID = Field(..., description="Worker app ID")
+    total: int = Field(..., description="Total webhooks forwarded")
+    success: int = Field(..., description="Successful webhooks")
+    failed: int = Field(..., description="Failed webhooks")
+    avg_processing_time_ms: float = Field(..., description="Average processing time")
 
 
 class ErrorResponse(BaseModel):
@@ -252,3 +313,24 @@ class UserResponse(UserBase):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+# Fail at import rather than on the first request if any schema was left with
+# an unresolved forward reference (annotations are strings in this module)
+for _schema in (
+    WebhookPayload,
+    RoutingResponse,
+    WorkerAppCreate,
+    WorkerAppUpdate,
+    WorkerAppResponse,
+    WorkerAppListResponse,
+    MetricsResponse,
+    WorkerAppStats,
+    ErrorResponse,
+    Token,
+    TokenData,
+    UserCreate,
+    UserResponse,
+):
+    _schema.model_rebuild()
+del _schema
@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
+import hmac
 import logging
-from typing import Annotated
+from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import PlainTextResponse
 from pydantic import ValidationError
 
 from src.api_v1.schemas import RoutingResponse, WebhookPayload, WebhookVerification
 from src.core.config import Settings, get_settings
-from src.core.dependencies import get_process_webhook_use_case
+from src.core.dependencies import get_process_webhook_use_case, get_webhook_rate_limiter
 from src.core.logging_config import trace_id_ctx
 from src.core.use_cases.process_webhook_use_case import ProcessWebhookUseCase
+from src.core.utils.rate_limit import TokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +44,10 @@ async def verify_webhook(
             detail=exc.errors(),
         ) from exc
 
-    if verification.hub_verify_token != settings.instagram.verify_token:
+    if not hmac.compare_digest(
+        verification.hub_verify_token.encode("utf-8"),
+        settings.instagram.verify_token.encode("utf-8"),
+    ):
         logger.warning("Invalid webhook verify token")
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -56,19 +62,51 @@ async def verify_webhook(
 
 @router.post("", response_model=RoutingResponse)
 async def process_webhook(
-    webhook_payload: WebhookPayload,
     request: Request,
     process_webhook_uc: Annotated[
         ProcessWebhookUseCase, Depends(get_process_webhook_use_case)
     ],
+    rate_limiter: Annotated[
+        Optional[TokenBucket], Depends(get_webhook_rate_limiter)
+    ],
 ) -> RoutingResponse:
-    """Process Instagram comment webhook notifications."""
+    """
+    Process Instagram comment webhook notifications.
+
+    The payload is not bound by FastAPI: it is decoded once, straight from the
+    body bytes the signature middleware already verified.
+    """
+    if rate_limiter is not None:
+        client_host = request.client.host if request.client else "unknown"
+        if not rate_limiter.allow(client_host):
+            logger.warning("Webhook rate limit exceeded | client=%s", client_host)
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests",
+            )
+
     trace_id = (
         getattr(request.state, "trace_id", None)
         or trace_id_ctx.get()
         or request.headers.get("X-Trace-ID")
         or "unknown"
     )
+
+    raw_payload: bytes | None = getattr(request.state, "body", None)
+    if raw_payload is None:
+        raw_payload = await request.body()
+    try:
+        webhook_payload = WebhookPayload.model_validate_json(raw_payload)
+    except ValidationError as exc:
+        logger.warning("Invalid webhook payload | trace_id=%s", trace_id)
+        # Same error shape FastAPI produces for a bound body parameter
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in exc.errors(include_url=False)
+            ]
+        ) from exc
+
     logger.info(
         "Received webhook | trace_id=%s | entries=%s",
         trace_id,
@@ -76,10 +114,7 @@ async def process_webhook(
     )
 
     payload_dict = webhook_payload.model_dump(by_alias=True)
-    original_headers = {key: value for key, value in request.headers.items()}
-    raw_payload: bytes | None = getattr(request.state, "body", None)
-    if raw_payload is None:
-        raw_payload = await request.body()
+    original_headers = dict(request.headers)
 
     try:
         result = await process_webhook_uc.execute(
@@ -1,10 +1,10 @@
 """Worker app management endpoints."""
 
 import logging
-from typing import Annotated
+from typing import Annotated, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api_v1.schemas import (
@@ -13,16 +13,32 @@ from src.api_v1.schemas import (
     WorkerAppResponse,
     WorkerAppListResponse,
 )
-from src.core.dependencies import get_current_admin_user, get_session, get_worker_app_repository
+from src.core.dependencies import (
+    get_current_admin_user,
+    get_session,
+    get_worker_app_cache,
+    get_worker_app_repository,
+)
 from src.core.models.user import User
-from src.core.models.worker_app import WorkerApp
 from src.core.repositories.worker_app_repository import WorkerAppRepository
+from src.core.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/worker-apps", tags=["worker-apps"])
 
 
+def _invalidate_routing_cache(
+    worker_app_cache: Optional[TTLCache], worker_app_id: UUID
+) -> None:
+    """Drop cached webhook routing entries that point at a changed worker app."""
+    # Entries are keyed by Instagram account_id, which is not known here, so
+    # match on the cached worker app id instead; other accounts stay warm
+    if worker_app_cache is not None:
+        target = str(worker_app_id)
+        worker_app_cache.invalidate_matching(lambda entry: entry.get("id") == target)
+
+
 @router.post("", response_model=WorkerAppResponse, status_code=status.HTTP_201_CREATED)
 @router.post("/", response_model=WorkerAppResponse, status_code=status.HTTP_201_CREATED)
 async def create_worker_app(
@@ -44,25 +60,19 @@ async def create_worker_app(
         409: If worker app for the user_id already exists
     """
 
-    # Check if worker app already exists for this user
-    if await repo.exists_by_user_id(worker_app_data.user_id):
+    # Create the worker app only if this user has none, in a single statement
+    worker_app = await repo.create_for_user(
+        base_url=worker_app_data.base_url,
+        webhook_url=worker_app_data.webhook_url or worker_app_data.base_url,
+        user_id=worker_app_data.user_id,
+    )
+    if worker_app is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Worker app already exists for this user_id"
         )
 
-    # Create worker app
-    worker_app = WorkerApp(
-        base_url=str(worker_app_data.base_url),
-        user_id=worker_app_data.user_id,
-        webhook_url=str(
-            worker_app_data.webhook_url or worker_app_data.base_url
-        ),
-    )
-
-    await repo.create(worker_app)
     await session.commit()
-    await session.refresh(worker_app)
 
     logger.info(
         "Created worker app id=%s user_id=%s",
@@ -78,15 +88,18 @@ async def create_worker_app(
 async def list_worker_apps(
     _admin_user: Annotated[User, Depends(get_current_admin_user)],
     repo: Annotated[WorkerAppRepository, Depends(get_worker_app_repository)],
-    page: int = 1,
-    size: int = 50,
+    page: Annotated[int, Query(ge=1)] = 1,
+    size: Annotated[int, Query(ge=1, le=200)] = 50,
 ):
     """
     List all worker apps with pagination.
 
+    The page and the overall total come from one windowed query, so a
+    separate COUNT round trip is only needed past the last page.
+
     Args:
         page: Page number (1-indexed)
-        size: Page size
+        size: Page size, at most 200
         (currently no filtering options)
 
     Returns:
@@ -95,18 +108,16 @@ async def list_worker_apps(
 
     offset = (page - 1) * size
 
-    items = await repo.get_all(limit=size, offset=offset)
-
-    # For simplicity, we're not implementing total count here
-    # In production, you'd want to add a count query
-    total = len(items)
+    items, total = await repo.get_all_with_total(limit=size, offset=offset)
 
-    return WorkerAppListResponse(
-        items=items,
-        total=total,
-        page=page,
-        size=size,
-    )
+    # ORM rows go straight to the response model (from_attributes); building
+    # WorkerAppListResponse here would validate every row twice
+    return {
+        "items": items,
+        "total": total,
+        "page": page,
+        "size": size,
+    }
 
 
 @router.get("/{worker_app_id}", response_model=WorkerAppResponse)
@@ -145,6 +156,7 @@ async def update_worker_app(
     worker_app_data: WorkerAppUpdate,
     session: Annotated[AsyncSession, Depends(get_session)],
     repo: Annotated[WorkerAppRepository, Depends(get_worker_app_repository)],
+    worker_app_cache: Annotated[Optional[TTLCache], Depends(get_worker_app_cache)],
     _admin_user: Annotated[User, Depends(get_current_admin_user)],
 ):
     """
@@ -161,7 +173,16 @@ async def update_worker_app(
         404: If worker app not found
     """
 
-    worker_app = await repo.get_by_id(worker_app_id)
+    # Update fields if provided
+    values = {}
+    if worker_app_data.base_url is not None:
+        values["base_url"] = worker_app_data.base_url
+    if worker_app_data.user_id is not None:
+        values["user_id"] = worker_app_data.user_id
+    if worker_app_data.webhook_url is not None:
+        values["webhook_url"] = worker_app_data.webhook_url
+
+    worker_app = await repo.update_by_id(worker_app_id, values)
 
     if not worker_app:
         raise HTTPException(
@@ -169,16 +190,8 @@ async def update_worker_app(
             detail=f"Worker app not found: {worker_app_id}"
         )
 
-    # Update fields if provided
-    if worker_app_data.base_url is not None:
-        worker_app.base_url = str(worker_app_data.base_url)
-    if worker_app_data.user_id is not None:
-        worker_app.user_id = worker_app_data.user_id
-    if worker_app_data.webhook_url is not None:
-        worker_app.webhook_url = str(worker_app_data.webhook_url)
-
     await session.commit()
-    await session.refresh(worker_app)
+    _invalidate_routing_cache(worker_app_cache, worker_app_id)
 
     logger.info("Updated worker app id=%s", worker_app_id)
 
@@ -190,6 +203,7 @@ async def delete_worker_app(
     worker_app_id: UUID,
     session: Annotated[AsyncSession, Depends(get_session)],
     repo: Annotated[WorkerAppRepository, Depends(get_worker_app_repository)],
+    worker_app_cache: Annotated[Optional[TTLCache], Depends(get_worker_app_cache)],
     _admin_user: Annotated[User, Depends(get_current_admin_user)],
 ):
     """
@@ -202,16 +216,14 @@ async def delete_worker_app(
         404: If worker app not found
     """
 
-    worker_app = await repo.get_by_id(worker_app_id)
-
-    if not worker_app:
+    if not await repo.delete_by_id(worker_app_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Worker app not found: {worker_app_id}"
         )
 
-    await repo.delete(worker_app)
     await session.commit()
+    _invalidate_routing_cache(worker_app_cache, worker_app_id)
 
     logger.info("Deleted worker app id=%s", worker_app_id)
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import base64
 import os
 from functools import lru_cache
 from typing import Optional
@@ -77,6 +78,9 @@ class ServerSettings(BaseModel):
         default_factory=lambda: os.getenv("HOST", "0.0.0.0").strip() or "0.0.0.0"
     )
     port: int = Field(default_factory=lambda: _int_env("PORT", 8000))
+    allowed_hosts: list[str] = Field(
+        default_factory=lambda: _csv_env("ALLOWED_HOSTS", "*")
+    )
 
 
 class DatabaseSettings(BaseModel):
@@ -85,6 +89,16 @@ class DatabaseSettings(BaseModel):
     max_overflow: int = Field(
         default_factory=lambda: _int_env("DATABASE_MAX_OVERFLOW", 30)
     )
+    pool_recycle: int = Field(
+        default_factory=lambda: _int_env("DATABASE_POOL_RECYCLE", 1800)
+    )
+    statement_cache_size: int = Field(
+        default_factory=lambda: _int_env("DATABASE_STATEMENT_CACHE_SIZE", 1024)
+    )
+    pool_pre_ping: bool = Field(
+        default_factory=lambda: _bool_env("DATABASE_POOL_PRE_PING", True)
+    )
+    echo: bool = Field(default_factory=lambda: _bool_env("DATABASE_ECHO", False))
 
     @model_validator(mode="after")
     def _validate(self) -> "DatabaseSettings":
@@ -140,6 +154,68 @@ class InstagramSettings(BaseModel):
         return self
 
 
+class WebhookSettings(BaseModel):
+    rate_limit_per_minute: int = Field(
+        default_factory=lambda: _int_env("WEBHOOK_RATE_LIMIT_PER_MINUTE", 0)
+    )
+    rate_limit_burst: int = Field(
+        default_factory=lambda: _int_env("WEBHOOK_RATE_LIMIT_BURST", 0)
+    )
+    rate_limit_prune_interval: int = Field(
+        default_factory=lambda: _int_env("WEBHOOK_RATE_LIMIT_PRUNE_INTERVAL", 60)
+    )
+    worker_app_cache_ttl: int = Field(
+        default_factory=lambda: _int_env("WORKER_APP_CACHE_TTL", 60)
+    )
+    worker_app_cache_size: int = Field(
+        default_factory=lambda: _int_env("WORKER_APP_CACHE_SIZE", 1024)
+    )
+    max_body_size: int = Field(
+        default_factory=lambda: _int_env("WEBHOOK_MAX_BODY_SIZE", 1024 * 1024)
+    )
+    signature_offload_bytes: int = Field(
+        default_factory=lambda: _int_env("WEBHOOK_SIGNATURE_OFFLOAD_BYTES", 64 * 1024)
+    )
+    # Deleting audit logs is opt-in: 0 (the default) keeps them forever
+    log_retention_days: int = Field(
+        default_factory=lambda: _int_env("WEBHOOK_LOG_RETENTION_DAYS", 0)
+    )
+    log_cleanup_interval: int = Field(
+        default_factory=lambda: _int_env("WEBHOOK_LOG_CLEANUP_INTERVAL", 3600)
+    )
+    log_cleanup_batch_size: int = Field(
+        default_factory=lambda: _int_env("WEBHOOK_LOG_CLEANUP_BATCH_SIZE", 10_000)
+    )
+    log_queue_size: int = Field(
+        default_factory=lambda: _int_env("WEBHOOK_LOG_QUEUE_SIZE", 10_000)
+    )
+    log_batch_size: int = Field(
+        default_factory=lambda: _int_env("WEBHOOK_LOG_BATCH_SIZE", 100)
+    )
+    log_flush_interval_ms: int = Field(
+        default_factory=lambda: _int_env("WEBHOOK_LOG_FLUSH_INTERVAL_MS", 50)
+    )
+    log_writers: int = Field(
+        default_factory=lambda: _int_env("WEBHOOK_LOG_WRITERS", 2)
+    )
+    forward_max_connections: int = Field(
+        default_factory=lambda: _int_env("WEBHOOK_FORWARD_MAX_CONNECTIONS", 200)
+    )
+    forward_keepalive_connections: int = Field(
+        default_factory=lambda: _int_env("WEBHOOK_FORWARD_KEEPALIVE_CONNECTIONS", 50)
+    )
+    forward_max_per_worker: int = Field(
+        default_factory=lambda: _int_env("WEBHOOK_FORWARD_MAX_PER_WORKER", 50)
+    )
+    forward_failure_cooldown_ms: int = Field(
+        default_factory=lambda: _int_env("WEBHOOK_FORWARD_FAILURE_COOLDOWN_MS", 1000)
+    )
+
+    @property
+    def rate_limit_enabled(self) -> bool:
+        return self.rate_limit_per_minute > 0
+
+
 class RedisSettings(BaseModel):
     url: Optional[str] = Field(
         default_factory=lambda: os.getenv("REDIS_URL", "").strip() or None
@@ -239,8 +315,6 @@ class OAuthSecuritySettings(BaseModel):
             errors.append("OAUTH_ENCRYPTION_KEY must be set for OAuth token encryption.")
         else:
             # Fernet requires a 32-byte URL-safe base64-encoded key
-            import base64
-
             try:
                 decoded = base64.urlsafe_b64decode(self.encryption_key)
                 if len(decoded) != 32:
@@ -258,6 +332,7 @@ class Settings(BaseModel):
     server: ServerSettings = Field(default_factory=ServerSettings)
     database: DatabaseSettings = Field(default_factory=DatabaseSettings)
     instagram: InstagramSettings = Field(default_factory=InstagramSettings)
+    webhook: WebhookSettings = Field(default_factory=WebhookSettings)
     redis: RedisSettings = Field(default_factory=RedisSettings)
     security: SecuritySettings = Field(default_factory=SecuritySettings)
     cors: CorsSettings = Field(default_factory=CorsSettings)
@@ -300,6 +375,10 @@ class Settings(BaseModel):
     def port(self) -> int:
         return self.server.port
 
+    @property
+    def allowed_hosts(self) -> list[str]:
+        return self.server.allowed_hosts
+
     @property
     def database_url(self) -> str:
         return self.database.url
@@ -312,6 +391,22 @@ class Settings(BaseModel):
     def database_max_overflow(self) -> int:
         return self.database.max_overflow
 
+    @property
+    def database_pool_recycle(self) -> int:
+        return self.database.pool_recycle
+
+    @property
+    def database_statement_cache_size(self) -> int:
+        return self.database.statement_cache_size
+
+    @property
+    def database_pool_pre_ping(self) -> bool:
+        return self.database.pool_pre_ping
+
+    @property
+    def database_echo(self) -> bool:
+        return self.database.echo
+
     @property
     def secret_key(self) -> str:
         return self.security.secret_key
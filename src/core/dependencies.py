@@ -6,14 +6,14 @@ and the application's DI container.
 """
 
 import logging
+from functools import lru_cache
 from typing import Annotated, AsyncGenerator, Optional
 
-from fastapi import Depends, HTTPException, Security, status
+import httpx
+from fastapi import Depends, HTTPException, Request, Security, status
 from fastapi.security import SecurityScopes
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from redis.exceptions import RedisError
-
 from src.core.config import Settings, get_settings
 from src.core.models.db_helper import db_helper
 from src.core.models.user import User, UserRole
@@ -25,9 +25,13 @@ from src.core.repositories.worker_app_repository import WorkerAppRepository
 from src.core.services.redis_cache_service import RedisCacheService
 from src.core.services.security import TokenDecodeError, oauth2_scheme, safe_decode_token
 from src.core.services.oauth_token_service import OAuthTokenService
+from src.core.services.webhook_log_writer import WebhookLogWriter
 from src.core.services.youtube_service import YouTubeService
 from src.core.use_cases.forward_webhook_use_case import ForwardWebhookUseCase
 from src.core.use_cases.process_webhook_use_case import ProcessWebhookUseCase
+from src.core.utils.concurrency import KeyedSemaphore, SingleFlight
+from src.core.utils.rate_limit import TokenBucket
+from src.core.utils.ttl_cache import TTLCache
 from src.api_v1.schemas import TokenData
 
 
@@ -55,35 +59,35 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
 # ============================================================================
 
 
-def get_worker_app_repository(
+async def get_worker_app_repository(
     session: Annotated[AsyncSession, Depends(get_session)]
 ) -> WorkerAppRepository:
     """Get WorkerAppRepository instance."""
     return WorkerAppRepository(session)
 
 
-def get_instagram_comment_repository(
+async def get_instagram_comment_repository(
     session: Annotated[AsyncSession, Depends(get_session)]
 ) -> InstagramCommentRepository:
     """Get InstagramCommentRepository instance."""
     return InstagramCommentRepository(session)
 
 
-def get_webhook_log_repository(
+async def get_webhook_log_repository(
     session: Annotated[AsyncSession, Depends(get_session)]
 ) -> WebhookLogRepository:
     """Get WebhookLogRepository instance."""
     return WebhookLogRepository(session)
 
 
-def get_user_repository(
+async def get_user_repository(
     session: Annotated[AsyncSession, Depends(get_session)]
 ) -> UserRepository:
     """Get UserRepository instance."""
     return UserRepository(session)
 
 
-def get_oauth_token_repository(
+async def get_oauth_token_repository(
     session: Annotated[AsyncSession, Depends(get_session)]
 ) -> OAuthTokenRepository:
     """Get OAuthTokenRepository instance."""
@@ -95,49 +99,109 @@ def get_oauth_token_repository(
 # ============================================================================
 
 
-async def get_redis_cache_service(
-    settings: Annotated[Settings, Depends(get_settings)]
-) -> AsyncGenerator[Optional[RedisCacheService], None]:
+async def get_redis_cache_service(request: Request) -> Optional[RedisCacheService]:
     """
-    Get RedisCacheService instance with connection management.
+    Get the shared RedisCacheService opened during application startup.
 
-    Yields:
-        Connected RedisCacheService instance
+    Returns:
+        Connected RedisCacheService, or None when Redis is disabled/unavailable
+    """
+    return getattr(request.app.state, "redis_cache", None)
+
+
+async def get_webhook_log_writer(request: Request) -> Optional[WebhookLogWriter]:
+    """
+    Get the background webhook log writer started during application startup.
+
+    Returns:
+        Running WebhookLogWriter, or None when logs are written inline
+    """
+    return getattr(request.app.state, "webhook_log_writer", None)
+
+
+async def get_http_client(request: Request) -> Optional[httpx.AsyncClient]:
+    """
+    Get the shared outbound HTTP client opened during application startup.
+
+    Returns:
+        Pooled httpx.AsyncClient, or None when the app was started without one
     """
-    redis_url = settings.redis.url
+    return getattr(request.app.state, "http_client", None)
+
+
+@lru_cache
+def get_forward_limiter() -> Optional[KeyedSemaphore]:
+    """
+    Get the process-wide cap on concurrent forwards per worker app URL.
+
+    Returns:
+        Shared KeyedSemaphore, or None when the cap is disabled
+    """
+    max_per_worker = get_settings().webhook.forward_max_per_worker
+    if max_per_worker <= 0:
+        return None
+    return KeyedSemaphore(max_per_worker)
+
 
-    if not redis_url:
-        # Redis is optional; yield None so downstream dependencies can fall back.
-        yield None
-        return
+@lru_cache
+def get_unreachable_worker_cache() -> Optional[TTLCache]:
+    """
+    Get the process-wide record of worker app URLs that recently failed to connect.
 
-    service = RedisCacheService(
-        redis_url=redis_url,
-        default_ttl=settings.redis.ttl,
+    Returns:
+        Shared TTLCache, or None when the failure cooldown is disabled
+    """
+    webhook_settings = get_settings().webhook
+    if webhook_settings.forward_failure_cooldown_ms <= 0:
+        return None
+    return TTLCache(
+        ttl_seconds=webhook_settings.forward_failure_cooldown_ms / 1000,
+        max_size=webhook_settings.worker_app_cache_size,
     )
-    try:
-        await service.connect()
-    except RedisError as exc:
-        logger.warning("Redis unavailable, continuing without cache: %s", exc)
-        yield None
-        return
-    try:
-        yield service
-    finally:
-        await service.disconnect()
 
 
-def get_forward_webhook_use_case(
+async def get_forward_webhook_use_case(
     session: Annotated[AsyncSession, Depends(get_session)],
+    log_writer: Annotated[Optional[WebhookLogWriter], Depends(get_webhook_log_writer)],
+    http_client: Annotated[Optional[httpx.AsyncClient], Depends(get_http_client)],
 ) -> ForwardWebhookUseCase:
     """Get ForwardWebhookUseCase instance."""
+    # Process-wide singletons are read directly: as sync dependencies FastAPI
+    # would hop to the thread pool for each of them on every webhook
     return ForwardWebhookUseCase(
         session=session,
         http_timeout=30.0,
+        log_writer=log_writer,
+        http_client=http_client,
+        forward_limiter=get_forward_limiter(),
+        unreachable_workers=get_unreachable_worker_cache(),
+    )
+
+
+@lru_cache
+def get_worker_app_cache() -> Optional[TTLCache]:
+    """
+    Get the process-wide worker app routing cache.
+
+    Returns:
+        Shared TTLCache, or None when the cache is disabled
+    """
+    webhook_settings = get_settings().webhook
+    if webhook_settings.worker_app_cache_ttl <= 0:
+        return None
+    return TTLCache(
+        ttl_seconds=webhook_settings.worker_app_cache_ttl,
+        max_size=webhook_settings.worker_app_cache_size,
     )
 
 
-def get_process_webhook_use_case(
+@lru_cache
+def get_routing_singleflight() -> SingleFlight:
+    """Get the process-wide coalescer for concurrent routing lookups."""
+    return SingleFlight()
+
+
+async def get_process_webhook_use_case(
     session: Annotated[AsyncSession, Depends(get_session)],
     forward_webhook_uc: Annotated[ForwardWebhookUseCase, Depends(get_forward_webhook_use_case)],
     redis_cache: Annotated[Optional[RedisCacheService], Depends(get_redis_cache_service)],
@@ -147,10 +211,31 @@ def get_process_webhook_use_case(
         session=session,
         forward_webhook_uc=forward_webhook_uc,
         redis_cache=redis_cache,
+        local_cache=get_worker_app_cache(),
+        routing_flight=get_routing_singleflight(),
+    )
+
+
+@lru_cache
+def get_webhook_rate_limiter() -> Optional[TokenBucket]:
+    """
+    Get the process-wide webhook rate limiter.
+
+    Returns:
+        Shared TokenBucket, or None when rate limiting is disabled
+    """
+    webhook_settings = get_settings().webhook
+    if not webhook_settings.rate_limit_enabled:
+        return None
+
+    per_minute = webhook_settings.rate_limit_per_minute
+    return TokenBucket(
+        capacity=webhook_settings.rate_limit_burst or per_minute,
+        refill_per_second=per_minute / 60,
     )
 
 
-def get_oauth_token_service(
+async def get_oauth_token_service(
     repo: Annotated[OAuthTokenRepository, Depends(get_oauth_token_repository)],
     settings: Annotated[Settings, Depends(get_settings)],
 ) -> OAuthTokenService:
@@ -158,7 +243,7 @@ def get_oauth_token_service(
     return OAuthTokenService(repo=repo, encryption_key=settings.oauth_encryption_key)
 
 
-def get_youtube_service(
+async def get_youtube_service(
     token_service: Annotated[OAuthTokenService, Depends(get_oauth_token_service)],
     settings: Annotated[Settings, Depends(get_settings)],
 ) -> YouTubeService:
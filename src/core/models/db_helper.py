@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import inspect
 from asyncio import current_task
+from typing import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -18,41 +19,74 @@ from src.core.config import get_settings
 class DatabaseHelper:
     """Helper for managing database connections and sessions."""
 
-    def __init__(self, url: str, echo: bool = False):
-        self.engine = create_async_engine(
-            url=url,
-            echo=echo,
-        )
+    def __init__(
+        self,
+        url: str,
+        echo: bool = False,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_recycle: int = 1800,
+        statement_cache_size: int = 100,
+        pool_pre_ping: bool = True,
+    ):
+        engine_kwargs: dict = {"echo": echo}
+        if not url.startswith("sqlite"):
+            # SQLite test databases use a static pool that takes no sizing options
+            engine_kwargs.update(
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                # Costs a round-trip per checkout; only needed when pooled
+                # connections can be dropped before ``pool_recycle`` retires them
+                pool_pre_ping=pool_pre_ping,
+                pool_recycle=pool_recycle,
+                # Reuse the most recently returned connection to keep a warm core
+                pool_use_lifo=True,
+            )
+        if url.startswith("postgresql+asyncpg"):
+            # Repository queries are a small fixed set; keep them all prepared.
+            # The first key sizes asyncpg's own cache, the second SQLAlchemy's
+            # adapter cache of prepared statement handles.
+            engine_kwargs["connect_args"] = {
+                "statement_cache_size": statement_cache_size,
+                "prepared_statement_cache_size": statement_cache_size,
+            }
+        self.engine = create_async_engine(url=url, **engine_kwargs)
         self.session_factory = async_sessionmaker(
             bind=self.engine,
             autoflush=False,
             autocommit=False,
             expire_on_commit=False,
         )
+        # One registry for the whole process; sessions are keyed by the current task
+        self.scoped_session = async_scoped_session(
+            session_factory=self.session_factory,
+            scopefunc=current_task,
+        )
 
-    async def session_dependency(self) -> AsyncSession:  # type: ignore
-        """FastAPI dependency for database sessions."""
+    async def session_dependency(self) -> AsyncGenerator[AsyncSession, None]:
+        """FastAPI dependency for database sessions, closed when the request ends."""
         async with self.session_factory() as session:
             yield session
 
-    async def scoped_session_dependency(self) -> AsyncSession:  # type: ignore
+    async def scoped_session_dependency(self) -> AsyncGenerator[AsyncSession, None]:
         """FastAPI dependency for scoped database sessions."""
-        scoped_session = self.get_scoped_session()
-        session = scoped_session()
+        session = self.scoped_session()
         try:
             yield session
         finally:
             await session.close()
-            remove_result = scoped_session.remove()
+            remove_result = self.scoped_session.remove()
             if inspect.isawaitable(remove_result):
                 await remove_result
 
-    def get_scoped_session(self):
-        """Get scoped session bound to current async task."""
-        return async_scoped_session(
-            session_factory=self.session_factory,
-            scopefunc=current_task,
-        )
+    def get_scoped_session(self) -> async_scoped_session:
+        """Get scoped session registry bound to current async task."""
+        return self.scoped_session
+
+    def pool_checked_out(self) -> int:
+        """Number of pooled connections currently in use (0 for unpooled engines)."""
+        checkedout = getattr(self.engine.pool, "checkedout", None)
+        return checkedout() if checkedout is not None else 0
 
     async def dispose(self) -> None:
         await self.engine.dispose()
@@ -61,5 +95,10 @@ class DatabaseHelper:
 settings = get_settings()
 db_helper = DatabaseHelper(
     url=settings.database_url,
-    echo=settings.debug,
+    echo=settings.database_echo,
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
+    pool_recycle=settings.database_pool_recycle,
+    statement_cache_size=settings.database_statement_cache_size,
+    pool_pre_ping=settings.database_pool_pre_ping,
 )
@@ -3,6 +3,7 @@
 from datetime import datetime
 
 from sqlalchemy import DateTime, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.types import JSON
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -42,8 +43,12 @@ class InstagramComment(Base):
     timestamp: Mapped[int] = mapped_column(
         nullable=False, comment="Unix timestamp from webhook entry"
     )
+    # Binary jsonb on PostgreSQL so audits read it without re-parsing text
     raw_webhook_data: Mapped[dict] = mapped_column(
-        JSON, nullable=False, default=dict, comment="Raw webhook payload for audit"
+        JSON().with_variant(JSONB(), "postgresql"),
+        nullable=False,
+        default=dict,
+        comment="Raw webhook payload for audit",
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
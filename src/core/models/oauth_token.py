@@ -4,12 +4,13 @@ from __future__ import annotations
 
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import DateTime, ForeignKey, String, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.models.base import Base
+from src.core.utils.ids import uuid7
 
 if TYPE_CHECKING:
     from src.core.models.user import User
@@ -28,13 +29,12 @@ class OAuthToken(Base):
         ),
     )
 
-    id: Mapped[str] = mapped_column(
-        String(36),
-        primary_key=True,
-        default=lambda: str(uuid4()),
-    )
+    # Time-ordered like the other primary keys, and drawn from the
+    # in-process generator instead of os.urandom per row
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid7)
+    # Not indexed on its own: uq_oauth_provider_account_user leads with provider
     provider: Mapped[str] = mapped_column(
-        String(50), nullable=False, index=True, comment="OAuth provider identifier"
+        String(50), nullable=False, comment="OAuth provider identifier"
     )
     account_id: Mapped[str] = mapped_column(
         String(255),
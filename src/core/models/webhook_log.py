@@ -2,12 +2,13 @@
 
 from datetime import datetime
 from typing import TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.models.base import Base
+from src.core.utils.ids import uuid7
 
 if TYPE_CHECKING:
     from src.core.models.worker_app import WorkerApp
@@ -18,17 +19,16 @@ class WebhookLog(Base):
 
     __tablename__ = "webhook_logs"
 
-    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid7)
     webhook_id: Mapped[str] = mapped_column(
         String(255), unique=True, index=True, nullable=False, comment="Unique webhook ID"
     )
     account_id: Mapped[str] = mapped_column(
-        String(255), nullable=False, index=True, comment="Instagram account ID"
+        String(255), nullable=False, comment="Instagram account ID"
     )
     worker_app_id: Mapped[UUID | None] = mapped_column(
         ForeignKey("worker_apps.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
         comment="Target worker app ID",
     )
     target_owner_username: Mapped[str | None] = mapped_column(
@@ -38,12 +38,13 @@ class WebhookLog(Base):
         String(500), nullable=True, comment="Target base URL"
     )
     status: Mapped[str] = mapped_column(
-        String(50), nullable=False, index=True, comment="Processing status"
+        String(50), nullable=False, comment="Processing status"
     )
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True, comment="Error messages")
     processing_time_ms: Mapped[int | None] = mapped_column(
         Integer, nullable=True, comment="Processing time in milliseconds"
     )
+    # Indexed for the retention sweep's created_at range delete
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, index=True, server_default=func.now()
     )
@@ -53,3 +54,29 @@ class WebhookLog(Base):
 
     def __repr__(self) -> str:
         return f"<WebhookLog(id={self.id}, webhook_id={self.webhook_id}, status={self.status})>"
+
+
+# Partial index serving get_failed_logs: only failed rows, already in list order
+Index(
+    "idx_webhook_logs_failed_created_at",
+    WebhookLog.created_at.desc(),
+    postgresql_where=WebhookLog.status == "failed",
+    sqlite_where=WebhookLog.status == "failed",
+)
+
+# Serves per-worker-app listings in their exact (created_at, id) keyset order
+# and time-windowed stats; also covers worker_app_id alone (e.g. the
+# ON DELETE SET NULL scan when a worker app is removed)
+Index(
+    "idx_webhook_logs_worker_app_created",
+    WebhookLog.worker_app_id,
+    WebhookLog.created_at.desc(),
+    WebhookLog.id.desc(),
+)
+
+# Serves per-account listings newest first; also covers lookups by account_id alone
+Index(
+    "idx_webhook_logs_account_created",
+    WebhookLog.account_id,
+    WebhookLog.created_at.desc(),
+)
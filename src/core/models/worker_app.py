@@ -2,12 +2,13 @@
 
 from datetime import datetime
 from typing import TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import DateTime, ForeignKey, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.models.base import Base
+from src.core.utils.ids import uuid7
 
 if TYPE_CHECKING:
     from src.core.models.user import User
@@ -19,7 +20,7 @@ class WorkerApp(Base):
 
     __tablename__ = "worker_apps"
 
-    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid7)
     base_url: Mapped[str] = mapped_column(
         String(500),
         nullable=False,
@@ -1,9 +1,10 @@
 """Base repository pattern for data access abstraction (Clean Architecture)."""
 
 import logging
-from typing import Generic, TypeVar, Type, Optional, List
-from sqlalchemy import select
+from typing import Generic, TypeVar, Type, Optional, List, Tuple
+from sqlalchemy import func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from ..models.base import Base
 
@@ -17,6 +18,10 @@ class BaseRepository(Generic[T]):
 
     Provides common CRUD operations following Repository Pattern.
     Reduces duplication and provides clean data access layer.
+
+    Queries returning lists add ``raiseload("*")``: touching a relationship
+    that was not loaded explicitly raises instead of silently issuing one
+    query per row. Declare the load (e.g. ``selectinload``) where needed.
     """
 
     def __init__(self, model: Type[T], session: AsyncSession):
@@ -33,10 +38,33 @@ class BaseRepository(Generic[T]):
     async def get_all(self, limit: int = 100, offset: int = 0) -> List[T]:
         """Get all entities with pagination."""
         result = await self.session.execute(
-            select(self.model).limit(limit).offset(offset)
+            select(self.model).options(raiseload("*")).limit(limit).offset(offset)
         )
         return list(result.scalars().all())
 
+    async def get_all_with_total(
+        self, limit: int = 100, offset: int = 0
+    ) -> Tuple[List[T], int]:
+        """Get a page of entities and the overall count in one query."""
+        result = await self.session.execute(
+            select(self.model, func.count().over().label("total"))
+            .options(raiseload("*"))
+            .limit(limit)
+            .offset(offset)
+        )
+        rows = result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+        # Past the last page the window has no rows to report the total on
+        return [], await self.count() if offset else 0
+
+    async def count(self) -> int:
+        """Count all entities."""
+        result = await self.session.execute(
+            select(func.count()).select_from(self.model)
+        )
+        return result.scalar_one()
+
     async def create(self, entity: T) -> T:
         """Create new entity."""
         self.session.add(entity)
@@ -55,5 +83,11 @@ class BaseRepository(Generic[T]):
 
     async def exists(self, id: str | int) -> bool:
         """Check if entity exists."""
-        entity = await self.get_by_id(id)
-        return entity is not None
+        return await self._exists_where(self.model.id == id)
+
+    async def _exists_where(self, *conditions) -> bool:
+        """Check for a matching row with SELECT 1 ... LIMIT 1, without loading it."""
+        result = await self.session.execute(
+            select(literal(1)).select_from(self.model).where(*conditions).limit(1)
+        )
+        return result.scalar() is not None
@@ -1,6 +1,6 @@
 """Repository for InstagramComment model."""
 
-from typing import Optional
+from typing import Iterable, Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -83,5 +83,22 @@ class InstagramCommentRepository(BaseRepository[InstagramComment]):
         Returns:
             True if exists, False otherwise
         """
-        comment = await self.get_by_comment_id(comment_id)
-        return comment is not None
+        return await self._exists_where(InstagramComment.comment_id == comment_id)
+
+    async def get_existing_comment_ids(self, comment_ids: Iterable[str]) -> set[str]:
+        """
+        Find which of several comment IDs are already stored, in one query.
+
+        Args:
+            comment_ids: Instagram comment IDs to check
+
+        Returns:
+            The subset of ``comment_ids`` that exist
+        """
+        ids = set(comment_ids)
+        if not ids:
+            return set()
+        result = await self.session.execute(
+            select(InstagramComment.comment_id).where(InstagramComment.comment_id.in_(ids))
+        )
+        return set(result.scalars().all())
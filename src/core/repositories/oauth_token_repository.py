@@ -6,12 +6,25 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select, delete
+from sqlalchemy import bindparam, select, delete, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from src.core.models.oauth_token import OAuthToken
 from src.core.repositories.base import BaseRepository
 
+# Built once so the webhook routing lookup reuses one statement (and its
+# compiled-cache entry) instead of constructing a new select per call.
+_LATEST_BY_PROVIDER_ACCOUNT = (
+    select(OAuthToken)
+    .where(
+        OAuthToken.provider == bindparam("provider"),
+        OAuthToken.account_id == bindparam("account_id"),
+    )
+    .order_by(OAuthToken.updated_at.desc(), OAuthToken.created_at.desc())
+    .limit(1)
+)
+
 
 class OAuthTokenRepository(BaseRepository[OAuthToken]):
     """Data access for OAuth tokens."""
@@ -27,22 +40,19 @@ class OAuthTokenRepository(BaseRepository[OAuthToken]):
             stmt = stmt.where(OAuthToken.user_id == user_id)
         if account_id:
             stmt = stmt.where(OAuthToken.account_id == account_id)
-        stmt = stmt.order_by(OAuthToken.updated_at.desc(), OAuthToken.created_at.desc())
+        stmt = stmt.order_by(
+            OAuthToken.updated_at.desc(), OAuthToken.created_at.desc()
+        ).limit(1)
         result = await self.session.execute(stmt)
         return result.scalars().first()
 
     async def get_by_provider_account_id(
         self, provider: str, account_id: str
     ) -> Optional[OAuthToken]:
-        stmt = (
-            select(OAuthToken)
-            .where(
-                OAuthToken.provider == provider,
-                OAuthToken.account_id == account_id,
-            )
-            .order_by(OAuthToken.updated_at.desc(), OAuthToken.created_at.desc())
+        result = await self.session.execute(
+            _LATEST_BY_PROVIDER_ACCOUNT,
+            {"provider": provider, "account_id": account_id},
         )
-        result = await self.session.execute(stmt)
         return result.scalars().first()
 
     async def list_by_provider_instagram_user_id(
@@ -50,6 +60,7 @@ class OAuthTokenRepository(BaseRepository[OAuthToken]):
     ) -> list[OAuthToken]:
         stmt = (
             select(OAuthToken)
+            .options(raiseload("*"))
             .where(
                 OAuthToken.provider == provider,
                 OAuthToken.instagram_user_id == instagram_user_id,
@@ -113,15 +124,23 @@ class OAuthTokenRepository(BaseRepository[OAuthToken]):
         encrypted_refresh_token: Optional[str],
         access_token_expires_at: Optional[datetime],
     ) -> Optional[OAuthToken]:
-        token = await self._get_by_provider_account_user(provider, account_id, user_id)
-        if not token:
-            return None
-
-        token.encrypted_access_token = encrypted_access_token
-        token.encrypted_refresh_token = encrypted_refresh_token
-        token.access_token_expires_at = access_token_expires_at
-        await self.session.flush()
-        return token
+        # One UPDATE ... RETURNING instead of a SELECT followed by a flush;
+        # also leaves no window between reading the row and writing it
+        result = await self.session.execute(
+            update(OAuthToken)
+            .where(
+                OAuthToken.provider == provider,
+                OAuthToken.account_id == account_id,
+                OAuthToken.user_id == user_id,
+            )
+            .values(
+                encrypted_access_token=encrypted_access_token,
+                encrypted_refresh_token=encrypted_refresh_token,
+                access_token_expires_at=access_token_expires_at,
+            )
+            .returning(OAuthToken)
+        )
+        return result.scalar_one_or_none()
 
     async def _get_by_provider_account_user(
         self, provider: str, account_id: str, user_id: UUID | str
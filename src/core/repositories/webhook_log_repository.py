@@ -1,17 +1,36 @@
 """Repository for WebhookLog model."""
 
 import logging
-from typing import Optional
+from datetime import datetime
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
-from sqlalchemy import select, func
+from sqlalchemy import delete, func, insert, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, raiseload
 
 from src.core.models.webhook_log import WebhookLog
+from src.core.models.worker_app import WorkerApp
 from src.core.repositories.base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+# Keyset pagination position: (created_at, id) of the last row already seen
+LogCursor = tuple[datetime, UUID]
+
+# Columns a log listing displays; the unbounded error_message and the target
+# URL/owner are left out and raise if touched. Use get_by_id for the full row.
+_SUMMARY_COLUMNS = load_only(
+    WebhookLog.id,
+    WebhookLog.webhook_id,
+    WebhookLog.account_id,
+    WebhookLog.worker_app_id,
+    WebhookLog.status,
+    WebhookLog.processing_time_ms,
+    WebhookLog.created_at,
+    raiseload=True,
+)
+
 
 class WebhookLogRepository(BaseRepository[WebhookLog]):
     """Repository for webhook log operations."""
@@ -34,11 +53,32 @@ class WebhookLogRepository(BaseRepository[WebhookLog]):
         )
         return result.scalar_one_or_none()
 
+    async def create_many(self, rows: list[dict]) -> int:
+        """
+        Insert log entries with one multi-row INSERT.
+
+        Rows go through a bulk INSERT rather than the unit of work, so no
+        ORM objects are built and nothing is re-selected afterwards. The
+        caller owns the transaction and commits once per batch.
+
+        Args:
+            rows: Column values for each WebhookLog, keyed by attribute name
+
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+        await self.session.execute(insert(WebhookLog), rows)
+        return len(rows)
+
     async def get_by_account_id(
         self,
         account_id: str,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        after: Optional[LogCursor] = None,
+        summary: bool = False,
     ) -> list[WebhookLog]:
         """
         Get all logs for an account.
@@ -46,25 +86,24 @@ class WebhookLogRepository(BaseRepository[WebhookLog]):
         Args:
             account_id: Instagram account ID
             limit: Maximum number of results
-            offset: Number of results to skip
+            offset: Number of results to skip (prefer ``after``)
+            after: Keyset cursor from ``next_cursor`` of the previous page
+            summary: Load only the listing columns (see ``_SUMMARY_COLUMNS``)
 
         Returns:
             List of WebhookLog instances
         """
-        result = await self.session.execute(
-            select(WebhookLog)
-            .where(WebhookLog.account_id == account_id)
-            .order_by(WebhookLog.created_at.desc())
-            .limit(limit)
-            .offset(offset)
+        return await self._list_newest_first(
+            WebhookLog.account_id == account_id, limit, offset, after, summary
         )
-        return list(result.scalars().all())
 
     async def get_by_worker_app_id(
         self,
         worker_app_id: UUID,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        after: Optional[LogCursor] = None,
+        summary: bool = False,
     ) -> list[WebhookLog]:
         """
         Get all logs for a worker app.
@@ -72,25 +111,24 @@ class WebhookLogRepository(BaseRepository[WebhookLog]):
         Args:
             worker_app_id: Worker app UUID
             limit: Maximum number of results
-            offset: Number of results to skip
+            offset: Number of results to skip (prefer ``after``)
+            after: Keyset cursor from ``next_cursor`` of the previous page
+            summary: Load only the listing columns (see ``_SUMMARY_COLUMNS``)
 
         Returns:
             List of WebhookLog instances
         """
-        result = await self.session.execute(
-            select(WebhookLog)
-            .where(WebhookLog.worker_app_id == worker_app_id)
-            .order_by(WebhookLog.created_at.desc())
-            .limit(limit)
-            .offset(offset)
+        return await self._list_newest_first(
+            WebhookLog.worker_app_id == worker_app_id, limit, offset, after, summary
         )
-        return list(result.scalars().all())
 
     async def get_by_status(
         self,
         status: str,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        after: Optional[LogCursor] = None,
+        summary: bool = False,
     ) -> list[WebhookLog]:
         """
         Get logs by processing status.
@@ -98,20 +136,51 @@ class WebhookLogRepository(BaseRepository[WebhookLog]):
         Args:
             status: Processing status (success, failed, routed, etc.)
             limit: Maximum number of results
-            offset: Number of results to skip
+            offset: Number of results to skip (prefer ``after``)
+            after: Keyset cursor from ``next_cursor`` of the previous page
+            summary: Load only the listing columns (see ``_SUMMARY_COLUMNS``)
 
         Returns:
             List of WebhookLog instances
         """
+        return await self._list_newest_first(
+            WebhookLog.status == status, limit, offset, after, summary
+        )
+
+    async def _list_newest_first(
+        self,
+        condition,
+        limit: int,
+        offset: int,
+        after: Optional[LogCursor],
+        summary: bool,
+    ) -> list[WebhookLog]:
+        """
+        List logs matching ``condition`` ordered by (created_at, id) descending.
+
+        With ``after`` the page starts right below the given key, a bounded
+        index range scan however deep the page is; OFFSET would read and
+        discard every skipped row.
+        """
+        stmt = select(WebhookLog).options(raiseload("*")).where(condition)
+        if summary:
+            stmt = stmt.options(_SUMMARY_COLUMNS)
+        if after is not None:
+            stmt = stmt.where(tuple_(WebhookLog.created_at, WebhookLog.id) < tuple_(*after))
         result = await self.session.execute(
-            select(WebhookLog)
-            .where(WebhookLog.status == status)
-            .order_by(WebhookLog.created_at.desc())
+            stmt.order_by(WebhookLog.created_at.desc(), WebhookLog.id.desc())
             .limit(limit)
             .offset(offset)
         )
         return list(result.scalars().all())
 
+    @staticmethod
+    def next_cursor(logs: list[WebhookLog]) -> Optional[LogCursor]:
+        """Return the keyset cursor for the page after ``logs`` (None when empty)."""
+        if not logs:
+            return None
+        return logs[-1].created_at, logs[-1].id
+
     async def count_by_status(self, status: str) -> int:
         """
         Count logs by processing status.
@@ -146,18 +215,164 @@ class WebhookLogRepository(BaseRepository[WebhookLog]):
         )
         return result.scalar_one()
 
-    async def get_failed_logs(self, limit: int = 100, offset: int = 0) -> list[WebhookLog]:
+    @staticmethod
+    def _stats_columns() -> tuple:
+        """Aggregate columns shared by the stats queries, computed in one pass."""
+        return (
+            func.count().label("total"),
+            func.count().filter(WebhookLog.status == "success").label("success"),
+            func.count().filter(WebhookLog.status == "failed").label("failed"),
+            func.avg(WebhookLog.processing_time_ms).label("avg_processing_time_ms"),
+        )
+
+    async def get_stats(
+        self,
+        account_id: Optional[str] = None,
+        worker_app_id: Optional[UUID] = None,
+        since: Optional[datetime] = None,
+    ) -> dict:
+        """
+        Aggregate webhook log counters in a single query.
+
+        Args:
+            account_id: Optionally restrict to one Instagram account
+            worker_app_id: Optionally restrict to one worker app
+            since: Only count logs created at or after this time
+
+        Returns:
+            dict with total, success and failed counts plus the average
+            processing time in milliseconds
+        """
+        stmt = select(*self._stats_columns()).select_from(WebhookLog)
+        if account_id is not None:
+            stmt = stmt.where(WebhookLog.account_id == account_id)
+        if worker_app_id is not None:
+            stmt = stmt.where(WebhookLog.worker_app_id == worker_app_id)
+        if since is not None:
+            stmt = stmt.where(WebhookLog.created_at >= since)
+        result = await self.session.execute(stmt)
+        total, success, failed, avg_processing_time_ms = result.one()
+        return {
+            "total": total,
+            "success": success,
+            "failed": failed,
+            "avg_processing_time_ms": float(avg_processing_time_ms or 0.0),
+        }
+
+    async def get_overview(self, since: Optional[datetime] = None) -> dict:
+        """
+        Aggregate the webhook log counters and count worker apps in one query.
+
+        The worker app count rides along as an uncorrelated scalar subquery,
+        so a metrics snapshot costs a single round-trip.
+
+        Args:
+            since: Only count logs created at or after this time; the range
+                scan on created_at avoids aggregating the whole table
+
+        Returns:
+            dict with the same counters as ``get_stats`` plus worker_apps_total
+        """
+        worker_apps_total = (
+            select(func.count()).select_from(WorkerApp).scalar_subquery()
+        )
+        stmt = select(
+            *self._stats_columns(),
+            worker_apps_total.label("worker_apps_total"),
+        ).select_from(WebhookLog)
+        if since is not None:
+            stmt = stmt.where(WebhookLog.created_at >= since)
+        result = await self.session.execute(stmt)
+        row = result.one()
+        return {
+            "total": row.total,
+            "success": row.success,
+            "failed": row.failed,
+            "avg_processing_time_ms": float(row.avg_processing_time_ms or 0.0),
+            "worker_apps_total": row.worker_apps_total,
+        }
+
+    async def get_stats_by_worker_app(
+        self, since: Optional[datetime] = None
+    ) -> list[dict]:
+        """
+        Aggregate webhook log counters for every worker app in a single query.
+
+        Args:
+            since: Only count logs created at or after this time
+
+        Returns:
+            One dict per worker app with its worker_app_id and the same
+            counters as ``get_stats``
+        """
+        stmt = select(WebhookLog.worker_app_id, *self._stats_columns()).where(
+            WebhookLog.worker_app_id.is_not(None)
+        )
+        if since is not None:
+            stmt = stmt.where(WebhookLog.created_at >= since)
+        result = await self.session.execute(stmt.group_by(WebhookLog.worker_app_id))
+        return [
+            {
+                "worker_app_id": row.worker_app_id,
+                "total": row.total,
+                "success": row.success,
+                "failed": row.failed,
+                "avg_processing_time_ms": float(row.avg_processing_time_ms or 0.0),
+            }
+            for row in result
+        ]
+
+    async def get_failed_logs(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[LogCursor] = None,
+        summary: bool = False,
+    ) -> list[WebhookLog]:
         """
         Get all failed webhook logs.
 
         Args:
             limit: Maximum number of results
-            offset: Number of results to skip
+            offset: Number of results to skip (prefer ``after``)
+            after: Keyset cursor from ``next_cursor`` of the previous page
+            summary: Load only the listing columns (see ``_SUMMARY_COLUMNS``)
 
         Returns:
             List of failed WebhookLog instances
         """
-        return await self.get_by_status("failed", limit, offset)
+        return await self.get_by_status("failed", limit, offset, after, summary)
+
+    async def iter_by_status(
+        self, status: str, batch_size: int = 500
+    ) -> AsyncIterator[WebhookLog]:
+        """
+        Stream logs by processing status, newest first, without a limit.
+
+        Rows are fetched through a server-side cursor ``batch_size`` at a
+        time, so memory stays bounded for exports of any size. Use the
+        paginated ``get_by_status`` for API listings.
+
+        Args:
+            status: Processing status
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            WebhookLog instances
+        """
+        result = await self.session.stream_scalars(
+            select(WebhookLog)
+            .options(raiseload("*"))
+            .where(WebhookLog.status == status)
+            .order_by(WebhookLog.created_at.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        async for log in result:
+            yield log
+
+    def iter_failed_logs(self, batch_size: int = 500) -> AsyncIterator[WebhookLog]:
+        """Stream all failed webhook logs; see ``iter_by_status``."""
+        return self.iter_by_status("failed", batch_size)
 
     async def exists_by_webhook_id(self, webhook_id: str) -> bool:
         """
@@ -169,5 +384,33 @@ class WebhookLogRepository(BaseRepository[WebhookLog]):
         Returns:
             True if exists, False otherwise
         """
-        log = await self.get_by_webhook_id(webhook_id)
-        return log is not None
+        return await self._exists_where(WebhookLog.webhook_id == webhook_id)
+
+    async def cleanup_old_logs(
+        self, cutoff: datetime, batch_size: Optional[int] = None
+    ) -> int:
+        """
+        Delete log entries created before ``cutoff``.
+
+        With ``batch_size`` at most that many rows are deleted per call, so a
+        large backlog can be drained in short transactions instead of one
+        long-running DELETE.
+
+        Args:
+            cutoff: Entries with ``created_at`` older than this are removed
+            batch_size: Optional maximum number of rows to delete
+
+        Returns:
+            Number of deleted log entries
+        """
+        condition = WebhookLog.created_at < cutoff
+        if batch_size is not None:
+            condition = WebhookLog.id.in_(
+                select(WebhookLog.id).where(condition).limit(batch_size)
+            )
+        result = await self.session.execute(
+            delete(WebhookLog)
+            .where(condition)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
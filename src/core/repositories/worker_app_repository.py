@@ -1,13 +1,33 @@
 """Repository for WorkerApp model."""
 
-from typing import Optional
+from typing import Any, Iterable, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, delete, func, insert, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.models.oauth_token import OAuthToken
+from src.core.models.webhook_log import WebhookLog
 from src.core.models.worker_app import WorkerApp
 from src.core.repositories.base import BaseRepository
+from src.core.utils.ids import uuid7
+
+# Webhook routing hot path: built once and executed with bound parameters
+_BY_USER_ID = select(WorkerApp).where(WorkerApp.user_id == bindparam("user_id"))
+
+# Latest token for the account joined to its user's worker app in one statement;
+# the outer join keeps the token row (and username) when no worker app exists
+_ROUTING_TARGET = (
+    select(WorkerApp, OAuthToken.username)
+    .select_from(OAuthToken)
+    .outerjoin(WorkerApp, WorkerApp.user_id == OAuthToken.user_id)
+    .where(
+        OAuthToken.provider == bindparam("provider"),
+        OAuthToken.account_id == bindparam("account_id"),
+    )
+    .order_by(OAuthToken.updated_at.desc(), OAuthToken.created_at.desc())
+    .limit(1)
+)
 
 
 class WorkerAppRepository(BaseRepository[WorkerApp]):
@@ -26,10 +46,94 @@ class WorkerAppRepository(BaseRepository[WorkerApp]):
         Returns:
             WorkerApp if found, None otherwise
         """
+        result = await self.session.execute(_BY_USER_ID, {"user_id": user_id})
+        return result.scalar_one_or_none()
+
+    async def get_by_user_ids(self, user_ids: Iterable[UUID]) -> dict[UUID, WorkerApp]:
+        """
+        Get the worker apps of several users in one query.
+
+        Args:
+            user_ids: User IDs
+
+        Returns:
+            Mapping of user ID to WorkerApp for users that have one
+        """
+        ids = set(user_ids)
+        if not ids:
+            return {}
         result = await self.session.execute(
-            select(WorkerApp).where(WorkerApp.user_id == user_id)
+            select(WorkerApp).where(WorkerApp.user_id.in_(ids))
         )
-        return result.scalar_one_or_none()
+        return {worker_app.user_id: worker_app for worker_app in result.scalars().all()}
+
+    async def get_routing_target(
+        self, account_id: str, provider: str = "instagram"
+    ) -> tuple[Optional[WorkerApp], Optional[str]]:
+        """
+        Resolve the worker app and account username for an external account.
+
+        Joins the account's most recent OAuth token to its user's worker app,
+        so routing needs one round trip instead of two.
+
+        Args:
+            account_id: External account ID (e.g., Instagram business account)
+            provider: OAuth provider identifier
+
+        Returns:
+            Tuple of (WorkerApp or None, account username or None)
+        """
+        result = await self.session.execute(
+            _ROUTING_TARGET, {"provider": provider, "account_id": account_id}
+        )
+        row = result.first()
+        if row is None:
+            return None, None
+        return row[0], row[1]
+
+    async def get_routing_targets(
+        self, account_ids: Iterable[str], provider: str = "instagram"
+    ) -> dict[str, tuple[Optional[WorkerApp], Optional[str]]]:
+        """
+        Resolve the routing targets of several accounts in one query.
+
+        Same result per account as ``get_routing_target``: each account's
+        most recent token (picked with a window function) joined to its
+        user's worker app.
+
+        Args:
+            account_ids: External account IDs
+            provider: OAuth provider identifier
+
+        Returns:
+            Mapping of account ID to (WorkerApp or None, account username or
+            None); accounts without a token are left out
+        """
+        ids = set(account_ids)
+        if not ids:
+            return {}
+        latest = (
+            select(
+                OAuthToken.account_id,
+                OAuthToken.user_id,
+                OAuthToken.username,
+                func.row_number()
+                .over(
+                    partition_by=OAuthToken.account_id,
+                    order_by=(OAuthToken.updated_at.desc(), OAuthToken.created_at.desc()),
+                )
+                .label("recency"),
+            )
+            .where(OAuthToken.provider == provider, OAuthToken.account_id.in_(ids))
+            .subquery()
+        )
+        result = await self.session.execute(
+            select(latest.c.account_id, latest.c.username, WorkerApp)
+            .select_from(latest)
+            .outerjoin(WorkerApp, WorkerApp.user_id == latest.c.user_id)
+            .where(latest.c.recency == 1)
+        )
+        return {row[0]: (row[2], row[1]) for row in result}
 
     async def exists_by_user_id(self, user_id: UUID) -> bool:
         """
@@ -41,5 +145,83 @@ class WorkerAppRepository(BaseRepository[WorkerApp]):
         Returns:
             True if exists, False otherwise
         """
-        worker_app = await self.get_by_user_id(user_id)
-        return worker_app is not None
+        return await self._exists_where(WorkerApp.user_id == user_id)
+
+    async def create_for_user(
+        self, base_url: str, webhook_url: str, user_id: UUID
+    ) -> Optional[WorkerApp]:
+        """
+        Create a worker app unless the user already has one, in one statement.
+
+        The existence check and the insert are fused into
+        ``INSERT ... SELECT ... WHERE NOT EXISTS ... RETURNING``, replacing a
+        separate SELECT round trip (and the refresh after the insert).
+
+        Args:
+            base_url: Base URL for forwarding
+            webhook_url: Webhook endpoint URL
+            user_id: Associated user ID
+
+        Returns:
+            Created WorkerApp, or None if the user already has a worker app
+        """
+        taken = select(WorkerApp.id).where(WorkerApp.user_id == user_id).correlate(None)
+        result = await self.session.execute(
+            insert(WorkerApp)
+            .from_select(
+                [WorkerApp.id, WorkerApp.base_url, WorkerApp.webhook_url, WorkerApp.user_id],
+                select(
+                    literal(uuid7(), WorkerApp.id.type),
+                    literal(base_url, WorkerApp.base_url.type),
+                    literal(webhook_url, WorkerApp.webhook_url.type),
+                    literal(user_id, WorkerApp.user_id.type),
+                ).where(~taken.exists()),
+            )
+            .returning(WorkerApp)
+        )
+        return result.scalar_one_or_none()
+
+    async def update_by_id(
+        self, worker_app_id: UUID, values: dict[str, Any]
+    ) -> Optional[WorkerApp]:
+        """
+        Update worker app columns with a single UPDATE ... RETURNING.
+
+        Args:
+            worker_app_id: Worker app ID
+            values: Column values to set
+
+        Returns:
+            Updated WorkerApp if found, None otherwise
+        """
+        if not values:
+            return await self.get_by_id(worker_app_id)
+
+        result = await self.session.execute(
+            update(WorkerApp)
+            .where(WorkerApp.id == worker_app_id)
+            .values(**values)
+            .returning(WorkerApp)
+        )
+        return result.scalar_one_or_none()
+
+    async def delete_by_id(self, worker_app_id: UUID) -> bool:
+        """
+        Delete a worker app and its webhook logs without loading them.
+
+        Issues one bulk DELETE per table instead of the ORM cascade, which
+        would select every related log and delete it row by row.
+
+        Args:
+            worker_app_id: Worker app ID
+
+        Returns:
+            True if the worker app existed and was deleted, False otherwise
+        """
+        await self.session.execute(
+            delete(WebhookLog).where(WebhookLog.worker_app_id == worker_app_id)
+        )
+        result = await self.session.execute(
+            delete(WorkerApp).where(WorkerApp.id == worker_app_id)
+        )
+        return result.rowcount > 0
@@ -0,0 +1,19 @@
+"""Response classes shared by the API routers."""
+
+from typing import Any
+
+import pydantic_core
+from fastapi.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered by pydantic-core's Rust serializer.
+
+    Output is compact UTF-8 like Starlette's ``JSONResponse`` but skips the
+    stdlib ``json`` encoder, and ``datetime``/``UUID`` values serialize
+    natively instead of through Python fallbacks.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content)
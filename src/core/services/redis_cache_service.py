@@ -1,10 +1,13 @@
 """Redis cache service for caching worker app lookups."""
 
+import asyncio
 import inspect
-import json
 import logging
+import time
+from contextlib import suppress
 from typing import Any, Optional
 
+import pydantic_core
 import redis.asyncio as redis_async
 from redis.asyncio import Redis
 from redis.exceptions import RedisError
@@ -19,6 +22,8 @@ class RedisCacheService:
         self,
         redis_url: Optional[str],
         default_ttl: int = 86400,  # 24 hours
+        socket_timeout: float = 1.0,
+        retry_after: float = 5.0,
     ):
         """
         Initialize Redis cache service.
@@ -26,16 +31,57 @@ class RedisCacheService:
         Args:
             redis_url: Redis connection URL (e.g., redis://localhost:6379/0)
             default_ttl: Default TTL in seconds for cached items
+            socket_timeout: Seconds to wait when connecting and for each reply
+            retry_after: Seconds to skip Redis after a failed connect
         """
         self.redis_url = redis_url.strip() if redis_url else None
         self.default_ttl = default_ttl
+        self.socket_timeout = socket_timeout
+        self.retry_after = retry_after
         self._client: Optional[Redis] = None
+        # When the last connect failed; callers skip Redis (and fall through
+        # to the database) until ``retry_after`` has passed
+        self._failed_at = float("-inf")
+        # Serializes lazy (re)connects so concurrent callers open one client
+        self._connect_lock = asyncio.Lock()
+        # Last health check result, reused for ``ping``'s max_age window
+        self._last_ping_at = float("-inf")
+        self._last_ping_ok = False
 
     @property
     def is_configured(self) -> bool:
         """Check whether Redis caching is configured."""
         return bool(self.redis_url)
 
+    @property
+    def is_connected(self) -> bool:
+        """Check whether a Redis client is currently open."""
+        return self._client is not None
+
+    async def ping(self, max_age: float = 5.0, timeout: float = 1.0) -> bool:
+        """
+        Check that Redis answers, pinging at most once per ``max_age`` seconds.
+
+        Args:
+            max_age: Seconds a previous result is reused for
+            timeout: Seconds to wait for the reply
+
+        Returns:
+            True if Redis replied to the latest check
+        """
+        now = time.monotonic()
+        if now - self._last_ping_at < max_age:
+            return self._last_ping_ok
+        self._last_ping_at = now
+        try:
+            client = await asyncio.wait_for(self.get_client(), timeout)
+            ok = client is not None and bool(await asyncio.wait_for(client.ping(), timeout))
+        except (RedisError, OSError, asyncio.TimeoutError) as e:
+            logger.warning(f"Redis health check failed: {e}")
+            ok = False
+        self._last_ping_ok = ok
+        return ok
+
     async def connect(self) -> None:
         """Establish connection to Redis."""
         if not self.is_configured:
@@ -43,19 +89,30 @@ class RedisCacheService:
             return
 
         if self._client is None:
+            client = None
             try:
+                # Bounded timeouts so a blackholed Redis fails fast instead of
+                # holding every caller for the OS connect timeout
                 client = redis_async.from_url(
                     self.redis_url,
                     encoding="utf-8",
                     decode_responses=True,
+                    socket_connect_timeout=self.socket_timeout,
+                    socket_timeout=self.socket_timeout,
                 )
                 if inspect.isawaitable(client):
                     client = await client
+                await client.ping()
+                # Kept only once Redis answers, so a failed attempt is retried
+                # by a get_client() call after the cooldown
                 self._client = client
-                await self._client.ping()
                 logger.info("Redis connection established successfully")
             except RedisError as e:
+                self._failed_at = time.monotonic()
                 logger.warning(f"Failed to connect to Redis: {e}")
+                if client is not None:
+                    with suppress(Exception):
+                        await client.close()
                 raise
 
     async def disconnect(self) -> None:
@@ -67,14 +124,25 @@ class RedisCacheService:
 
     async def get_client(self) -> Optional[Redis]:
         """Get Redis client, connecting if necessary."""
-        if not self.is_configured:
+        # Fast path once connected: a single attribute read per cache call
+        client = self._client
+        if client is not None or not self.is_configured:
+            return client
+        # While Redis is known to be down, skip it without queueing on the
+        # lock behind a connect attempt; checked again under the lock for
+        # callers that were already waiting when the attempt failed
+        if time.monotonic() - self._failed_at < self.retry_after:
             return None
 
-        if self._client is None:
-            await self.connect()
+        async with self._connect_lock:
+            if self._client is None:
+                if time.monotonic() - self._failed_at < self.retry_after:
+                    return None
+                await self.connect()
         return self._client
 
-    # Worker app caching methods
+    # Worker app caching methods. These run on every routed webhook, so debug
+    # messages take lazy %-style arguments: with DEBUG off, nothing is formatted
     async def get_worker_app(self, account_id: str) -> Optional[dict]:
         """
         Get worker app configuration for an account_id from cache.
@@ -94,13 +162,13 @@ class RedisCacheService:
             data = await client.get(key)
 
             if data:
-                logger.debug(f"Cache HIT: worker_app for account_id={account_id}")
-                return json.loads(data)
+                logger.debug("Cache HIT: worker_app for account_id=%s", account_id)
+                return pydantic_core.from_json(data)
             else:
-                logger.debug(f"Cache MISS: worker_app for account_id={account_id}")
+                logger.debug("Cache MISS: worker_app for account_id=%s", account_id)
                 return None
 
-        except (RedisError, json.JSONDecodeError, TypeError) as e:
+        except (RedisError, ValueError, TypeError) as e:
             logger.warning(f"Redis error getting worker app: {e}")
             return None
 
@@ -129,8 +197,9 @@ class RedisCacheService:
             key = self._worker_app_key(account_id)
             ttl = ttl or self.default_ttl
 
-            await client.set(key, json.dumps(worker_app_data), ex=ttl)
-            logger.debug(f"Cached worker_app for account_id={account_id} (TTL={ttl}s)")
+            # Encoded straight to UTF-8 bytes in one pass; redis sends bytes as-is
+            await client.set(key, pydantic_core.to_json(worker_app_data), ex=ttl)
+            logger.debug("Cached worker_app for account_id=%s (TTL=%ss)", account_id, ttl)
             return True
 
         except (RedisError, TypeError, ValueError) as e:
@@ -156,7 +225,7 @@ class RedisCacheService:
             result = await client.delete(key)
 
             if result > 0:
-                logger.debug(f"Deleted cache: worker_app for account_id={account_id}")
+                logger.debug("Deleted cache: worker_app for account_id=%s", account_id)
                 return True
             return False
 
@@ -204,18 +273,6 @@ class RedisCacheService:
             logger.warning(f"Redis error on delete({key}): {e}")
             return False
 
-    async def ping(self) -> bool:
-        """Check if Redis is reachable."""
-        try:
-            client = await self.get_client()
-            if client is None:
-                return False
-
-            await client.ping()
-            return True
-        except RedisError:
-            return False
-
     # Key generation helpers
     @staticmethod
     def _worker_app_key(account_id: str) -> str:
@@ -9,6 +9,7 @@ import logging
 import secrets
 import uuid
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Optional
 
 import jwt
@@ -130,11 +131,11 @@ def get_password_hash(password: str) -> str:
 
 def create_access_token(data: dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     settings = get_settings()
-    to_encode = data.copy()
     expire = datetime.now(timezone.utc) + (
         expires_delta or timedelta(minutes=settings.jwt.expire_minutes)
     )
-    to_encode.update({"exp": expire})
+    # One merge builds the claims; the caller's dict is left untouched
+    to_encode = {**data, "exp": expire}
     return jwt.encode(to_encode, settings.security.secret_key, algorithm=settings.jwt.algorithm)
 
 
@@ -166,6 +167,45 @@ def decode_access_token(token: str) -> dict[str, Any]:
     return jwt.decode(token, settings.security.secret_key, algorithms=[settings.jwt.algorithm])
 
 
+@lru_cache(maxsize=8)
+def _hmac_prototype(secret: bytes, algorithm: str) -> hmac.HMAC:
+    """Keyed HMAC state for ``secret``; callers ``copy()`` it instead of re-keying."""
+    return hmac.new(secret, digestmod=algorithm)
+
+
+def verify_hub_signature(
+    body: bytes,
+    signature: str,
+    secret: bytes,
+    algorithm: str = "sha256",
+) -> bool:
+    """
+    Validate a Meta ``X-Hub-Signature``/``X-Hub-Signature-256`` header value.
+
+    ``signature`` is expected as ``"<algorithm>=<hex digest>"``. The digest is
+    decoded once and compared as raw bytes in constant time, whatever its
+    length or encoding. The key schedule (padding and inner/outer XOR) is
+    computed once per secret and copied.
+    """
+    prefix = f"{algorithm}="
+    if not signature.startswith(prefix):
+        return False
+    try:
+        provided = bytes.fromhex(signature[len(prefix):])
+    except ValueError:
+        provided = b""
+
+    mac = _hmac_prototype(secret, algorithm).copy()
+    mac.update(body)
+    expected = mac.digest()
+    # compare_digest returns early on a length mismatch; compare a value padded
+    # or cut to the digest size and check the length afterwards, so the work
+    # done does not depend on what the caller sent
+    size = len(expected)
+    matches = hmac.compare_digest(expected, (provided + bytes(size))[:size])
+    return matches and len(provided) == size
+
+
 class TokenDecodeError(Exception):
     """Raised when an access token cannot be decoded."""
 
@@ -0,0 +1,116 @@
+"""Background writer that batches webhook audit log inserts."""
+
+import asyncio
+import logging
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.repositories.webhook_log_repository import WebhookLogRepository
+
+logger = logging.getLogger(__name__)
+
+
+class WebhookLogWriter:
+    """
+    Queue webhook log rows and insert them in batches off the request path.
+
+    Producers call ``submit`` which never awaits; ``run`` drains the queue
+    into one multi-row INSERT and one commit per batch. A batch is written
+    once ``batch_size`` rows are queued or ``flush_interval`` seconds after
+    its first row, whichever comes first. Several ``run`` tasks may consume
+    the same queue, each writing its batches in its own session.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        max_queue_size: int = 10_000,
+        batch_size: int = 100,
+        flush_interval: float = 0.05,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            session_factory: Factory returning a new AsyncSession per batch
+            max_queue_size: Rows held in memory before ``submit`` refuses more
+            batch_size: Maximum rows per INSERT
+            flush_interval: Seconds to wait for a batch to fill up
+        """
+        self.session_factory = session_factory
+        self.batch_size = max(batch_size, 1)
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        # Batches being collected or written by ``run`` tasks, kept so
+        # ``drain`` can still write them if a task is cancelled mid-batch
+        self._in_flight: dict[int, list[dict]] = {}
+        self._queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=max_queue_size)
+
+    def submit(self, row: dict) -> bool:
+        """
+        Queue a log row without waiting.
+
+        Args:
+            row: Column values for a WebhookLog
+
+        Returns:
+            False when the queue is full and the caller must write the row itself
+        """
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    def pending(self) -> int:
+        """Number of rows waiting to be written, including batches in progress."""
+        return self._queue.qsize() + sum(len(batch) for batch in self._in_flight.values())
+
+    async def run(self) -> None:
+        """Write queued rows in batches until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            self._in_flight[id(batch)] = batch
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                # Rows already queued are taken directly; a timed wait (and
+                # its timer) is only needed once the queue runs dry
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._write(batch)
+            del self._in_flight[id(batch)]
+
+    async def drain(self) -> None:
+        """Write every row still queued; called on shutdown after ``run`` is cancelled."""
+        in_flight = list(self._in_flight.values())
+        self._in_flight.clear()
+        for batch in in_flight:
+            await self._write(batch)
+        while not self._queue.empty():
+            batch = []
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            await self._write(batch)
+
+    async def _write(self, batch: list[dict]) -> None:
+        try:
+            async with self.session_factory() as session:
+                await WebhookLogRepository(session).create_many(batch)
+                await session.commit()
+        except Exception as e:
+            # Connection errors at checkout surface unwrapped (e.g. OSError);
+            # anything escaping here would end the ``run`` task for good
+            self.dropped += len(batch)
+            logger.error(f"Failed to write {len(batch)} webhook log(s): {e}")
+        else:
+            logger.debug("Wrote %s webhook log(s)", len(batch))
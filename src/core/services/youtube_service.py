@@ -30,6 +30,8 @@ class YouTubeService:
     PROVIDER = "youtube"
     TOKEN_URL = "https://oauth2.googleapis.com/token"
     CHANNELS_URL = "https://www.googleapis.com/youtube/v3/channels"
+    # Fixed query for the authorized user's own channel; httpx only reads it
+    CHANNEL_ID_PARAMS = {"part": "id", "mine": "true"}
 
     def __init__(
         self,
@@ -134,11 +136,12 @@ class YouTubeService:
             )
 
     async def _fetch_channel_id(self, access_token: str) -> Optional[str]:
-        params = {"part": "id", "mine": "true"}
         headers = {"Authorization": f"Bearer {access_token}"}
 
         async with self._http_client(timeout=20.0) as client:
-            resp = await client.get(self.CHANNELS_URL, params=params, headers=headers)
+            resp = await client.get(
+                self.CHANNELS_URL, params=self.CHANNEL_ID_PARAMS, headers=headers
+            )
             if resp.status_code == 403 and "quotaExceeded" in resp.text:
                 raise QuotaExceeded("YouTube quota exceeded")
             if resp.status_code != 200:
@@ -1,15 +1,20 @@
 """Use case for forwarding webhooks to worker apps."""
 
+import asyncio
 import logging
 import time
-from uuid import uuid4
+from contextlib import nullcontext
+from typing import Optional
 
 import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.models.webhook_log import WebhookLog
 from src.core.models.worker_app import WorkerApp
 from src.core.repositories.webhook_log_repository import WebhookLogRepository
+from src.core.services.webhook_log_writer import WebhookLogWriter
+from src.core.utils.concurrency import KeyedSemaphore
+from src.core.utils.ttl_cache import TTLCache
+from src.core.utils.ids import new_id
 
 logger = logging.getLogger(__name__)
 
@@ -23,9 +28,21 @@ class ForwardWebhookUseCase:
         self,
         session: AsyncSession,
         http_timeout: float = 30.0,
+        log_writer: Optional[WebhookLogWriter] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        forward_limiter: Optional[KeyedSemaphore] = None,
+        unreachable_workers: Optional[TTLCache] = None,
     ):
         self.session = session
         self.http_timeout = http_timeout
+        self.log_writer = log_writer
+        # Shared keep-alive client from app startup; without one a client is
+        # opened per request
+        self.http_client = http_client
+        self.forward_limiter = forward_limiter
+        # URLs that timed out or refused a connection within the cooldown window;
+        # each forward doubles as a health probe, so no separate probing is needed
+        self.unreachable_workers = unreachable_workers
         self.log_repo = WebhookLogRepository(session)
 
     async def execute(
@@ -54,8 +71,59 @@ class ForwardWebhookUseCase:
                 - processing_time_ms (int): Processing time in milliseconds
                 - error (str): Error message (if success=False)
         """
-        start_time = time.time()
-        webhook_id = str(uuid4())
+        result, log_row = await self._forward_timed(
+            worker_app=worker_app,
+            webhook_payload=webhook_payload,
+            account_id=account_id,
+            owner_username=owner_username,
+            original_headers=original_headers,
+            raw_payload=raw_payload,
+        )
+        await self._write_log_rows([log_row])
+        return result
+
+    async def execute_many(self, forwards: list[dict]) -> list[dict]:
+        """
+        Forward several webhooks concurrently and log them together.
+
+        Every POST is sent before any response is awaited, so a webhook
+        carrying several comments waits for the slowest worker app instead
+        of the sum of all of them. The audit rows are written in one batch
+        afterwards, keeping the shared session out of the concurrent part.
+
+        Args:
+            forwards: Keyword arguments for ``execute``, one dict per forward
+
+        Returns:
+            Results in the same order as ``forwards``
+        """
+        if len(forwards) == 1:
+            return [await self.execute(**forwards[0])]
+
+        outcomes = await asyncio.gather(
+            *(self._forward_timed(**forward) for forward in forwards)
+        )
+        await self._write_log_rows([log_row for _, log_row in outcomes])
+        return [result for result, _ in outcomes]
+
+    async def _forward_timed(
+        self,
+        worker_app: WorkerApp,
+        webhook_payload: dict,
+        account_id: str,
+        owner_username: str | None = None,
+        original_headers: dict[str, str] | None = None,
+        raw_payload: bytes | None = None,
+    ) -> tuple[dict, dict]:
+        """
+        Forward one webhook and build its audit log row without writing it.
+
+        Returns:
+            Tuple of the forwarding result and the WebhookLog column values
+        """
+        # Monotonic, integer nanoseconds: immune to wall-clock adjustments
+        start_ns = time.perf_counter_ns()
+        webhook_id = new_id()
 
         try:
             # For now, implement HTTP forwarding
@@ -68,42 +136,32 @@ class ForwardWebhookUseCase:
                 raw_payload=raw_payload,
             )
 
-            processing_time_ms = int((time.time() - start_time) * 1000)
+            processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             result["processing_time_ms"] = processing_time_ms
-
-            # Log the forwarding attempt
-            await self._create_log_entry(
-                webhook_id=webhook_id,
-                account_id=account_id,
-                worker_app=worker_app,
-                owner_username=owner_username,
-                result=result,
-                processing_time_ms=processing_time_ms,
-            )
-
-            return result
+            log_result = result
 
         except Exception as e:
             logger.exception(f"Unexpected error forwarding webhook: {e}")
-            processing_time_ms = int((time.time() - start_time) * 1000)
-
-            # Log the failure
-            await self._create_log_entry(
-                webhook_id=webhook_id,
-                account_id=account_id,
-                worker_app=worker_app,
-                owner_username=owner_username,
-                result={"success": False, "error": str(e)},
-                processing_time_ms=processing_time_ms,
-            )
-
-            return {
+            processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            error = str(e)
+            log_result = {"success": False, "error": error}
+            result = {
                 "success": False,
                 "method": "http",
-                "error": f"Unexpected error: {str(e)}",
+                "error": f"Unexpected error: {error}",
                 "processing_time_ms": processing_time_ms,
             }
 
+        log_row = self._build_log_row(
+            webhook_id=webhook_id,
+            account_id=account_id,
+            worker_app=worker_app,
+            owner_username=owner_username,
+            result=log_result,
+            processing_time_ms=processing_time_ms,
+        )
+        return result, log_row
+
     async def _forward_via_http(
         self,
         worker_app: WorkerApp,
@@ -130,50 +188,40 @@ class ForwardWebhookUseCase:
             original_headers=original_headers,
         )
 
-        try:
-            async with httpx.AsyncClient(timeout=self.http_timeout) as client:
-                if raw_payload is not None:
-                    response = await client.post(
-                        url,
-                        content=raw_payload,
-                        headers=headers,
-                    )
-                else:
-                    response = await client.post(
-                        url,
-                        json=webhook_payload,
-                        headers=headers,
-                    )
+        # Forward the signed bytes untouched when available
+        if raw_payload is not None:
+            body_kwargs = {"content": raw_payload}
+        else:
+            body_kwargs = {"json": webhook_payload}
+
+        if self.unreachable_workers is not None and self.unreachable_workers.get(url):
+            logger.warning(
+                "Skipping forward to recently unreachable worker_app_id=%s (webhook_url=%s)",
+                worker_app.id,
+                url,
+            )
+            return {
+                "success": False,
+                "method": "http",
+                "error": "Worker app unreachable (cooling down after a recent failure)",
+            }
 
-                if response.status_code in (200, 201, 202, 204):
-                    logger.info(
-                        "Forwarded webhook to %s (%s) status=%s",
-                        worker_app.id,
-                        url,
-                        response.status_code,
+        slot = self.forward_limiter.acquire(url) if self.forward_limiter else nullcontext()
+        try:
+            async with slot:
+                if self.http_client is not None:
+                    response = await self.http_client.post(
+                        url, headers=headers, timeout=self.http_timeout, **body_kwargs
                     )
-                    return {
-                        "success": True,
-                        "method": "http",
-                        "status_code": response.status_code,
-                        "response_text": response.text[:500] if response.text else None,
-                    }
                 else:
-                    logger.warning(
-                        "Worker app responded with non-success status: worker_app_id=%s webhook_url=%s status=%s",
-                        worker_app.id,
-                        url,
-                        response.status_code,
-                    )
-                    return {
-                        "success": False,
-                        "method": "http",
-                        "status_code": response.status_code,
-                        "error": f"Worker app returned {response.status_code}",
-                        "response_text": response.text[:500] if response.text else None,
-                    }
-
-        except httpx.TimeoutException:
+                    async with httpx.AsyncClient(timeout=self.http_timeout) as client:
+                        response = await client.post(url, headers=headers, **body_kwargs)
+
+        except httpx.TimeoutException as e:
+            # Only a failed connect means the worker is down; a read/write
+            # timeout is a slow worker and a pool timeout is our own backlog
+            if isinstance(e, httpx.ConnectTimeout):
+                self._mark_unreachable(url)
             logger.error(
                 "Timeout forwarding to worker_app_id=%s (webhook_url=%s)",
                 worker_app.id,
@@ -186,6 +234,8 @@ class ForwardWebhookUseCase:
             }
 
         except httpx.RequestError as e:
+            if isinstance(e, httpx.ConnectError):
+                self._mark_unreachable(url)
             logger.error(
                 "Request error forwarding to worker_app_id=%s (webhook_url=%s): %s",
                 worker_app.id,
@@ -198,6 +248,39 @@ class ForwardWebhookUseCase:
                 "error": f"Request error: {str(e)}",
             }
 
+        if response.status_code in (200, 201, 202, 204):
+            logger.info(
+                "Forwarded webhook to %s (%s) status=%s",
+                worker_app.id,
+                url,
+                response.status_code,
+            )
+            return {
+                "success": True,
+                "method": "http",
+                "status_code": response.status_code,
+                "response_text": response.text[:500] if response.text else None,
+            }
+
+        logger.warning(
+            "Worker app responded with non-success status: worker_app_id=%s webhook_url=%s status=%s",
+            worker_app.id,
+            url,
+            response.status_code,
+        )
+        return {
+            "success": False,
+            "method": "http",
+            "status_code": response.status_code,
+            "error": f"Worker app returned {response.status_code}",
+            "response_text": response.text[:500] if response.text else None,
+        }
+
+    def _mark_unreachable(self, url: str) -> None:
+        """Start the failure cooldown for ``url`` when one is configured."""
+        if self.unreachable_workers is not None:
+            self.unreachable_workers.set(url, True)
+
     def _prepare_forward_headers(
         self,
         webhook_id: str,
@@ -231,7 +314,7 @@ class ForwardWebhookUseCase:
 
         return headers
 
-    async def _create_log_entry(
+    def _build_log_row(
         self,
         webhook_id: str,
         account_id: str,
@@ -239,9 +322,9 @@ class ForwardWebhookUseCase:
         owner_username: str | None,
         result: dict,
         processing_time_ms: int,
-    ) -> None:
+    ) -> dict:
         """
-        Create audit log entry for webhook forwarding.
+        Build the audit log row for a webhook forwarding attempt.
 
         Args:
             webhook_id: Unique webhook identifier
@@ -249,23 +332,44 @@ class ForwardWebhookUseCase:
             worker_app: WorkerApp configuration
             result: Forwarding result dict
             processing_time_ms: Processing time in milliseconds
+
+        Returns:
+            Column values for a WebhookLog
         """
-        try:
-            log_entry = WebhookLog(
-                webhook_id=webhook_id,
-                account_id=account_id,
-                worker_app_id=worker_app.id,
-                target_owner_username=owner_username,
-                target_base_url=worker_app.webhook_url or worker_app.base_url,
-                status="success" if result.get("success") else "failed",
-                error_message=result.get("error"),
-                processing_time_ms=processing_time_ms,
+        return {
+            "webhook_id": webhook_id,
+            "account_id": account_id,
+            "worker_app_id": worker_app.id,
+            "target_owner_username": owner_username,
+            "target_base_url": worker_app.webhook_url or worker_app.base_url,
+            "status": "success" if result.get("success") else "failed",
+            "error_message": result.get("error"),
+            "processing_time_ms": processing_time_ms,
+        }
+
+    async def _write_log_rows(self, rows: list[dict]) -> None:
+        """
+        Persist audit log rows for webhook forwarding.
+
+        Args:
+            rows: Column values built by ``_build_log_row``
+        """
+        # Hand the rows to the background writer; write inline only those it
+        # cannot take (no writer, or its queue is full)
+        if self.log_writer is not None:
+            rejected = [row for row in rows if not self.log_writer.submit(row)]
+            if not rejected:
+                return
+            logger.warning(
+                "Webhook log queue full, writing %s log(s) inline", len(rejected)
             )
+            rows = rejected
 
-            self.session.add(log_entry)
+        try:
+            await self.log_repo.create_many(rows)
             await self.session.commit()
 
-            logger.debug(f"Created webhook log: webhook_id={webhook_id}")
+            logger.debug("Created %s webhook log(s)", len(rows))
 
         except Exception as e:
             logger.error(f"Failed to create webhook log: {e}")
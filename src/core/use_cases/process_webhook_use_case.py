@@ -1,9 +1,12 @@
 """Main use case for processing Instagram webhooks."""
 
+import asyncio
 import logging
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 from uuid import UUID
 
+import pydantic_core
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.models.instagram_comment import InstagramComment
@@ -13,9 +16,18 @@ from src.core.repositories.oauth_token_repository import OAuthTokenRepository
 from src.core.repositories.worker_app_repository import WorkerAppRepository
 from src.core.services.redis_cache_service import RedisCacheService
 from src.core.use_cases.forward_webhook_use_case import ForwardWebhookUseCase
+from src.core.utils.concurrency import SingleFlight
+from src.core.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Read-only stand-in for missing nested objects while extracting comments
+_EMPTY: Mapping = MappingProxyType({})
+
+# Redis cache fills still in flight; holding a reference keeps each task
+# alive until it finishes
+_cache_fills: set[asyncio.Task] = set()
+
 
 class ProcessWebhookUseCase:
     """
@@ -35,10 +47,14 @@ class ProcessWebhookUseCase:
         session: AsyncSession,
         forward_webhook_uc: ForwardWebhookUseCase,
         redis_cache: Optional[RedisCacheService] = None,
+        local_cache: Optional[TTLCache] = None,
+        routing_flight: Optional[SingleFlight] = None,
     ):
         self.session = session
         self.forward_webhook_uc = forward_webhook_uc
         self.redis_cache = redis_cache
+        self.local_cache = local_cache
+        self.routing_flight = routing_flight
         self.worker_app_repo = WorkerAppRepository(session)
         self.comment_repo = InstagramCommentRepository(session)
         self.oauth_token_repo = OAuthTokenRepository(session)
@@ -72,7 +88,7 @@ class ProcessWebhookUseCase:
         # Extract all comments from webhook
         try:
             comments = self._extract_comments(webhook_payload)
-            logger.info(f"Extracted {len(comments)} comment(s) from webhook")
+            logger.info("Extracted %s comment(s) from webhook", len(comments))
 
         except Exception as e:
             logger.error(f"Failed to extract comments from webhook: {e}")
@@ -83,35 +99,103 @@ class ProcessWebhookUseCase:
                 "errors": [f"Failed to extract comments: {str(e)}"],
             }
 
-        # Process each comment
+        # Nothing to route (e.g. only mentions or the owner's own replies)
+        if not comments:
+            return {
+                "success": True,
+                "comments_processed": 0,
+                "comments_skipped": 0,
+                "duplicates": 0,
+                "errors": None,
+                "last_success": None,
+            }
+
+        # Encode the payload once for every forward below when the signed
+        # bytes were not passed through
+        if raw_payload is None:
+            raw_payload = pydantic_core.to_json(webhook_payload)
+
+        # Check every comment for an earlier delivery in one query instead of
+        # one round trip per comment; if it fails, each comment checks itself
+        known_ids: Optional[set[str]] = None
+        if len(comments) > 1:
+            try:
+                known_ids = await self.comment_repo.get_existing_comment_ids(
+                    comment["comment_id"] for comment in comments if comment.get("comment_id")
+                )
+            except Exception as e:
+                logger.warning(f"Batched duplicate check failed, checking per comment: {e}")
+                await self.session.rollback()
+
+        # Resolve the targets of every account in the webhook up front, in one
+        # query when several of them miss the local cache. A single comment has
+        # a single account, so the set is only built for multi-comment webhooks
+        routes: dict[str, tuple[Optional[WorkerApp], Optional[str]]] = {}
+        if len(comments) > 1:
+            account_ids = frozenset(
+                comment["account_id"] for comment in comments if comment.get("account_id")
+            )
+            if len(account_ids) > 1:
+                try:
+                    await self._prefetch_routes(account_ids, routes)
+                except Exception as e:
+                    logger.warning(f"Bulk routing lookup failed, resolving per account: {e}")
+                    await self.session.rollback()
+
+        # Route each comment; storing and forwarding happen once for all of them
+        results: list[dict] = []
+        routed: list[dict] = []
+        routed_ids: set[str] = set()
         for comment_data in comments:
+            # A comment repeated within one webhook is stored and forwarded once
+            if comment_data.get("comment_id") in routed_ids:
+                results.append(
+                    {"success": True, "duplicate": True, "comment_id": comment_data["comment_id"]}
+                )
+                continue
             try:
-                result = await self._process_single_comment(
+                result = await self._route_single_comment(
                     comment_data,
                     webhook_payload,
                     original_headers=original_headers,
                     raw_payload=raw_payload,
+                    routes=routes,
+                    known_ids=known_ids,
                 )
-
-                if result.get("success"):
-                    if result.get("duplicate"):
-                        duplicates += 1
-                    else:
-                        comments_processed += 1
-                        last_success_result = result
-                else:
-                    comments_skipped += 1
-                    if error := result.get("error"):
-                        errors.append(error)
-
             except Exception as e:
                 logger.exception(f"Unexpected error processing comment: {e}")
+                result = {"success": False, "error": f"Unexpected error: {str(e)}"}
+
+            if "forward" in result:
+                routed.append(result)
+                routed_ids.add(result["comment_id"])
+            else:
+                results.append(result)
+
+        if routed:
+            await self._store_comments([route["comment_data"] for route in routed])
+
+            # Send all forwards before awaiting any response, so worker apps are
+            # waited on concurrently rather than one after another
+            forward_results = await self.forward_webhook_uc.execute_many(
+                [route["forward"] for route in routed]
+            )
+            for route, forward_result in zip(routed, forward_results):
+                results.append(self._forward_outcome(route, forward_result))
+
+        for result in results:
+            if result.get("success"):
+                if result.get("duplicate"):
+                    duplicates += 1
+                else:
+                    comments_processed += 1
+                    last_success_result = result
+            else:
                 comments_skipped += 1
-                errors.append(f"Unexpected error: {str(e)}")
+                if error := result.get("error"):
+                    errors.append(error)
 
-        success = not errors and (
-            comments_processed > 0 or duplicates > 0 or len(comments) == 0
-        )
+        success = not errors and (comments_processed > 0 or duplicates > 0)
 
         return {
             "success": success,
@@ -122,31 +206,42 @@ class ProcessWebhookUseCase:
             "last_success": last_success_result,
         }
 
-    async def _process_single_comment(
+    async def _route_single_comment(
         self,
         comment_data: dict,
         webhook_payload: dict,
         original_headers: dict[str, str] | None = None,
         raw_payload: bytes | None = None,
+        routes: dict[str, tuple[Optional[WorkerApp], Optional[str]]] | None = None,
+        known_ids: set[str] | None = None,
     ) -> dict:
         """
-        Process a single comment from webhook.
+        Check and route a single comment ahead of storing and forwarding it.
 
         Args:
             comment_data: Extracted comment data
             webhook_payload: Full webhook payload for forwarding
             original_headers: Original webhook headers to reuse
+            routes: Per-webhook memo of routing targets by account_id
+            known_ids: Comment IDs already stored, when checked up front for the
+                whole webhook; without it the comment is looked up on its own
 
         Returns:
-            dict with success status and details
+            dict with success status and details, or a ``forward`` entry
+            holding the ``ForwardWebhookUseCase.execute`` arguments when the
+            comment still has to be forwarded
         """
         comment_id = comment_data.get("comment_id")
         media_id = comment_data.get("media_id")
         account_id = comment_data.get("account_id")
 
         # Check if comment already processed
-        if await self.comment_repo.exists_by_comment_id(comment_id):
-            logger.debug(f"Comment already exists: comment_id={comment_id}")
+        if known_ids is not None:
+            already_stored = comment_id in known_ids
+        else:
+            already_stored = await self.comment_repo.exists_by_comment_id(comment_id)
+        if already_stored:
+            logger.debug("Comment already exists: comment_id=%s", comment_id)
             return {
                 "success": True,
                 "duplicate": True,
@@ -163,7 +258,12 @@ class ProcessWebhookUseCase:
             }
 
         # Get worker app (with caching)
-        worker_app, owner_username = await self._get_worker_app_cached(account_id)
+        if routes is not None and account_id in routes:
+            worker_app, owner_username = routes[account_id]
+        else:
+            worker_app, owner_username = await self._get_worker_app_cached(account_id)
+            if routes is not None:
+                routes[account_id] = (worker_app, owner_username)
 
         if not worker_app:
             error = f"No worker app found for account_id={account_id}"
@@ -174,25 +274,38 @@ class ProcessWebhookUseCase:
                 "comment_id": comment_id,
             }
 
-        # Store comment in database
-        try:
-            await self._store_comment(comment_data)
-            logger.debug(f"Stored comment: comment_id={comment_id}")
+        return {
+            "comment_id": comment_id,
+            "comment_data": comment_data,
+            "account_id": account_id,
+            "owner_username": owner_username,
+            "worker_app": worker_app,
+            "forward": {
+                "worker_app": worker_app,
+                "webhook_payload": webhook_payload,
+                "account_id": account_id,
+                "owner_username": owner_username,
+                "original_headers": original_headers,
+                "raw_payload": raw_payload,
+            },
+        }
 
-        except Exception as e:
-            logger.error(f"Failed to store comment: {e}")
-            # Don't fail the whole process if storage fails
-            await self.session.rollback()
-
-        # Forward webhook to worker app
-        forward_result = await self.forward_webhook_uc.execute(
-            worker_app=worker_app,
-            webhook_payload=webhook_payload,
-            account_id=account_id,
-            owner_username=owner_username,
-            original_headers=original_headers,
-            raw_payload=raw_payload,
-        )
+    @staticmethod
+    def _forward_outcome(route: dict, forward_result: dict) -> dict:
+        """
+        Turn a forwarding result into the per-comment processing result.
+
+        Args:
+            route: Entry returned by ``_route_single_comment``
+            forward_result: Result of forwarding that comment
+
+        Returns:
+            dict with success status and details
+        """
+        comment_id = route["comment_id"]
+        account_id = route["account_id"]
+        owner_username = route["owner_username"]
+        worker_app = route["worker_app"]
 
         if forward_result.get("success"):
             owner_label = owner_username or "unknown"
@@ -229,10 +342,15 @@ class ProcessWebhookUseCase:
     async def _get_worker_app_cached(
         self, account_id: str
     ) -> tuple[Optional[WorkerApp], Optional[str]]:
-        """Retrieve worker app configuration with optional Redis caching."""
+        """Retrieve worker app configuration with optional in-process and Redis caching."""
         cached_id: Optional[str] = None
         cached_username: Optional[str] = None
 
+        if self.local_cache is not None:
+            local_data = self.local_cache.get(account_id)
+            if local_data is not None:
+                return self._worker_app_from_cache(local_data), local_data.get("username")
+
         if self.redis_cache:
             cached_data = await self.redis_cache.get_worker_app(account_id)
             if cached_data:
@@ -243,6 +361,13 @@ class ProcessWebhookUseCase:
                     try:
                         worker_app = await self.worker_app_repo.get_by_id(UUID(cached_id))
                         if worker_app:
+                            if self.local_cache is not None:
+                                # Redis only vouches for the id; copy the row just read
+                                # so a stale URL in Redis never reaches the local cache
+                                self.local_cache.set(
+                                    account_id,
+                                    self._cache_payload(worker_app, account_id, cached_username),
+                                )
                             return worker_app, cached_username
                     except (ValueError, TypeError):
                         logger.warning(
@@ -250,30 +375,158 @@ class ProcessWebhookUseCase:
                             account_id,
                         )
 
-        # Cache miss or invalid entry -> fetch from DB
-        token = await self.oauth_token_repo.get_by_provider_account_id(
-            "instagram", account_id
+        if self.routing_flight is None:
+            return await self._load_routing_target(account_id)
+
+        # Concurrent misses for one account (a burst of comments on the same
+        # post) share a single lookup. Followers get the leader's row as a
+        # transient WorkerApp, since the loaded one belongs to its session.
+        loaded: dict = {}
+
+        async def _load() -> tuple[Optional[dict], Optional[str]]:
+            worker_app, username = await self._load_routing_target(account_id)
+            loaded["worker_app"] = worker_app
+            if worker_app is None:
+                return None, username
+            return self._cache_payload(worker_app, account_id, username), username
+
+        cache_payload, username = await self.routing_flight.do(account_id, _load)
+        if "worker_app" in loaded:
+            return loaded["worker_app"], username
+        if cache_payload is None:
+            return None, username
+        return self._worker_app_from_cache(cache_payload), username
+
+    async def _prefetch_routes(
+        self,
+        account_ids: frozenset[str],
+        routes: dict[str, tuple[Optional[WorkerApp], Optional[str]]],
+    ) -> None:
+        """
+        Fill ``routes`` for several accounts with at most one database query.
+
+        Local cache hits are taken as they are. When two or more accounts
+        miss, their targets are loaded together and the caches filled; a
+        single miss is left to the usual per-account path.
+
+        Args:
+            account_ids: Distinct account IDs in the webhook
+            routes: Per-webhook memo of routing targets by account_id
+        """
+        missing: list[str] = []
+        for account_id in account_ids:
+            local_data = self.local_cache.get(account_id) if self.local_cache is not None else None
+            if local_data is not None:
+                routes[account_id] = (
+                    self._worker_app_from_cache(local_data),
+                    local_data.get("username"),
+                )
+            else:
+                missing.append(account_id)
+        if len(missing) < 2:
+            return
+
+        targets = await self.worker_app_repo.get_routing_targets(missing)
+        for account_id in missing:
+            worker_app, username = targets.get(account_id, (None, None))
+            routes[account_id] = (worker_app, username)
+            if worker_app is not None:
+                self._fill_caches(account_id, worker_app, username)
+
+    async def _load_routing_target(
+        self, account_id: str
+    ) -> tuple[Optional[WorkerApp], Optional[str]]:
+        """Fetch the token and worker app in one query and fill the caches."""
+        worker_app, username = await self.worker_app_repo.get_routing_target(account_id)
+        if worker_app is None:
+            return None, username
+
+        self._fill_caches(account_id, worker_app, username)
+        return worker_app, username
+
+    def _fill_caches(
+        self, account_id: str, worker_app: WorkerApp, username: Optional[str]
+    ) -> None:
+        """Store a freshly loaded routing target in the local cache and Redis."""
+        if self.redis_cache or self.local_cache is not None:
+            cache_payload = self._cache_payload(worker_app, account_id, username)
+            if self.local_cache is not None:
+                self.local_cache.set(account_id, cache_payload)
+            if self.redis_cache:
+                # Fill Redis without waiting for its reply; set_worker_app
+                # handles its own errors and a lost write only costs a miss
+                fill = asyncio.create_task(
+                    self.redis_cache.set_worker_app(account_id, cache_payload)
+                )
+                _cache_fills.add(fill)
+                fill.add_done_callback(_cache_fills.discard)
+
+    @staticmethod
+    def _cache_payload(
+        worker_app: WorkerApp, account_id: str, username: Optional[str]
+    ) -> dict:
+        """Serialize the routing fields of a worker app for the caches."""
+        return {
+            "id": str(worker_app.id),
+            "account_id": account_id,
+            "username": username,
+            "base_url": worker_app.base_url,
+            "webhook_url": worker_app.webhook_url,
+            "user_id": str(worker_app.user_id) if worker_app.user_id else None,
+        }
+
+    @staticmethod
+    def _worker_app_from_cache(cache_payload: dict) -> WorkerApp:
+        """Build a transient WorkerApp (not attached to the session) from a cache entry."""
+        user_id = cache_payload.get("user_id")
+        return WorkerApp(
+            id=UUID(cache_payload["id"]),
+            base_url=cache_payload["base_url"],
+            webhook_url=cache_payload["webhook_url"],
+            user_id=UUID(user_id) if user_id else None,
         )
-        if not token or not token.user_id:
-            return None, None
-        worker_app = await self.worker_app_repo.get_by_user_id(token.user_id)
 
-        if worker_app and self.redis_cache:
-            cache_payload = {
-                "id": str(worker_app.id),
-                "account_id": account_id,
-                "username": token.username,
-                "base_url": worker_app.base_url,
-                "webhook_url": worker_app.webhook_url,
-                "user_id": str(worker_app.user_id) if worker_app.user_id else None,
-            }
-            await self.redis_cache.set_worker_app(account_id, cache_payload)
+    async def _store_comments(self, comments: list[dict]) -> None:
+        """
+        Store routed comments, all in one transaction when possible.
+
+        A webhook's comments are inserted with a single commit. If that
+        fails (e.g. one comment raced in from a concurrent delivery), each
+        comment is retried on its own so one bad row does not lose the rest.
+        Storage failures never fail the webhook.
+
+        Args:
+            comments: Extracted comment data for every routed comment
+        """
+        if len(comments) > 1:
+            try:
+                self.session.add_all([self._build_comment(c) for c in comments])
+                await self.session.commit()
+                logger.debug("Stored %s comment(s) in one batch", len(comments))
+                return
+            except Exception as e:
+                logger.warning(f"Batch comment insert failed, storing one by one: {e}")
+                await self.session.rollback()
 
-        return worker_app, token.username
+        for comment_data in comments:
+            try:
+                await self._store_comment(comment_data)
+                logger.debug("Stored comment: comment_id=%s", comment_data["comment_id"])
+
+            except Exception as e:
+                logger.error(f"Failed to store comment: {e}")
+                # Don't fail the whole process if storage fails
+                await self.session.rollback()
 
     async def _store_comment(self, comment_data: dict) -> None:
         """Store comment in database."""
-        comment = InstagramComment(
+        self.session.add(self._build_comment(comment_data))
+        await self.session.commit()
+
+    @staticmethod
+    def _build_comment(comment_data: dict) -> InstagramComment:
+        """Build an InstagramComment row from extracted comment data."""
+        return InstagramComment(
             comment_id=comment_data["comment_id"],
             media_id=comment_data["media_id"],
             owner_id=comment_data["account_id"],
@@ -285,9 +538,6 @@ class ProcessWebhookUseCase:
             raw_webhook_data=comment_data.get("raw_data", {}),
         )
 
-        self.session.add(comment)
-        await self.session.commit()
-
     def _extract_comments(self, webhook_payload: dict) -> list[dict]:
         """
         Extract comment data from Instagram webhook payload.
@@ -299,28 +549,28 @@ class ProcessWebhookUseCase:
             List of comment data dicts
         """
         comments = []
+        # Reported in one warning after the pass instead of one per comment
+        incomplete: list = []
 
-        for entry in webhook_payload.get("entry", []):
+        for entry in webhook_payload.get("entry", ()):
             account_id = entry.get("id")
             entry_timestamp = entry.get("time", 0)
 
-            for change in entry.get("changes", []):
+            for change in entry.get("changes", ()):
                 if change.get("field") != "comments":
                     continue
 
-                value = change.get("value", {})
+                value = change.get("value") or _EMPTY
 
-                # Extract comment info
+                # Extract comment info; optional objects are looked up once and
+                # the shared empty mapping avoids allocating a dict per miss
                 comment_id = value.get("id")
-                media_id = value.get("media", {}).get("id")
-                from_user = value.get("from", {})
+                from_user = value.get("from") or _EMPTY
                 user_id = from_user.get("id")
                 username = from_user.get("username")
-                text = value.get("text", "")
-                parent_id = value.get("parent_id")
 
-                if not all([comment_id, account_id, user_id, username]):
-                    logger.warning(f"Incomplete comment data, skipping: {value}")
+                if not (comment_id and account_id and user_id and username):
+                    incomplete.append(comment_id)
                     continue
 
                 if user_id == account_id:
@@ -333,14 +583,20 @@ class ProcessWebhookUseCase:
 
                 comments.append({
                     "comment_id": comment_id,
-                    "media_id": media_id,
+                    "media_id": (value.get("media") or _EMPTY).get("id"),
                     "account_id": account_id,
                     "user_id": user_id,
                     "username": username,
-                    "text": text,
-                    "parent_id": parent_id,
+                    "text": value.get("text", ""),
+                    "parent_id": value.get("parent_id"),
                     "timestamp": entry_timestamp,
                     "raw_data": value,
                 })
 
+        if incomplete:
+            logger.warning(
+                "Skipped %s comment(s) with incomplete data | comment_ids=%s",
+                len(incomplete),
+                incomplete,
+            )
         return comments
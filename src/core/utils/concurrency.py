@@ -0,0 +1,90 @@
+"""Asyncio concurrency helpers."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class KeyedSemaphore:
+    """Cap concurrent holders per key, e.g. in-flight requests per upstream host.
+
+    A semaphore exists only while a key has holders or waiters, so memory
+    stays proportional to the keys currently in use rather than every key
+    ever seen.
+    """
+
+    def __init__(self, limit: int):
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        self.limit = limit
+        # key -> [semaphore, holders + waiters]
+        self._entries: dict[str, list] = {}
+
+    @asynccontextmanager
+    async def acquire(self, key: str) -> AsyncIterator[None]:
+        """Wait for a slot for ``key`` and hold it for the duration of the block."""
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = [asyncio.Semaphore(self.limit), 0]
+            self._entries[key] = entry
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight await the same result (or exception) instead of repeating
+    the work. Nothing is kept once the call completes, so this is not a
+    cache; pair it with one for completed results.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Future] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn`` for ``key`` unless a call for ``key`` is already running."""
+        future = self._calls.get(key)
+        if future is not None:
+            try:
+                # Shielded so a cancelled follower does not cancel the shared call
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The leader was cancelled, not us: do the work ourselves
+                return await fn()
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved when there are no followers
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+    def __len__(self) -> int:
+        return len(self._calls)
@@ -0,0 +1,43 @@
+"""Time-sortable identifiers for webhook ids, trace ids and primary keys."""
+
+from __future__ import annotations
+
+import os
+import random
+import time
+from uuid import UUID
+
+# Seeded once from the OS; ids need uniqueness, not cryptographic strength
+_rng = random.Random(os.urandom(16))
+
+
+def _reseed() -> None:
+    _rng.seed(os.urandom(16))
+
+
+# Forked workers must not replay the parent's random sequence
+os.register_at_fork(after_in_child=_reseed)
+
+
+def new_id() -> str:
+    """Return a 32-char hex id: 48-bit millisecond timestamp + 80 random bits.
+
+    Ids sort by creation time, which keeps log searches and index inserts ordered.
+    """
+    return f"{time.time_ns() // 1_000_000:012x}{_rng.getrandbits(80):020x}"
+
+
+def uuid7() -> UUID:
+    """Return an RFC 9562 version 7 UUID (48-bit millisecond timestamp first).
+
+    Used as primary key default: new rows land on the right-most B-tree leaf
+    instead of random pages, so inserts do not fragment the index.
+    """
+    value = (
+        (time.time_ns() // 1_000_000) << 80
+        | 0x7 << 76
+        | _rng.getrandbits(12) << 64
+        | 0b10 << 62
+        | _rng.getrandbits(62)
+    )
+    return UUID(int=value)
@@ -0,0 +1,81 @@
+"""In-process token-bucket rate limiting."""
+
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Per-key token bucket refilled continuously from a monotonic clock.
+
+    Tokens are kept as floats so a partial refill carries over to the next
+    call instead of being rounded away. ``allow`` never awaits, so it is
+    atomic with respect to the event loop and needs no lock.
+
+    Keys are spread over ``shards`` independent dicts (a power of two) so
+    maintenance such as pruning can work through one small shard at a time.
+    """
+
+    def __init__(self, capacity: int, refill_per_second: float, shards: int = 16):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if shards < 1 or shards & (shards - 1):
+            raise ValueError("shards must be a power of two")
+        self.capacity = float(capacity)
+        self.rate_per_ns = refill_per_second / 1_000_000_000
+        self._shard_mask = shards - 1
+        # key -> [tokens, last_refill_ns]; a list is mutated in place to avoid
+        # rebuilding a tuple on every request.
+        self._shards: list[dict[str, list]] = [{} for _ in range(shards)]
+
+    def allow(self, key: str) -> bool:
+        """Consume one token for ``key`` and report whether the call is allowed."""
+        now = time.monotonic_ns()
+        buckets = self._shards[hash(key) & self._shard_mask]
+        entry = buckets.get(key)
+        if entry is None:
+            entry = [self.capacity, now]
+            buckets[key] = entry
+        else:
+            tokens = entry[0] + (now - entry[1]) * self.rate_per_ns
+            entry[0] = tokens if tokens < self.capacity else self.capacity
+            entry[1] = now
+
+        if entry[0] >= 1.0:
+            entry[0] -= 1.0
+            return True
+        return False
+
+    def prune(self, idle_ns: Optional[int] = None) -> int:
+        """
+        Drop buckets that have not been used for ``idle_ns`` nanoseconds.
+
+        By default a bucket is dropped once it has been idle long enough to
+        refill completely, at which point it is indistinguishable from a new
+        one. Stale keys are collected before deleting so no shard is mutated
+        while it is being iterated.
+
+        Returns:
+            Number of buckets removed
+        """
+        if idle_ns is None:
+            if self.rate_per_ns <= 0:
+                return 0
+            idle_ns = int(self.capacity / self.rate_per_ns)
+        cutoff = time.monotonic_ns() - idle_ns
+        removed = 0
+        for buckets in self._shards:
+            stale = [key for key, entry in buckets.items() if entry[1] < cutoff]
+            for key in stale:
+                del buckets[key]
+            removed += len(stale)
+        return removed
+
+    def reset(self) -> None:
+        """Forget all tracked keys."""
+        for buckets in self._shards:
+            buckets.clear()
+
+    def __len__(self) -> int:
+        return sum(len(buckets) for buckets in self._shards)
@@ -1,31 +1,98 @@
 """Main FastAPI application for Chatico Mapper App."""
 
-import hashlib
-import hmac
+import asyncio
 import logging
-import os
-import uuid
+import sys
 from contextlib import asynccontextmanager
+from datetime import timedelta
 
+import httpx
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from redis.exceptions import RedisError
 from sqlalchemy import text
 
 from src.api_v1.auth import router as auth_router
 from src.api_v1.google_oauth import router as google_oauth_router
 from src.api_v1.instagram_oauth import router as instagram_oauth_router
+from src.api_v1.monitoring import router as monitoring_router
 from src.api_v1.users import router as users_router
 from src.api_v1.webhook import router as webhook_router
 from src.api_v1.worker_apps import router as worker_apps_router
 from src.core.config import get_settings
-from src.core.logging_config import configure_logging, trace_id_ctx
+from src.core.dependencies import get_webhook_rate_limiter
+from src.core.logging_config import configure_logging
+from src.core.middleware import EdgeMiddleware, WebhookSignatureMiddleware
 from src.core.models.db_helper import db_helper
+from src.core.repositories.webhook_log_repository import WebhookLogRepository
+from src.core.responses import FastJSONResponse
+from src.core.services.redis_cache_service import RedisCacheService
+from src.core.services.webhook_log_writer import WebhookLogWriter
+from src.core.utils.rate_limit import TokenBucket
+from src.core.utils.time import now_utc
 
 # Configure logging based on environment settings early during startup
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# Request-invariant values resolved once at import time
+API_V1_PREFIX = "/api/v1"
+API_V1_ROUTERS = (
+    webhook_router,
+    worker_apps_router,
+    google_oauth_router,
+    instagram_oauth_router,
+    users_router,
+    monitoring_router,
+)
+WEBHOOK_PATH = f"{API_V1_PREFIX}/webhook"
+WEBHOOK_MAX_BODY_SIZE = settings.webhook.max_body_size
+APP_SECRET_BYTES = settings.app_secret.encode("utf-8")
+INTERNAL_ERROR_CONTENT = {
+    "detail": "Internal server error",
+    "type": "internal_error",
+}
+ROOT_PAYLOAD = {
+    "name": settings.app_name,
+    "version": settings.app_version,
+    "status": "running",
+    "docs": "/docs",
+}
+
+
+async def _prune_rate_limiter(rate_limiter: TokenBucket, interval: int) -> None:
+    """Periodically drop idle rate-limiter buckets off the request path."""
+    while True:
+        await asyncio.sleep(interval)
+        removed = rate_limiter.prune()
+        if removed:
+            logger.debug("Pruned %s idle rate-limit bucket(s)", removed)
+
+
+async def _cleanup_webhook_logs(retention_days: int, interval: int, batch_size: int) -> None:
+    """Periodically delete webhook logs older than the retention window."""
+    while True:
+        await asyncio.sleep(interval)
+        cutoff = now_utc() - timedelta(days=retention_days)
+        removed = 0
+        try:
+            async with db_helper.session_factory() as session:
+                repo = WebhookLogRepository(session)
+                # Commit per batch so locks and WAL stay bounded on large backlogs
+                while True:
+                    deleted = await repo.cleanup_old_logs(cutoff, batch_size)
+                    await session.commit()
+                    removed += deleted
+                    if deleted < batch_size:
+                        break
+        except Exception as e:
+            # Connection errors can surface unwrapped (e.g. OSError); keep
+            # sweeping on the next interval instead of ending the task
+            logger.warning(f"Webhook log cleanup failed: {e}")
+        if removed:
+            logger.info("Deleted %s webhook log(s) older than %s", removed, cutoff)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -57,6 +124,64 @@ async def lifespan(app: FastAPI):
         }
         raise
 
+    # Open a single Redis connection shared by all requests. The service is
+    # kept even when Redis is down at startup: get_client() reconnects lazily,
+    # so caching resumes once Redis is back without a restart
+    app.state.redis_cache = None
+    if settings.redis_enabled:
+        redis_cache = RedisCacheService(
+            redis_url=settings.redis_url,
+            default_ttl=settings.redis_ttl,
+        )
+        app.state.redis_cache = redis_cache
+        try:
+            await redis_cache.connect()
+        except RedisError as e:
+            logger.warning(f"Redis unavailable, will retry on demand: {e}")
+
+    # One pooled client for forwarding, so worker app connections (and TLS
+    # sessions) are reused across webhooks instead of opened per request
+    app.state.http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.webhook.forward_max_connections,
+            max_keepalive_connections=settings.webhook.forward_keepalive_connections,
+            keepalive_expiry=30,
+        ),
+    )
+
+    # Periodic maintenance runs in background tasks, off the request path
+    background_tasks: list[asyncio.Task] = []
+    app.state.webhook_log_writer = None
+    if settings.webhook.log_queue_size > 0:
+        log_writer = WebhookLogWriter(
+            db_helper.session_factory,
+            max_queue_size=settings.webhook.log_queue_size,
+            batch_size=settings.webhook.log_batch_size,
+            flush_interval=settings.webhook.log_flush_interval_ms / 1000,
+        )
+        app.state.webhook_log_writer = log_writer
+        # Several consumers share the queue so a slow INSERT does not hold
+        # back the batches queued behind it
+        for _ in range(max(settings.webhook.log_writers, 1)):
+            background_tasks.append(asyncio.create_task(log_writer.run()))
+    rate_limiter = get_webhook_rate_limiter()
+    if rate_limiter is not None and settings.webhook.rate_limit_prune_interval > 0:
+        background_tasks.append(
+            asyncio.create_task(
+                _prune_rate_limiter(rate_limiter, settings.webhook.rate_limit_prune_interval)
+            )
+        )
+    if settings.webhook.log_retention_days > 0 and settings.webhook.log_cleanup_interval > 0:
+        background_tasks.append(
+            asyncio.create_task(
+                _cleanup_webhook_logs(
+                    settings.webhook.log_retention_days,
+                    settings.webhook.log_cleanup_interval,
+                    max(settings.webhook.log_cleanup_batch_size, 1),
+                )
+            )
+        )
+
     logger.info(
         f"Chatico Mapper App started successfully on {settings.host}:{settings.port}"
     )
@@ -66,6 +191,28 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down Chatico Mapper App...")
 
+    for task in background_tasks:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            # A task that died earlier must not skip the cleanup below
+            logger.error(f"Background task failed: {e}")
+
+    # Persist logs still queued before the database pool is closed
+    if app.state.webhook_log_writer is not None:
+        await app.state.webhook_log_writer.drain()
+        app.state.webhook_log_writer = None
+
+    await app.state.http_client.aclose()
+    app.state.http_client = None
+
+    if app.state.redis_cache is not None:
+        await app.state.redis_cache.disconnect()
+        app.state.redis_cache = None
+
     # Close database connections
     await db_helper.dispose()
     logger.info("Database connections closed")
@@ -92,6 +239,7 @@ def create_app() -> FastAPI:
         docs_url=docs_url,
         redoc_url=redoc_url,
         openapi_url=openapi_url,
+        default_response_class=FastJSONResponse,
     )
 
     # ========================================
@@ -108,17 +256,26 @@ def create_app() -> FastAPI:
             allow_headers=settings.cors_allow_headers,
         )
 
+    # Verify X-Hub signatures on webhook POSTs; added after CORS so it runs outside it
+    app.add_middleware(
+        WebhookSignatureMiddleware,
+        path=WEBHOOK_PATH,
+        secret=APP_SECRET_BYTES,
+        max_body_size=WEBHOOK_MAX_BODY_SIZE,
+        offload_threshold=settings.webhook.signature_offload_bytes,
+    )
+    # Outermost: trace id and Host allow-list in one pass, so every response
+    # (including rejections) carries the trace id
+    app.add_middleware(EdgeMiddleware, allowed_hosts=settings.allowed_hosts)
+
     # ========================================
     # Routers
     # ========================================
 
-    # Include API routers
-    app.include_router(webhook_router, prefix="/api/v1")
-    app.include_router(worker_apps_router, prefix="/api/v1")
-    app.include_router(google_oauth_router, prefix="/api/v1")
-    app.include_router(instagram_oauth_router, prefix="/api/v1")
+    # Include API routers directly on the app so each route is compiled once
+    for api_router in API_V1_ROUTERS:
+        app.include_router(api_router, prefix=API_V1_PREFIX)
     app.include_router(auth_router)
-    app.include_router(users_router, prefix="/api/v1")
 
     # ========================================
     # Root Endpoints
@@ -127,12 +284,7 @@ def create_app() -> FastAPI:
     @app.get("/")
     async def root():
         """Root endpoint."""
-        return {
-            "name": settings.app_name,
-            "version": settings.app_version,
-            "status": "running",
-            "docs": "/docs",
-        }
+        return ROOT_PAYLOAD
 
     @app.get("/health")
     async def health(request: Request):
@@ -148,6 +300,18 @@ def create_app() -> FastAPI:
                 "status": "unknown",
                 "services": {},
             }
+
+        redis_cache = getattr(request.app.state, "redis_cache", None)
+        if redis_cache is not None:
+            # Cached ping: a lost connection shows up here within seconds
+            redis_ok = await redis_cache.ping()
+            snapshot = {
+                "status": snapshot["status"] if redis_ok else "degraded",
+                "services": {
+                    **snapshot["services"],
+                    "redis": "healthy" if redis_ok else "unhealthy",
+                },
+            }
         return snapshot
 
     # ========================================
@@ -158,13 +322,7 @@ def create_app() -> FastAPI:
     async def global_exception_handler(request, exc):
         """Global exception handler for unhandled errors."""
         logger.exception(f"Unhandled exception: {exc}")
-        return JSONResponse(
-            status_code=500,
-            content={
-                "detail": "Internal server error",
-                "type": "internal_error",
-            },
-        )
+        return JSONResponse(status_code=500, content=INTERNAL_ERROR_CONTENT)
 
     return app
 
@@ -173,92 +331,6 @@ def create_app() -> FastAPI:
 app = create_app()
 
 
-# Middleware для проверки X-Hub подписи
-@app.middleware("http")
-async def verify_webhook_signature(request: Request, call_next):
-    # Assign/propagate a trace id for each request
-    incoming_trace = request.headers.get("X-Trace-Id")
-    trace_id = incoming_trace or str(uuid.uuid4())
-    token = trace_id_ctx.set(trace_id)
-    try:
-        request.state.trace_id = trace_id
-        # Check if this is a POST request to the webhook endpoint (with or without trailing slash)
-        webhook_path = "/api/v1/webhook"
-        if request.method == "POST" and request.url.path.rstrip("/") == webhook_path:
-            # Instagram uses X-Hub-Signature-256 (SHA256) instead of X-Hub-Signature (SHA1)
-            signature_256 = request.headers.get("X-Hub-Signature-256")
-            signature_1 = request.headers.get("X-Hub-Signature")
-            body = await request.body()
-
-            # Try SHA256 first (Instagram's preferred method), then fallback to SHA1
-            signature = signature_256 or signature_1
-
-            if signature:
-                # Determine which algorithm to use based on the header
-                if signature_256:
-                    # Instagram uses SHA256
-                    expected_signature = (
-                        "sha256="
-                        + hmac.new(
-                            settings.app_secret.encode(), body, hashlib.sha256
-                        ).hexdigest()
-                    )
-                else:
-                    # Fallback to SHA1 for compatibility
-                    expected_signature = (
-                        "sha1="
-                        + hmac.new(
-                            settings.app_secret.encode(), body, hashlib.sha1
-                        ).hexdigest()
-                    )
-
-                if not hmac.compare_digest(signature, expected_signature):
-                    logging.error("Signature verification failed!")
-                    logging.error(f"Body length: {len(body)}")
-                    logging.error(
-                        f"Signature header used: {'X-Hub-Signature-256' if signature_256 else 'X-Hub-Signature'}"
-                    )
-                    logging.error(
-                        f"Signature prefix: {signature[:10]}..."
-                        if len(signature) > 10
-                        else "Signature: [REDACTED]"
-                    )
-                    return JSONResponse(
-                        status_code=401, content={"detail": "Invalid signature"}
-                    )
-                else:
-                    logging.info("Signature verification successful")
-            else:
-                # Check if we're in development mode (allow requests without signature for testing)
-                development_mode = (
-                    os.getenv("DEVELOPMENT_MODE", "false").lower() == "true"
-                )
-
-                if development_mode:
-                    logging.warning(
-                        "DEVELOPMENT MODE: Allowing webhook request without signature header"
-                    )
-                else:
-                    # Block requests without signature headers in production
-                    logging.error(
-                        "Webhook request received without X-Hub-Signature or X-Hub-Signature-256 header - blocking request"
-                    )
-                    return JSONResponse(
-                        status_code=401, content={"detail": "Missing signature header"}
-                    )
-
-            # Сохраняем тело запроса для дальнейшей обработки
-            request.state.body = body
-            response = await call_next(request)
-        else:
-            response = await call_next(request)
-
-        response.headers["X-Trace-Id"] = trace_id
-        return response
-    finally:
-        trace_id_ctx.reset(token)
-
-
 if __name__ == "__main__":
     """
     Run the application using uvicorn.
@@ -276,4 +348,7 @@ if __name__ == "__main__":
         port=settings.port,
         reload=settings.debug,
         log_level=settings.log_level.lower(),
+        # uvloop and httptools ship with uvicorn[standard]; uvloop has no Windows build
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
     )
@@ -52,7 +52,12 @@ from src.core.config import get_settings  # noqa: E402
 
 get_settings.cache_clear()
 
-from src.core.dependencies import get_redis_cache_service, get_session  # noqa: E402
+from src.core.dependencies import (  # noqa: E402
+    get_redis_cache_service,
+    get_session,
+    get_unreachable_worker_cache,
+    get_worker_app_cache,
+)
 from src.core.models import (
     instagram_comment,
     webhook_log,
@@ -110,6 +115,11 @@ def override_dependencies() -> Generator[None, None, None]:
     app.dependency_overrides[get_session] = _get_session_override
     app.dependency_overrides[get_redis_cache_service] = _get_redis_override
 
+    # Routing entries and worker cooldowns from one test must not leak into the next
+    for cache in (get_worker_app_cache(), get_unreachable_worker_cache()):
+        if cache is not None:
+            cache.clear()
+
     try:
         yield
     finally:
@@ -18,3 +18,31 @@ async def test_health_endpoint_reports_status(client):
     payload = response.json()
     assert payload["status"] in {"healthy", "degraded", "unknown"}
     assert isinstance(payload["services"], dict)
+
+
+@pytest.mark.asyncio
+async def test_health_endpoint_degrades_when_redis_disconnected(client):
+    from src.main import app
+
+    class _DownRedisCache:
+        async def ping(self) -> bool:
+            return False
+
+    app.state.redis_cache = _DownRedisCache()
+    try:
+        response = await client.get("/health")
+    finally:
+        app.state.redis_cache = None
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["status"] == "degraded"
+    assert payload["services"]["redis"] == "unhealthy"
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_requires_auth(client):
+    response = await client.get("/api/v1/metrics")
+    assert response.status_code == 401
+    response = await client.get("/api/v1/metrics/worker-apps")
+    assert response.status_code == 401
@@ -5,9 +5,10 @@ from datetime import datetime, timedelta, timezone
 from urllib.parse import parse_qs, urlparse
 from uuid import uuid4
 
+import httpx
 import pytest
 
-from src.api_v1.instagram_oauth import _generate_state, _validate_state
+from src.api_v1.instagram_oauth import _generate_state, _notify_worker, _validate_state
 from src.core.config import get_settings
 from src.core.dependencies import get_current_active_user
 from src.core.dependencies import get_user_repository, get_worker_app_repository
@@ -278,3 +279,27 @@ async def test_refresh_updates_token_and_returns_status(client, db_session, monk
     ).get_tokens("instagram", user_id=user.id)
     assert stored is not None
     assert stored.access_token == "new-token"
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_notify_worker_uses_shared_http_client():
+    requests: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(204)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as http_client:
+        synced = await _notify_worker(
+            "https://worker.example/hook",
+            "/api/v1/oauth/tokens",
+            {"provider": "instagram", "account_id": "acct-notify"},
+            method="delete",
+            http_client=http_client,
+        )
+
+    assert synced is True
+    assert requests[0].method == "DELETE"
+    assert str(requests[0].url) == "https://worker.example/api/v1/oauth/tokens"
+    assert requests[0].headers["Authorization"].startswith("Bearer ")
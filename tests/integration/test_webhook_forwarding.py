@@ -9,6 +9,7 @@ from uuid import uuid4
 import httpx
 import pytest
 
+from src.api_v1.schemas import WebhookPayload
 from src.core.config import get_settings
 from src.core.models.user import User
 from src.core.models.worker_app import WorkerApp
@@ -155,6 +156,16 @@ async def test_webhook_validation_errors_return_422(client):
         },
     )
     assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "entry"]
+
+
+def test_webhook_payload_is_validated_strictly():
+    payload = _instagram_payload("acct-strict")
+    assert WebhookPayload.model_validate_json(json.dumps(payload)).entry[0].id == "acct-strict"
+
+    payload["entry"][0]["time"] = str(payload["entry"][0]["time"])
+    with pytest.raises(ValueError):
+        WebhookPayload.model_validate_json(json.dumps(payload))
 
 
 @pytest.mark.asyncio
@@ -175,6 +186,30 @@ async def test_webhook_returns_failure_when_worker_missing(client):
     assert "No worker app found" in resp_json["error_details"]
 
 
+@pytest.mark.asyncio
+async def test_webhook_payload_is_parsed_once_from_signed_body(client, monkeypatch):
+    original = WebhookPayload.model_validate_json
+    parsed: list[bytes] = []
+
+    def _spy(data, *args, **kwargs):
+        parsed.append(data)
+        return original(data, *args, **kwargs)
+
+    monkeypatch.setattr(WebhookPayload, "model_validate_json", _spy)
+
+    payload = json.dumps(_instagram_payload("acct-parse-once")).encode()
+    response = await client.post(
+        "/api/v1/webhook",
+        content=payload,
+        headers={
+            "content-type": "application/json",
+            "X-Hub-Signature-256": _sign_payload(payload),
+        },
+    )
+    assert response.status_code == 200
+    assert parsed == [payload]
+
+
 @pytest.mark.asyncio
 async def test_forwarding_keeps_original_headers(client, db_session, monkeypatch):
     monkeypatch.setenv("DEVELOPMENT_MODE", "true")
@@ -290,3 +325,25 @@ async def test_duplicate_webhook_requests_report_success(client, db_session, mon
     body = second.json()
     assert body["status"] == "success"
     assert body["error_details"] is None
+
+
+@pytest.mark.asyncio
+async def test_webhook_rate_limit_returns_429(client, monkeypatch):
+    from src.core.dependencies import get_webhook_rate_limiter
+    from src.core.utils.rate_limit import TokenBucket
+    from src.main import app
+
+    bucket = TokenBucket(capacity=1, refill_per_second=0.0)
+    app.dependency_overrides[get_webhook_rate_limiter] = lambda: bucket
+
+    payload = json.dumps(_instagram_payload("acct-rate-limited")).encode()
+    headers = {
+        "content-type": "application/json",
+        "X-Hub-Signature-256": _sign_payload(payload),
+    }
+
+    first = await client.post("/api/v1/webhook", content=payload, headers=headers)
+    assert first.status_code == 200
+
+    second = await client.post("/api/v1/webhook", content=payload, headers=headers)
+    assert second.status_code == 429
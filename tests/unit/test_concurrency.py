@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from src.core.utils.concurrency import KeyedSemaphore, SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_keyed_semaphore_caps_holders_per_key():
+    limiter = KeyedSemaphore(limit=2)
+    active = {"a": 0, "b": 0}
+    peak = {"a": 0, "b": 0}
+
+    async def _hold(key: str) -> None:
+        async with limiter.acquire(key):
+            active[key] += 1
+            peak[key] = max(peak[key], active[key])
+            await asyncio.sleep(0.01)
+            active[key] -= 1
+
+    await asyncio.gather(*(_hold(key) for key in "aaaaab"))
+
+    assert peak == {"a": 2, "b": 1}
+    assert len(limiter) == 0  # idle keys are forgotten
+
+
+def test_keyed_semaphore_rejects_invalid_limit():
+    with pytest.raises(ValueError):
+        KeyedSemaphore(limit=0)
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_one_call_per_key():
+    flight = SingleFlight()
+    calls = 0
+
+    async def _lookup() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "worker"
+
+    results = await asyncio.gather(*(flight.do("acct", _lookup) for _ in range(5)))
+
+    assert results == ["worker"] * 5
+    assert calls == 1
+    assert len(flight) == 0
+    assert await flight.do("acct", _lookup) == "worker"
+    assert calls == 2  # completed calls are not cached
+
+
+@pytest.mark.asyncio
+async def test_single_flight_propagates_errors_to_followers():
+    flight = SingleFlight()
+
+    async def _fail() -> None:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("lookup failed")
+
+    results = await asyncio.gather(
+        *(flight.do("acct", _fail) for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(flight) == 0
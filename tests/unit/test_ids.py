@@ -0,0 +1,35 @@
+import uuid
+
+from src.core.utils import ids
+
+
+def test_new_id_is_fixed_width_hex():
+    value = ids.new_id()
+    assert len(value) == 32
+    int(value, 16)
+
+
+def test_new_id_sorts_by_creation_time(monkeypatch):
+    clock = [1_700_000_000_000_000_000]
+    monkeypatch.setattr(ids.time, "time_ns", lambda: clock[0])
+    first = ids.new_id()
+    clock[0] += 1_000_000
+    second = ids.new_id()
+    assert first < second
+
+
+def test_new_id_is_unique():
+    assert len({ids.new_id() for _ in range(1000)}) == 1000
+
+
+def test_uuid7_has_version_and_sorts_by_time(monkeypatch):
+    clock = [1_700_000_000_000_000_000]
+    monkeypatch.setattr(ids.time, "time_ns", lambda: clock[0])
+    first = ids.uuid7()
+    clock[0] += 1_000_000
+    second = ids.uuid7()
+
+    assert first.version == 7
+    assert first.variant == uuid.RFC_4122
+    assert first.int >> 80 == 1_700_000_000_000
+    assert first < second
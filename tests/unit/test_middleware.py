@@ -0,0 +1,108 @@
+import hashlib
+import hmac
+
+import httpx
+import pytest
+
+from src.core import middleware
+from src.core.middleware import EdgeMiddleware, WebhookSignatureMiddleware
+
+SECRET = b"middleware-secret"
+
+
+async def _echo_app(scope, receive, send):
+    """Minimal ASGI app that echoes the body it receives."""
+    body = b""
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get("body", b"")
+        more_body = message.get("more_body", False)
+    assert scope["state"].get("body", body) == body
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": body})
+
+
+def _client(max_body_size: int = 1024, offload_threshold: int = 0) -> httpx.AsyncClient:
+    app = EdgeMiddleware(
+        WebhookSignatureMiddleware(
+            _echo_app,
+            path="/hook",
+            secret=SECRET,
+            max_body_size=max_body_size,
+            offload_threshold=offload_threshold,
+        )
+    )
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+def _sign(body: bytes) -> str:
+    return "sha256=" + hmac.new(SECRET, body, hashlib.sha256).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_signed_body_is_replayed_to_app_with_trace_id():
+    body = b'{"object":"instagram"}'
+    async with _client() as client:
+        response = await client.post(
+            "/hook/", content=body, headers={"X-Hub-Signature-256": _sign(body), "X-Trace-Id": "trace-1"}
+        )
+
+    assert response.status_code == 200
+    assert response.content == body
+    assert response.headers["X-Trace-Id"] == "trace-1"
+
+
+@pytest.mark.asyncio
+async def test_rejects_oversized_and_badly_signed_bodies(monkeypatch):
+    monkeypatch.delenv("DEVELOPMENT_MODE", raising=False)
+    body = b'{"object":"instagram"}'
+    async with _client(max_body_size=8) as client:
+        too_large = await client.post("/hook", content=body, headers={"X-Hub-Signature-256": _sign(body)})
+    async with _client() as client:
+        bad_signature = await client.post("/hook", content=body, headers={"X-Hub-Signature-256": _sign(b"other")})
+        unsigned = await client.post("/hook", content=body)
+
+    assert too_large.status_code == 413
+    assert bad_signature.status_code == 401
+    assert unsigned.json() == {"detail": "Missing signature header"}
+    assert too_large.headers["X-Trace-Id"]
+
+
+@pytest.mark.asyncio
+async def test_large_bodies_are_verified_in_the_thread_pool(monkeypatch):
+    offloaded: list[int] = []
+    run_in_threadpool = middleware.run_in_threadpool
+
+    async def _tracking_run_in_threadpool(func, *args):
+        offloaded.append(len(args[0]))
+        return await run_in_threadpool(func, *args)
+
+    monkeypatch.setattr(middleware, "run_in_threadpool", _tracking_run_in_threadpool)
+    small = b'{"object":"instagram"}'
+    large = b'{"object":"instagram","pad":"' + b"x" * 64 + b'"}'
+    async with _client(offload_threshold=64) as client:
+        small_response = await client.post("/hook", content=small, headers={"X-Hub-Signature-256": _sign(small)})
+        large_response = await client.post("/hook", content=large, headers={"X-Hub-Signature-256": _sign(large)})
+        forged = await client.post("/hook", content=large, headers={"X-Hub-Signature-256": _sign(small)})
+
+    assert small_response.status_code == 200
+    assert large_response.content == large
+    assert forged.status_code == 401
+    assert offloaded == [len(large), len(large)]
+
+
+@pytest.mark.asyncio
+async def test_edge_middleware_rejects_untrusted_hosts():
+    app = EdgeMiddleware(_echo_app, allowed_hosts=["api.example.com"])
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://api.example.com:8100") as client:
+        trusted = await client.get("/")
+    async with httpx.AsyncClient(transport=transport, base_url="http://evil.example.com") as client:
+        untrusted = await client.get("/")
+
+    assert trusted.status_code == 200
+    assert untrusted.status_code == 400
+    assert untrusted.headers["X-Trace-Id"]
+    assert EdgeMiddleware(_echo_app, allowed_hosts=["*"]).allowed_hosts is None
@@ -51,6 +51,9 @@ async def test_store_and_get_tokens(db_session):
     assert fetched.scope == "scope1"
     assert fetched.access_token_expires_at.replace(tzinfo=None) == expires.replace(tzinfo=None)
 
+    row = await repo.get_latest("google", user.id, "channel-1")
+    assert row.id.version == 7
+
 
 @pytest.mark.asyncio
 async def test_update_access_token(db_session):
@@ -82,3 +85,13 @@ async def test_update_access_token(db_session):
     assert updated.access_token == "new"
     assert updated.refresh_token == "new-refresh"
     assert updated.access_token_expires_at.replace(tzinfo=None) == new_exp.replace(tzinfo=None)
+
+    missing = await service.update_access_token(
+        provider="google",
+        account_id="channel-missing",
+        user_id=user.id,
+        access_token="new",
+        refresh_token=None,
+        access_token_expires_at=None,
+    )
+    assert missing is None
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
@@ -8,7 +9,9 @@ from src.core.models.user import User
 from src.core.models.worker_app import WorkerApp
 from src.core.repositories.oauth_token_repository import OAuthTokenRepository
 from src.core.services.oauth_token_service import OAuthTokenService
+from src.core.use_cases import process_webhook_use_case
 from src.core.use_cases.process_webhook_use_case import ProcessWebhookUseCase
+from src.core.utils.ttl_cache import TTLCache
 
 
 class _DummyForwardWebhookUseCase:
@@ -87,6 +90,8 @@ async def test_get_worker_app_cached_uses_redis(db_session):
     assert worker_from_db.id == worker_app.id
     assert username_from_db == "cache-user"
     assert redis_cache.get_calls == ["acct-cache-test"]
+    # Wait for the background cache fill itself rather than a fixed number of loop turns
+    await asyncio.gather(*list(process_webhook_use_case._cache_fills))
     assert redis_cache.set_calls[0][0] == "acct-cache-test"
     assert redis_cache.set_calls[0][1]["webhook_url"] == worker_app.webhook_url
 
@@ -143,3 +148,139 @@ async def test_execute_skips_owner_comments(db_session):
     assert result["success"] is True
     assert result["comments_processed"] == 0
     assert await use_case.comment_repo.exists_by_comment_id("owner-comment") is False
+
+
+@pytest.mark.asyncio
+async def test_get_worker_app_cached_prefers_local_cache(db_session, monkeypatch):
+    user = User(
+        username="local-cache-user",
+        full_name="Local Cache User",
+        hashed_password="hashed",
+    )
+    db_session.add(user)
+    await db_session.commit()
+    await db_session.refresh(user)
+
+    worker_app = WorkerApp(
+        base_url="https://worker-local-cache.example",
+        webhook_url="https://worker-local-cache.example/api",
+        user_id=user.id,
+    )
+    db_session.add(worker_app)
+    await db_session.commit()
+
+    token_service = OAuthTokenService(
+        OAuthTokenRepository(db_session),
+        get_settings().oauth_encryption_key,
+    )
+    await token_service.store_tokens(
+        provider="instagram",
+        account_id="acct-local-cache",
+        user_id=user.id,
+        instagram_user_id="ig-scoped",
+        username="local-cache-user",
+        access_token="access-token",
+        refresh_token=None,
+        scope="instagram_business_basic",
+        access_token_expires_at=None,
+        refresh_token_expires_at=None,
+    )
+    await db_session.commit()
+
+    local_cache = TTLCache(ttl_seconds=60)
+    use_case = ProcessWebhookUseCase(
+        session=db_session,
+        forward_webhook_uc=_DummyForwardWebhookUseCase(),
+        redis_cache=None,
+        local_cache=local_cache,
+    )
+
+    worker_from_db, _ = await use_case._get_worker_app_cached("acct-local-cache")
+    assert worker_from_db.id == worker_app.id
+    assert local_cache.misses == 1
+
+    async def _fail(*args: Any, **kwargs: Any):
+        raise AssertionError("Database should not be queried on a local cache hit")
+
+    monkeypatch.setattr(use_case.worker_app_repo, "get_routing_target", _fail)
+    monkeypatch.setattr(use_case.worker_app_repo, "get_by_id", _fail)
+
+    worker_from_cache, username = await use_case._get_worker_app_cached("acct-local-cache")
+    assert worker_from_cache.id == worker_app.id
+    assert worker_from_cache.webhook_url == worker_app.webhook_url
+    assert worker_from_cache.user_id == user.id
+    assert username == "local-cache-user"
+    assert local_cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_local_cache_is_filled_from_db_row_on_redis_hit(db_session):
+    worker_app = WorkerApp(
+        base_url="https://worker-fresh.example",
+        webhook_url="https://worker-fresh.example/api",
+    )
+    db_session.add(worker_app)
+    await db_session.commit()
+
+    redis_cache = _FakeRedisCache()
+    redis_cache.store["acct-stale-redis"] = {
+        "id": str(worker_app.id),
+        "account_id": "acct-stale-redis",
+        "username": "stale-user",
+        "base_url": "https://worker-old.example",
+        "webhook_url": "https://worker-old.example/api",
+        "user_id": None,
+    }
+    local_cache = TTLCache(ttl_seconds=60)
+    use_case = ProcessWebhookUseCase(
+        session=db_session,
+        forward_webhook_uc=_DummyForwardWebhookUseCase(),
+        redis_cache=redis_cache,
+        local_cache=local_cache,
+    )
+
+    resolved, username = await use_case._get_worker_app_cached("acct-stale-redis")
+    assert resolved.webhook_url == "https://worker-fresh.example/api"
+    assert username == "stale-user"
+    assert local_cache.get("acct-stale-redis")["webhook_url"] == "https://worker-fresh.example/api"
+
+
+@pytest.mark.asyncio
+async def test_routing_lookup_does_not_wait_for_redis_fill(db_session):
+    worker_app = WorkerApp(
+        base_url="https://worker-slow-redis.example",
+        webhook_url="https://worker-slow-redis.example/api",
+    )
+    db_session.add(worker_app)
+    await db_session.commit()
+
+    class _SlowRedisCache(_FakeRedisCache):
+        def __init__(self) -> None:
+            super().__init__()
+            self.release = asyncio.Event()
+
+        async def set_worker_app(self, *args: Any, **kwargs: Any) -> bool:
+            await self.release.wait()
+            return await super().set_worker_app(*args, **kwargs)
+
+    redis_cache = _SlowRedisCache()
+    use_case = ProcessWebhookUseCase(
+        session=db_session,
+        forward_webhook_uc=_DummyForwardWebhookUseCase(),
+        redis_cache=redis_cache,
+    )
+
+    async def _routing_target(account_id: str):
+        return worker_app, "slow-redis-user"
+
+    use_case.worker_app_repo.get_routing_target = _routing_target
+
+    resolved, _ = await asyncio.wait_for(
+        use_case._get_worker_app_cached("acct-slow-redis"), timeout=1
+    )
+    assert resolved.id == worker_app.id
+    assert redis_cache.set_calls == []
+
+    redis_cache.release.set()
+    await asyncio.gather(*list(process_webhook_use_case._cache_fills))
+    assert redis_cache.set_calls[0][0] == "acct-slow-redis"
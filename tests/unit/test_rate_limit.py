@@ -0,0 +1,78 @@
+import pytest
+
+from src.core.utils import rate_limit
+from src.core.utils.rate_limit import TokenBucket
+
+
+def _freeze_clock(monkeypatch, start_ns: int = 0) -> list[int]:
+    clock = [start_ns]
+    monkeypatch.setattr(rate_limit.time, "monotonic_ns", lambda: clock[0])
+    return clock
+
+
+def test_token_bucket_allows_up_to_capacity_then_blocks(monkeypatch):
+    _freeze_clock(monkeypatch)
+    bucket = TokenBucket(capacity=3, refill_per_second=1.0)
+
+    assert [bucket.allow("1.2.3.4") for _ in range(4)] == [True, True, True, False]
+    # Other keys have their own bucket
+    assert bucket.allow("5.6.7.8") is True
+
+
+def test_token_bucket_carries_fractional_refill(monkeypatch):
+    clock = _freeze_clock(monkeypatch)
+    bucket = TokenBucket(capacity=1, refill_per_second=1.0)
+
+    assert bucket.allow("client") is True
+    clock[0] += 600_000_000  # 0.6 tokens
+    assert bucket.allow("client") is False
+    clock[0] += 600_000_000  # 1.2 tokens in total; partial refill was kept
+    assert bucket.allow("client") is True
+    assert bucket.allow("client") is False
+
+
+def test_token_bucket_refill_is_capped(monkeypatch):
+    clock = _freeze_clock(monkeypatch)
+    bucket = TokenBucket(capacity=2, refill_per_second=10.0)
+
+    assert bucket.allow("client") is True
+    clock[0] += 60_000_000_000
+    assert [bucket.allow("client") for _ in range(3)] == [True, True, False]
+
+
+def test_token_bucket_rejects_invalid_capacity():
+    with pytest.raises(ValueError):
+        TokenBucket(capacity=0, refill_per_second=1.0)
+
+
+def test_token_bucket_spreads_keys_across_shards(monkeypatch):
+    _freeze_clock(monkeypatch)
+    bucket = TokenBucket(capacity=1, refill_per_second=1.0, shards=4)
+
+    for index in range(32):
+        assert bucket.allow(f"10.0.0.{index}") is True
+    assert len(bucket) == 32
+    assert sum(1 for shard in bucket._shards if shard) > 1
+
+    bucket.reset()
+    assert len(bucket) == 0
+
+
+def test_token_bucket_rejects_non_power_of_two_shards():
+    with pytest.raises(ValueError):
+        TokenBucket(capacity=1, refill_per_second=1.0, shards=3)
+
+
+def test_token_bucket_prunes_only_fully_refilled_buckets(monkeypatch):
+    clock = _freeze_clock(monkeypatch)
+    bucket = TokenBucket(capacity=2, refill_per_second=1.0)
+
+    bucket.allow("idle")
+    clock[0] += 1_500_000_000
+    bucket.allow("active")
+    clock[0] += 1_000_000_000  # "idle" unused for 2.5s, "active" for 1s
+
+    assert bucket.prune() == 1
+    assert len(bucket) == 1
+    assert bucket.prune(idle_ns=500_000_000) == 1
+    assert len(bucket) == 0
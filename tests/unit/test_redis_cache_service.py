@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from redis.exceptions import RedisError
 
@@ -36,16 +38,23 @@ async def test_worker_app_cache_happy_path(monkeypatch):
     monkeypatch.setattr(redis_cache_service.redis_async, "from_url", fake_from_url)
 
     service = RedisCacheService(redis_url="redis://example")
+    assert service.is_connected is False
     await service.connect()
+    assert service.is_connected is True
 
     payload = {"id": "123", "account_id": "acct", "base_url": "https://worker"}
     assert await service.set_worker_app("acct", payload) is True
+    assert isinstance(fake_client.store["worker_app:acct"], bytes)
     cached = await service.get_worker_app("acct")
     assert cached == payload
+
+    fake_client.store["worker_app:acct"] = "{not json"
+    assert await service.get_worker_app("acct") is None
     assert await service.delete_worker_app("acct") is True
 
     await service.disconnect()
     assert fake_client.closed is True
+    assert service.is_connected is False
 
 
 @pytest.mark.asyncio
@@ -66,3 +75,97 @@ async def test_worker_app_cache_gracefully_handles_redis_errors(monkeypatch):
 
     assert await service.get_worker_app("acct") is None
     assert await service.set_worker_app("acct", {"x": "y"}) is False
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lazy_connects_open_one_client(monkeypatch):
+    created: list[_FakeRedisClient] = []
+
+    async def fake_from_url(*args, **kwargs):
+        await asyncio.sleep(0)
+        created.append(_FakeRedisClient())
+        return created[-1]
+
+    monkeypatch.setattr(redis_cache_service.redis_async, "from_url", fake_from_url)
+
+    service = RedisCacheService(redis_url="redis://example")
+    clients = await asyncio.gather(*(service.get_client() for _ in range(5)))
+
+    assert len(created) == 1
+    assert all(client is created[0] for client in clients)
+    assert await RedisCacheService(redis_url=None).get_client() is None
+
+
+@pytest.mark.asyncio
+async def test_failed_connect_is_retried_after_cooldown(monkeypatch):
+    attempts: list[_FakeRedisClient] = []
+    clock = [100.0]
+
+    class _DownRedisClient(_FakeRedisClient):
+        async def ping(self) -> None:
+            raise RedisError("connection refused")
+
+    async def fake_from_url(*args, **kwargs):
+        assert kwargs["socket_connect_timeout"] == 1.0
+        attempts.append(_DownRedisClient() if not attempts else _FakeRedisClient())
+        return attempts[-1]
+
+    monkeypatch.setattr(redis_cache_service.redis_async, "from_url", fake_from_url)
+    monkeypatch.setattr(redis_cache_service.time, "monotonic", lambda: clock[0])
+
+    service = RedisCacheService(redis_url="redis://example", retry_after=5.0)
+    with pytest.raises(RedisError):
+        await service.connect()
+    assert service.is_connected is False
+    assert attempts[0].closed is True
+
+    # Within the cooldown cache calls skip Redis without reconnecting
+    assert await service.set_worker_app("acct", {"id": "1"}) is False
+    assert len(attempts) == 1
+
+    # Redis is back: once the cooldown passes the next cache call reconnects
+    clock[0] += 5.0
+    assert await service.set_worker_app("acct", {"id": "1"}) is True
+    assert len(attempts) == 2
+    assert service.is_connected is True
+
+
+@pytest.mark.asyncio
+async def test_ping_reports_outages_and_caches_the_result():
+    calls = 0
+
+    class _PingClient:
+        healthy = True
+
+        async def ping(self) -> bool:
+            nonlocal calls
+            calls += 1
+            if not self.healthy:
+                raise RedisError("connection lost")
+            return True
+
+    client = _PingClient()
+    service = RedisCacheService(redis_url="redis://example")
+    service._client = client
+
+    assert await service.ping() is True
+    client.healthy = False
+    # Within max_age the previous answer is reused without a round trip
+    assert await service.ping() is True
+    assert calls == 1
+    assert await service.ping(max_age=0) is False
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_get_client_skips_the_connect_lock_during_cooldown(monkeypatch):
+    service = RedisCacheService(redis_url="redis://example", retry_after=5.0)
+    service._failed_at = redis_cache_service.time.monotonic()
+
+    # A connect attempt in progress elsewhere must not hold these callers up
+    async with service._connect_lock:
+        clients = await asyncio.wait_for(
+            asyncio.gather(*(service.get_client() for _ in range(3))), timeout=0.1
+        )
+
+    assert clients == [None, None, None]
@@ -1,6 +1,9 @@
 import pytest
+from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
+from sqlalchemy.exc import InvalidRequestError
+
 from src.core.models.instagram_comment import InstagramComment
 from src.core.models.user import User, UserRole
 from src.core.models.webhook_log import WebhookLog
@@ -52,13 +55,74 @@ async def test_worker_app_repository_operations(db_session):
     assert await repo.exists_by_user_id(user.id) is True
     assert await repo.exists_by_user_id(uuid4()) is False
 
+    assert await repo.create_for_user(
+        base_url="https://worker3.example",
+        webhook_url="https://worker3.example/hook",
+        user_id=user.id,
+    ) is None
+    second_user = User(
+        username=f"repo-second-{uuid4().hex[:8]}",
+        full_name="Second User",
+        hashed_password=hash_password("password-2"),
+    )
+    db_session.add(second_user)
+    await db_session.commit()
+    created = await repo.create_for_user(
+        base_url="https://worker4.example",
+        webhook_url="https://worker4.example/hook",
+        user_id=second_user.id,
+    )
+    await db_session.commit()
+    assert created is not None
+    assert created.user_id == second_user.id
+    assert created.created_at is not None
+    assert (await repo.get_by_user_id(second_user.id)).id == created.id
+
+    by_users = await repo.get_by_user_ids([user.id, second_user.id, uuid4()])
+    assert by_users == {user.id: worker_with_user, second_user.id: created}
+    assert await repo.get_by_user_ids([]) == {}
+    assert await repo.exists(worker_without_user.id) is True
+    assert await repo.exists(uuid4()) is False
+
+    updated = await repo.update_by_id(
+        worker_without_user.id, {"webhook_url": "https://worker2.example/new-hook"}
+    )
+    await db_session.commit()
+    assert updated.webhook_url == "https://worker2.example/new-hook"
+    assert updated.base_url == "https://worker2.example"
+    assert await repo.update_by_id(uuid4(), {"base_url": "https://missing.example"}) is None
+
     all_workers = await repo.get_all(limit=10, offset=0)
     assert {w.id for w in all_workers} == {worker_with_user.id, worker_without_user.id}
 
+    first_page, total = await repo.get_all_with_total(limit=1, offset=0)
+    assert len(first_page) == 1
+    assert total == 2
+    assert await repo.get_all_with_total(limit=1, offset=5) == ([], 2)
+
     await repo.delete(worker_without_user)
     await db_session.commit()
     assert await repo.get_by_user_id(user.id) is not None
 
+    log_id = uuid4()
+    log = WebhookLog(
+        id=log_id,
+        webhook_id=f"wh-{uuid4()}",
+        account_id="acct-delete",
+        worker_app_id=worker_with_user.id,
+        status="success",
+    )
+    db_session.add(log)
+    await db_session.commit()
+    worker_id = worker_with_user.id
+    db_session.expunge_all()
+
+    assert await repo.delete_by_id(worker_id) is True
+    await db_session.commit()
+    assert await repo.get_by_id(worker_id) is None
+    assert await WebhookLogRepository(db_session).get_by_id(log_id) is None
+    assert await repo.delete_by_id(worker_id) is False
+
 
 @pytest.mark.asyncio
 async def test_instagram_comment_repository_queries(db_session):
@@ -113,6 +177,10 @@ async def test_instagram_comment_repository_queries(db_session):
 
     assert await repo.exists_by_comment_id("comment-second") is True
     assert await repo.exists_by_comment_id("non-existent") is False
+    assert await repo.get_existing_comment_ids(
+        ["comment-parent", "comment-second", "non-existent"]
+    ) == {"comment-parent", "comment-second"}
+    assert await repo.get_existing_comment_ids([]) == set()
 
 
 @pytest.mark.asyncio
@@ -185,13 +253,121 @@ async def test_webhook_log_repository_queries(db_session):
     by_worker = await log_repo.get_by_worker_app_id(worker.id)
     assert len(by_worker) == 2
 
+    first_page = await log_repo.get_by_account_id("acct-logs", limit=1)
+    second_page = await log_repo.get_by_account_id(
+        "acct-logs", limit=1, after=log_repo.next_cursor(first_page)
+    )
+    assert [log.webhook_id for log in first_page + second_page] == [
+        log.webhook_id for log in by_account
+    ]
+    assert await log_repo.get_by_account_id(
+        "acct-logs", after=log_repo.next_cursor(second_page)
+    ) == []
+    assert log_repo.next_cursor([]) is None
+
     failed_logs = await log_repo.get_by_status("failed")
     assert len(failed_logs) == 1
     assert failed_logs[0].webhook_id == "log-failed"
+    db_session.expunge(failed_logs[0])
+    reloaded = (await log_repo.get_by_status("failed"))[0]
+    with pytest.raises(InvalidRequestError):
+        reloaded.worker_app  # list queries never lazy-load relationships
+    db_session.expunge(reloaded)
+    summary = (await log_repo.get_failed_logs(summary=True))[0]
+    assert summary.status == "failed"
+    with pytest.raises(InvalidRequestError):
+        summary.error_message  # summary listings leave wide columns unloaded
+    assert (await log_repo.get_by_id(summary.id)).error_message == "timeout"
 
     assert await log_repo.count_by_status("failed") == 1
     assert await log_repo.count_by_account_id("acct-logs") == 2
     assert len(await log_repo.get_failed_logs()) == 1
+    assert [log.webhook_id async for log in log_repo.iter_failed_logs(batch_size=1)] == [
+        "log-failed"
+    ]
+
+    stats = await log_repo.get_stats()
+    assert stats["total"] == 2
+    assert stats["success"] == 1
+    assert stats["failed"] == 1
+    assert stats["avg_processing_time_ms"] == pytest.approx(289.5)
+
+    overview = await log_repo.get_overview()
+    assert overview["total"] == 2
+    assert overview["failed"] == 1
+    assert overview["worker_apps_total"] == await WorkerAppRepository(db_session).count()
+
+    future = datetime.now(timezone.utc) + timedelta(hours=1)
+    assert (await log_repo.get_stats(since=future))["total"] == 0
+    assert (await log_repo.get_overview(since=future))["total"] == 0
+    assert await log_repo.get_stats_by_worker_app(since=future) == []
+
+    account_stats = await log_repo.get_stats(account_id="acct-logs")
+    assert account_stats["total"] == 2
+    assert (await log_repo.get_stats(account_id="acct-unknown"))["total"] == 0
+
+    per_worker = await log_repo.get_stats_by_worker_app()
+    assert per_worker == [
+        {
+            "worker_app_id": worker.id,
+            "total": 2,
+            "success": 1,
+            "failed": 1,
+            "avg_processing_time_ms": pytest.approx(289.5),
+        }
+    ]
+    assert await log_repo.count() == 2
 
     assert await log_repo.exists_by_webhook_id("log-failed") is True
     assert await log_repo.exists_by_webhook_id("unknown") is False
+
+    db_session.add(
+        WebhookLog(
+            webhook_id="log-expired",
+            account_id="acct-logs",
+            status="success",
+            created_at=datetime(2020, 1, 1, tzinfo=timezone.utc),
+        )
+    )
+    await db_session.commit()
+
+    db_session.add(
+        WebhookLog(
+            webhook_id="log-expired-2",
+            account_id="acct-logs",
+            status="failed",
+            created_at=datetime(2020, 1, 2, tzinfo=timezone.utc),
+        )
+    )
+    await db_session.commit()
+
+    cutoff = datetime.now(timezone.utc) - timedelta(days=1)
+    assert await log_repo.cleanup_old_logs(cutoff, batch_size=1) == 1
+    await db_session.commit()
+    assert await log_repo.count() == 3
+    assert await log_repo.cleanup_old_logs(cutoff) == 1
+    await db_session.commit()
+    assert await log_repo.exists_by_webhook_id("log-expired") is False
+    assert await log_repo.count() == 2
+
+
+@pytest.mark.asyncio
+async def test_webhook_log_repository_create_many(db_session):
+    from sqlalchemy import delete
+
+    await db_session.execute(delete(WebhookLog))
+    await db_session.commit()
+
+    log_repo = WebhookLogRepository(db_session)
+    rows = [
+        {"webhook_id": f"bulk-{index}", "account_id": "acct-bulk", "status": "success"}
+        for index in range(3)
+    ]
+
+    assert await log_repo.create_many([]) == 0
+    assert await log_repo.create_many(rows) == 3
+    await db_session.commit()
+
+    logs = await log_repo.get_by_account_id("acct-bulk")
+    assert {log.webhook_id for log in logs} == {"bulk-0", "bulk-1", "bulk-2"}
+    assert all(log.id is not None and log.created_at is not None for log in logs)
@@ -0,0 +1,28 @@
+import json
+from datetime import datetime, timezone
+from uuid import UUID
+
+from src.core.responses import FastJSONResponse
+from src.main import app
+
+
+def test_fast_json_response_renders_compact_utf8():
+    response = FastJSONResponse(
+        {
+            "id": UUID("12345678-1234-5678-1234-567812345678"),
+            "at": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            "text": "привет",
+        }
+    )
+
+    payload = json.loads(response.body)
+    assert payload["id"] == "12345678-1234-5678-1234-567812345678"
+    assert payload["at"].startswith("2026-01-02T03:04:05")
+    assert payload["text"] == "привет"
+    assert "привет".encode() in response.body
+    assert b", " not in response.body
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_app_uses_fast_json_response_by_default():
+    assert app.router.default_response_class is FastJSONResponse
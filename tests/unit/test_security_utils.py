@@ -1,3 +1,6 @@
+import hashlib
+import hmac
+
 import pytest
 from datetime import datetime, timezone, timedelta
 
@@ -53,7 +56,39 @@ def test_safe_decode_token_wraps_invalid_token():
 
 
 def test_create_access_token_and_decode():
-    token = security.create_access_token({"sub": "alice"}, expires_delta=timedelta(minutes=1))
+    claims = {"sub": "alice"}
+    token = security.create_access_token(claims, expires_delta=timedelta(minutes=1))
+    assert claims == {"sub": "alice"}
     decoded = security.decode_access_token(token)
     assert decoded["sub"] == "alice"
     assert datetime.fromtimestamp(decoded["exp"], tz=timezone.utc) > datetime.now(timezone.utc)
+
+
+def test_verify_hub_signature_accepts_valid_and_rejects_tampered():
+    secret = b"app-secret"
+    body = b'{"object":"instagram"}'
+    digest = hmac.new(secret, body, hashlib.sha256).hexdigest()
+
+    assert security.verify_hub_signature(body, f"sha256={digest}", secret) is True
+    assert security.verify_hub_signature(body, f"sha256={digest.upper()}", secret) is True
+    assert security.verify_hub_signature(body + b" ", f"sha256={digest}", secret) is False
+    assert security.verify_hub_signature(body, f"sha1={digest}", secret) is False
+    assert security.verify_hub_signature(body, "sha256=not-hex", secret) is False
+    assert security.verify_hub_signature(body, f"sha256={digest[:-2]}", secret) is False
+    assert security.verify_hub_signature(body, f"sha256={digest}00", secret) is False
+    assert security.verify_hub_signature(body, "sha256=", secret) is False
+
+    sha1_digest = hmac.new(secret, body, hashlib.sha1).hexdigest()
+    assert security.verify_hub_signature(body, f"sha1={sha1_digest}", secret, "sha1") is True
+
+
+def test_verify_hub_signature_reuses_keyed_state_per_secret():
+    secret = b"app-secret"
+    bodies = [b'{"n":1}', b'{"n":2}']
+
+    for body in bodies * 2:
+        digest = hmac.new(secret, body, hashlib.sha256).hexdigest()
+        assert security.verify_hub_signature(body, f"sha256={digest}", secret) is True
+    other_digest = hmac.new(b"other-secret", bodies[0], hashlib.sha256).hexdigest()
+    assert security.verify_hub_signature(bodies[0], f"sha256={other_digest}", secret) is False
+    assert security._hmac_prototype(secret, "sha256") is security._hmac_prototype(secret, "sha256")
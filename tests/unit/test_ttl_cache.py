@@ -0,0 +1,54 @@
+from src.core.utils import ttl_cache
+from src.core.utils.ttl_cache import TTLCache
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: clock[0])
+    cache = TTLCache(ttl_seconds=10)
+
+    cache.set("acct", {"id": "1"})
+    assert cache.get("acct") == {"id": "1"}
+
+    clock[0] += 10
+    assert cache.get("acct") is None
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(ttl_seconds=60, max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" becomes least recently used
+
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_invalidate_and_clear():
+    cache = TTLCache(ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.invalidate("a")
+    cache.invalidate("missing")
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_ttl_cache_invalidate_matching_drops_only_matching_values():
+    cache = TTLCache(ttl_seconds=60)
+    cache.set("acct-1", {"id": "worker-a"})
+    cache.set("acct-2", {"id": "worker-b"})
+    cache.set("acct-3", {"id": "worker-a"})
+
+    assert cache.invalidate_matching(lambda entry: entry["id"] == "worker-a") == 2
+    assert cache.get("acct-1") is None
+    assert cache.get("acct-3") is None
+    assert cache.get("acct-2") == {"id": "worker-b"}
@@ -1,3 +1,6 @@
+import asyncio
+import logging
+
 import pytest
 import httpx
 from sqlalchemy import delete
@@ -11,8 +14,10 @@ from src.core.models.worker_app import WorkerApp
 from src.core.repositories.oauth_token_repository import OAuthTokenRepository
 from src.core.repositories.webhook_log_repository import WebhookLogRepository
 from src.core.services.oauth_token_service import OAuthTokenService
+from src.core.use_cases import process_webhook_use_case
 from src.core.use_cases.forward_webhook_use_case import ForwardWebhookUseCase
 from src.core.use_cases.process_webhook_use_case import ProcessWebhookUseCase
+from src.core.utils.ttl_cache import TTLCache
 
 
 class _DummyForwardWebhookUseCase:
@@ -24,6 +29,9 @@ class _DummyForwardWebhookUseCase:
         self.calls.append(kwargs)
         return self._result
 
+    async def execute_many(self, forwards):
+        return [await self.execute(**forward) for forward in forwards]
+
 
 class _FakeRedisCacheHit:
     def __init__(self, worker: WorkerApp, account_id: str, username: str):
@@ -218,6 +226,100 @@ async def test_process_use_case_skips_duplicate_comments(db_session, monkeypatch
     assert dummy_forward.calls == []
 
 
+@pytest.mark.asyncio
+async def test_process_use_case_prefetches_routes_for_several_accounts(db_session, monkeypatch):
+    await _truncate_comments(db_session)
+    first_user = await _create_user(db_session)
+    second_user = await _create_user(db_session)
+    first_worker = await _create_worker_app(db_session, user_id=first_user.id)
+    second_worker = await _create_worker_app(db_session, user_id=second_user.id)
+    await _store_token(db_session, user=first_user, account_id="acct-bulk-1", username="bulk-one")
+    await _store_token(db_session, user=second_user, account_id="acct-bulk-2", username="bulk-two")
+    dummy_forward = _DummyForwardWebhookUseCase()
+    use_case = ProcessWebhookUseCase(db_session, dummy_forward, redis_cache=None)
+
+    async def _no_single_lookups(*_args, **_kwargs):
+        raise AssertionError("Several accounts should be resolved in one query")
+
+    monkeypatch.setattr(use_case.worker_app_repo, "get_routing_target", _no_single_lookups)
+    monkeypatch.setattr(
+        use_case,
+        "_extract_comments",
+        lambda payload: [
+            _valid_comment("acct-bulk-1", comment_id="bulk-c1"),
+            _valid_comment("acct-bulk-2", comment_id="bulk-c2"),
+            _valid_comment("acct-bulk-missing", comment_id="bulk-c3"),
+        ],
+    )
+
+    result = await use_case.execute(webhook_payload={})
+    assert result["comments_processed"] == 2
+    assert result["comments_skipped"] == 1
+    forwarded = {call["account_id"]: call["worker_app"].id for call in dummy_forward.calls}
+    assert forwarded == {"acct-bulk-1": first_worker.id, "acct-bulk-2": second_worker.id}
+
+
+@pytest.mark.asyncio
+async def test_process_use_case_returns_early_without_comments(db_session, monkeypatch):
+    dummy_forward = _DummyForwardWebhookUseCase()
+    use_case = ProcessWebhookUseCase(db_session, dummy_forward, redis_cache=None)
+
+    async def _no_queries(*_args, **_kwargs):
+        raise AssertionError("A webhook without comments should not query the database")
+
+    monkeypatch.setattr(use_case.comment_repo, "exists_by_comment_id", _no_queries)
+    monkeypatch.setattr(use_case.comment_repo, "get_existing_comment_ids", _no_queries)
+
+    result = await use_case.execute(webhook_payload={"entry": []})
+    assert result["success"] is True
+    assert result["comments_processed"] == 0
+    assert result["errors"] is None
+    assert dummy_forward.calls == []
+
+
+@pytest.mark.asyncio
+async def test_process_use_case_checks_duplicates_in_one_query(db_session, monkeypatch):
+    await _truncate_comments(db_session)
+    user = await _create_user(db_session)
+    account_id = "acct-dup-batch"
+    await _create_worker_app(db_session, user_id=user.id)
+    await _store_token(db_session, user=user, account_id=account_id, username="dup-owner")
+    db_session.add(
+        InstagramComment(
+            comment_id="dup-batch-old",
+            media_id="media-dup",
+            owner_id=account_id,
+            user_id="user-dup",
+            username="tester",
+            text="Seen before",
+            parent_id=None,
+            timestamp=1,
+            raw_webhook_data={},
+        )
+    )
+    await db_session.commit()
+
+    dummy_forward = _DummyForwardWebhookUseCase()
+    use_case = ProcessWebhookUseCase(db_session, dummy_forward, redis_cache=None)
+
+    async def _no_single_lookups(*_args, **_kwargs):
+        raise AssertionError("Duplicates should be checked in one batched query")
+
+    monkeypatch.setattr(use_case.comment_repo, "exists_by_comment_id", _no_single_lookups)
+    monkeypatch.setattr(
+        use_case,
+        "_extract_comments",
+        lambda payload: [
+            _valid_comment(account_id, comment_id="dup-batch-old"),
+            _valid_comment(account_id, comment_id="dup-batch-new"),
+        ],
+    )
+
+    result = await use_case.execute(webhook_payload={})
+    assert result["comments_processed"] == 1
+    assert result["duplicates"] == 1
+
+
 @pytest.mark.asyncio
 async def test_process_use_case_uses_redis_cache_hit(db_session, monkeypatch):
     await _truncate_comments(db_session)
@@ -229,10 +331,10 @@ async def test_process_use_case_uses_redis_cache_hit(db_session, monkeypatch):
 
     use_case = ProcessWebhookUseCase(db_session, dummy_forward, redis_cache=redis_cache)
 
-    async def _fail_token_lookup(_provider: str, _account_id: str):
+    async def _fail_routing_lookup(*_args, **_kwargs):
         raise AssertionError("Should not query database when cache hits")
 
-    monkeypatch.setattr(use_case.oauth_token_repo, "get_by_provider_account_id", _fail_token_lookup)
+    monkeypatch.setattr(use_case.worker_app_repo, "get_routing_target", _fail_routing_lookup)
     monkeypatch.setattr(
         use_case,
         "_extract_comments",
@@ -264,6 +366,8 @@ async def test_process_use_case_populates_cache_on_miss(db_session, monkeypatch)
 
     result = await use_case.execute(webhook_payload={})
     assert result["success"] is True
+    # Wait for the background cache fill itself rather than a fixed number of loop turns
+    await asyncio.gather(*list(process_webhook_use_case._cache_fills))
     assert len(redis_cache.set_calls) == 1
     cache_account_id, payload = redis_cache.set_calls[0]
     assert cache_account_id == account_id
@@ -327,6 +431,131 @@ async def test_process_use_case_handles_forward_failure(db_session, monkeypatch)
     assert result["success"] is False
     assert "Request timeout" in (result["errors"][0])
     assert len(dummy_forward.calls) == 1
+    # The payload is encoded once up front and forwarded as bytes
+    assert dummy_forward.calls[0]["raw_payload"] == b"{}"
+
+
+@pytest.mark.asyncio
+async def test_process_use_case_forwards_every_routed_comment(db_session, monkeypatch):
+    await _truncate_comments(db_session)
+    user = await _create_user(db_session)
+    account_id = "acct-burst"
+    await _create_worker_app(db_session, user_id=user.id)
+    await _store_token(db_session, user=user, account_id=account_id, username="burst-owner")
+    dummy_forward = _DummyForwardWebhookUseCase()
+    use_case = ProcessWebhookUseCase(db_session, dummy_forward, redis_cache=None)
+
+    monkeypatch.setattr(
+        use_case,
+        "_extract_comments",
+        lambda payload: [
+            _valid_comment(account_id, comment_id="burst-1"),
+            _valid_comment(None, comment_id="burst-orphan"),
+            _valid_comment(account_id, comment_id="burst-2"),
+        ],
+    )
+
+    result = await use_case.execute(webhook_payload={})
+    assert result["comments_processed"] == 2
+    assert result["comments_skipped"] == 1
+    assert len(dummy_forward.calls) == 2
+    assert all(call["account_id"] == account_id for call in dummy_forward.calls)
+    for comment_id in ("burst-1", "burst-2"):
+        assert await use_case.comment_repo.exists_by_comment_id(comment_id) is True
+
+
+@pytest.mark.asyncio
+async def test_process_use_case_resolves_each_account_once_per_webhook(db_session, monkeypatch):
+    await _truncate_comments(db_session)
+    user = await _create_user(db_session)
+    account_id = "acct-memo"
+    await _create_worker_app(db_session, user_id=user.id)
+    await _store_token(db_session, user=user, account_id=account_id, username="memo-owner")
+    dummy_forward = _DummyForwardWebhookUseCase()
+    use_case = ProcessWebhookUseCase(db_session, dummy_forward, redis_cache=None)
+
+    lookups: list[str] = []
+    get_worker_app_cached = use_case._get_worker_app_cached
+
+    async def _counting_lookup(lookup_account_id):
+        lookups.append(lookup_account_id)
+        return await get_worker_app_cached(lookup_account_id)
+
+    monkeypatch.setattr(use_case, "_get_worker_app_cached", _counting_lookup)
+    monkeypatch.setattr(
+        use_case,
+        "_extract_comments",
+        lambda payload: [_valid_comment(account_id, comment_id=f"memo-{index}") for index in range(3)],
+    )
+
+    result = await use_case.execute(webhook_payload={})
+    assert result["comments_processed"] == 3
+    assert lookups == [account_id]
+
+
+@pytest.mark.asyncio
+async def test_process_use_case_stores_repeated_comment_once(db_session, monkeypatch):
+    await _truncate_comments(db_session)
+    user = await _create_user(db_session)
+    account_id = "acct-repeat"
+    await _create_worker_app(db_session, user_id=user.id)
+    await _store_token(db_session, user=user, account_id=account_id, username="repeat-owner")
+    dummy_forward = _DummyForwardWebhookUseCase()
+    use_case = ProcessWebhookUseCase(db_session, dummy_forward, redis_cache=None)
+
+    monkeypatch.setattr(
+        use_case,
+        "_extract_comments",
+        lambda payload: [
+            _valid_comment(account_id, comment_id="repeat-1"),
+            _valid_comment(account_id, comment_id="repeat-1"),
+        ],
+    )
+
+    result = await use_case.execute(webhook_payload={})
+    assert result["success"] is True
+    assert result["comments_processed"] == 1
+    assert result["duplicates"] == 1
+    assert len(dummy_forward.calls) == 1
+
+
+def test_process_use_case_extracts_only_complete_foreign_comments(db_session, caplog):
+    use_case = ProcessWebhookUseCase(db_session, _DummyForwardWebhookUseCase())
+    payload = {
+        "entry": [
+            {
+                "id": "acct-extract",
+                "time": 1700000000,
+                "changes": [
+                    {"field": "mentions", "value": {"id": "ignored"}},
+                    {
+                        "field": "comments",
+                        "value": {"id": "c-1", "from": {"id": "u-1", "username": "fan"}},
+                    },
+                    {
+                        "field": "comments",
+                        "value": {
+                            "id": "c-2",
+                            "from": {"id": "acct-extract", "username": "owner"},
+                        },
+                    },
+                    {"field": "comments", "value": {"id": "c-3"}},
+                    {"field": "comments"},
+                ],
+            }
+        ]
+    }
+
+    with caplog.at_level(logging.WARNING, logger="src.core.use_cases.process_webhook_use_case"):
+        comments = use_case._extract_comments(payload)
+    assert [comment["comment_id"] for comment in comments] == ["c-1"]
+    assert comments[0]["media_id"] is None
+    assert comments[0]["text"] == ""
+    assert comments[0]["timestamp"] == 1700000000
+    # Both incomplete comments are reported together
+    warnings = [record for record in caplog.records if record.levelno == logging.WARNING]
+    assert len(warnings) == 1
+    assert "['c-3', None]" in warnings[0].getMessage()
 
 
 # ============================================================================
@@ -453,3 +682,113 @@ async def test_forward_use_case_filters_headers(db_session, monkeypatch):
     assert "X-Webhook-ID" in forwarded_headers
     assert capture["kwargs"]["content"] == raw_payload
     assert capture["kwargs"].get("json") is None
+
+
+@pytest.mark.asyncio
+async def test_forward_use_case_reuses_shared_http_client(db_session):
+    worker = await _create_worker_app(db_session)
+    requests: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(202)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as http_client:
+        use_case = ForwardWebhookUseCase(db_session, http_client=http_client)
+        for _ in range(2):
+            result = await use_case.execute(
+                worker_app=worker,
+                webhook_payload={"entry": []},
+                account_id="acct-shared-client",
+                raw_payload=b'{"entry":[]}',
+            )
+            assert result["success"] is True
+        assert not http_client.is_closed
+
+    assert [request.content for request in requests] == [b'{"entry":[]}'] * 2
+    assert str(requests[0].url) == worker.webhook_url
+
+
+@pytest.mark.asyncio
+async def test_forward_use_case_fails_fast_while_worker_is_cooling_down(db_session):
+    worker = await _create_worker_app(db_session)
+    attempts = 0
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        raise httpx.ConnectError("connection refused", request=request)
+
+    unreachable = TTLCache(ttl_seconds=60)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as http_client:
+        use_case = ForwardWebhookUseCase(
+            db_session, http_client=http_client, unreachable_workers=unreachable
+        )
+        first = await use_case.execute(
+            worker_app=worker, webhook_payload={}, account_id="acct-cooldown"
+        )
+        second = await use_case.execute(
+            worker_app=worker, webhook_payload={}, account_id="acct-cooldown"
+        )
+
+    assert first["error"].startswith("Request error")
+    assert second["success"] is False
+    assert "unreachable" in second["error"]
+    assert attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_forward_use_case_does_not_cool_down_on_read_timeout(db_session):
+    worker = await _create_worker_app(db_session)
+    attempts = 0
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        raise httpx.ReadTimeout("worker is slow", request=request)
+
+    unreachable = TTLCache(ttl_seconds=60)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as http_client:
+        use_case = ForwardWebhookUseCase(
+            db_session, http_client=http_client, unreachable_workers=unreachable
+        )
+        first = await use_case.execute(
+            worker_app=worker, webhook_payload={}, account_id="acct-slow"
+        )
+        second = await use_case.execute(
+            worker_app=worker, webhook_payload={}, account_id="acct-slow"
+        )
+
+    assert first["error"] == "Request timeout"
+    assert second["error"] == "Request timeout"
+    assert attempts == 2
+    assert unreachable.get(worker.webhook_url) is None
+
+
+@pytest.mark.asyncio
+async def test_forward_use_case_execute_many_overlaps_requests(db_session):
+    await db_session.execute(delete(WebhookLog))
+    await db_session.commit()
+    worker = await _create_worker_app(db_session)
+    in_flight = peak = 0
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as http_client:
+        use_case = ForwardWebhookUseCase(db_session, http_client=http_client)
+        results = await use_case.execute_many(
+            [
+                {"worker_app": worker, "webhook_payload": {}, "account_id": "acct-many"}
+                for _ in range(3)
+            ]
+        )
+
+    assert [result["success"] for result in results] == [True, True, True]
+    assert peak == 3
+    assert await WebhookLogRepository(db_session).count_by_account_id("acct-many") == 3
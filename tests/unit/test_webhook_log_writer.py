@@ -0,0 +1,123 @@
+import asyncio
+from contextlib import suppress
+
+import pytest
+from sqlalchemy import delete
+
+from src.core.models.db_helper import db_helper
+from src.core.models.webhook_log import WebhookLog
+from src.core.repositories.webhook_log_repository import WebhookLogRepository
+from src.core.services.webhook_log_writer import WebhookLogWriter
+
+
+def _row(webhook_id: str) -> dict:
+    return {"webhook_id": webhook_id, "account_id": "acct-writer", "status": "success"}
+
+
+@pytest.mark.asyncio
+async def test_writer_batches_queued_rows_in_background(db_session):
+    await db_session.execute(delete(WebhookLog))
+    await db_session.commit()
+
+    writer = WebhookLogWriter(db_helper.session_factory, batch_size=2, flush_interval=0.01)
+    task = asyncio.create_task(writer.run())
+    try:
+        assert all(writer.submit(_row(f"bg-{index}")) for index in range(3))
+        for _ in range(100):
+            if writer.pending() == 0:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    logs = await WebhookLogRepository(db_session).get_by_account_id("acct-writer")
+    assert {log.webhook_id for log in logs} == {"bg-0", "bg-1", "bg-2"}
+
+
+@pytest.mark.asyncio
+async def test_writer_runs_several_consumers_on_one_queue(db_session):
+    await db_session.execute(delete(WebhookLog))
+    await db_session.commit()
+
+    writer = WebhookLogWriter(db_helper.session_factory, batch_size=1, flush_interval=0.01)
+    tasks = [asyncio.create_task(writer.run()) for _ in range(2)]
+    try:
+        assert all(writer.submit(_row(f"multi-{index}")) for index in range(4))
+        for _ in range(100):
+            if writer.pending() == 0:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        for task in tasks:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        await writer.drain()
+
+    assert await WebhookLogRepository(db_session).count_by_account_id("acct-writer") == 4
+
+
+@pytest.mark.asyncio
+async def test_writer_takes_queued_rows_without_timed_waits(db_session, monkeypatch):
+    await db_session.execute(delete(WebhookLog))
+    await db_session.commit()
+
+    writer = WebhookLogWriter(db_helper.session_factory, batch_size=3, flush_interval=10)
+    assert all(writer.submit(_row(f"ready-{index}")) for index in range(3))
+
+    async def _no_timed_wait(*_args, **_kwargs):
+        raise AssertionError("Queued rows should not need a timed wait")
+
+    monkeypatch.setattr(asyncio, "wait_for", _no_timed_wait)
+    task = asyncio.create_task(writer.run())
+    try:
+        for _ in range(100):
+            if writer.pending() == 0:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    assert await WebhookLogRepository(db_session).count_by_account_id("acct-writer") == 3
+
+
+@pytest.mark.asyncio
+async def test_writer_rejects_when_full_and_drains_on_shutdown(db_session):
+    await db_session.execute(delete(WebhookLog))
+    await db_session.commit()
+
+    writer = WebhookLogWriter(db_helper.session_factory, max_queue_size=2)
+    assert writer.submit(_row("drain-0")) is True
+    assert writer.submit(_row("drain-1")) is True
+    assert writer.submit(_row("drain-2")) is False
+
+    await writer.drain()
+
+    assert writer.pending() == 0
+    assert await WebhookLogRepository(db_session).count_by_account_id("acct-writer") == 2
+
+
+@pytest.mark.asyncio
+async def test_writer_survives_connection_errors_outside_sqlalchemy():
+    def _refusing_factory():
+        raise ConnectionRefusedError("database unreachable")
+
+    writer = WebhookLogWriter(_refusing_factory, batch_size=1, flush_interval=0.01)
+    task = asyncio.create_task(writer.run())
+    try:
+        assert all(writer.submit(_row(f"refused-{index}")) for index in range(2))
+        for _ in range(100):
+            if writer.pending() == 0:
+                break
+            await asyncio.sleep(0.01)
+        # The consumer is still alive and has counted both rows as dropped
+        assert not task.done()
+        assert writer.dropped == 2
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task